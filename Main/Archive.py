@@ -0,0 +1,348 @@
+import io
+import json
+import lzma
+import zlib
+import struct
+import numpy as np
+
+MAGIC = b"SSA1"
+FOOTER_MAGIC = b"SSAI"
+# Magic, codec, chunk size, header length
+HEADER = struct.Struct("<4sBII")
+# Footer offset, chunk count, magic
+TRAILER = struct.Struct("<QI4s")
+
+CODECS = {"zlib": 1, "lzma": 2}
+
+COLUMN_DTYPES = (("time", np.float64), ("force", np.float64), ("displacement", np.float64),
+                 ("sample_index", np.int64))
+
+INDEX_DTYPE = np.dtype(
+    [("offset", "<u8"), ("length", "<u4"), ("first_row", "<u8"), ("count", "<u4")]
+    + [(f"{column}_{stat}", "<f8") for column, _ in COLUMN_DTYPES for stat in ("min", "max")]
+)
+
+def encode_column(values):
+    """
+    Losslessly transforms a column so it compresses well.
+
+    Consecutive samples share most of their bits, so each 64-bit value is XORed with the previous one, which
+    leaves mostly zero high bytes, and the bytes are then grouped by position so those zeros form long runs.
+
+    Args:
+        values (numpy.ndarray): Column values, 8 bytes each.
+
+    Returns:
+        bytes: Encoded column.
+    """
+    bits = np.ascontiguousarray(values).view(np.uint64)
+    xored = bits.copy()
+    xored[1:] ^= bits[:-1]
+    return xored.view(np.uint8).reshape(-1, 8).T.tobytes()
+
+
+def decode_column(data, count, dtype):
+    """
+    Reverses ``encode_column``.
+
+    Args:
+        data (bytes): Encoded column.
+        count (int): Number of values.
+        dtype (numpy.dtype): Column type.
+
+    Returns:
+        numpy.ndarray: Column values.
+    """
+    xored = np.frombuffer(data, dtype=np.uint8).reshape(8, count).T.copy().view(np.uint64).ravel()
+    return np.bitwise_xor.accumulate(xored).view(dtype)
+
+
+def write_archive(path, session, chunk_size=4096, codec="zlib", level=6):
+    """
+    Writes a test session to a chunked, compressed archive.
+
+    The samples are split into chunks of ``chunk_size`` rows, each compressed on its own with per-column
+    min/max statistics, followed by a footer index of every chunk. Readers can then locate and decompress
+    only the chunks covering a row, time or value range.
+
+    Args:
+        path (str): Destination file, conventionally with a ".ssa" extension.
+        session (TestSession): Test to archive.
+        chunk_size (int): Rows per chunk (default: 4096).
+        codec (str): "zlib" (fast) or "lzma" (smaller) (default: "zlib").
+        level (int): Compression level (default: 6).
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec {codec}, expected one of {tuple(CODECS)}")
+    compress = (lambda data: zlib.compress(data, level)) if codec == "zlib" else (lambda data: lzma.compress(data, preset=level))
+
+    columns = {name: getattr(session, name) for name, _ in COLUMN_DTYPES}
+    header = json.dumps({
+        "initial_data": session.initial_data,
+        "started_at": session.started_at,
+        "rows": len(session),
+        "reference_displacement": float(columns["displacement"][0]) if len(session) else 0.0,
+    }).encode("utf-8")
+
+    count = len(session)
+    chunks = max((count + chunk_size - 1) // chunk_size, 0)
+    index = np.zeros(chunks, dtype=INDEX_DTYPE)
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, CODECS[codec], chunk_size, len(header)))
+        file.write(header)
+        for chunk in range(chunks):
+            start = chunk * chunk_size
+            stop = min(start + chunk_size, count)
+            entry = index[chunk]
+            payload = io.BytesIO()
+            for name, dtype in COLUMN_DTYPES:
+                values = np.asarray(columns[name][start:stop], dtype=dtype)
+                payload.write(encode_column(values))
+                entry[f"{name}_min"] = values.min()
+                entry[f"{name}_max"] = values.max()
+            data = compress(payload.getvalue())
+            entry["offset"] = file.tell()
+            entry["length"] = len(data)
+            entry["first_row"] = start
+            entry["count"] = stop - start
+            file.write(data)
+
+        footer_offset = file.tell()
+        file.write(index.tobytes())
+        file.write(TRAILER.pack(footer_offset, chunks, FOOTER_MAGIC))
+
+
+def is_archive(path):
+    """
+    Checks whether a file is a chunked archive.
+
+    Args:
+        path (str): File to check.
+
+    Returns:
+        bool: True if the file starts with the archive magic.
+    """
+    with open(path, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+class ArchiveReader:
+    """
+    Random-access reader of chunked test archives.
+
+    Only the header and the footer index are read on opening. Row and time ranges are located with a binary
+    search over the index, and value ranges are answered by skipping every chunk whose min/max statistics
+    cannot match, so only the chunks actually needed are read and decompressed.
+
+    Attributes:
+        path (str): Archive file.
+        file (io.BufferedReader): Open archive file.
+        codec (str): Compression codec of the chunks.
+        chunk_size (int): Rows per chunk.
+        initial_data (dict): Specimen geometry.
+        started_at (float or None): Unix timestamp of the first sample.
+        rows (int): Number of samples in the archive.
+        reference_displacement (float): Displacement of the first sample, the zero of strain.
+        index (numpy.ndarray): Footer index, ``INDEX_DTYPE``.
+        cache (dict): Recently decompressed chunks keyed by chunk number.
+        cache_size (int): Maximum number of chunks kept in the cache.
+    """
+
+    def __init__(self, path, cache_size=16):
+        """
+        Opens an archive and reads its index.
+
+        Args:
+            path (str): Archive file.
+            cache_size (int): Maximum number of decompressed chunks kept in memory (default: 16).
+
+        Raises:
+            ValueError: If the file is not a valid archive.
+        """
+        self.path = path
+        self.cache = {}
+        self.cache_size = cache_size
+        self.file = open(path, "rb")
+        try:
+            magic, codec, self.chunk_size, header_length = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a test archive")
+            self.codec = {number: name for name, number in CODECS.items()}[codec]
+            header = json.loads(self.file.read(header_length).decode("utf-8"))
+
+            self.file.seek(-TRAILER.size, io.SEEK_END)
+            footer_offset, chunks, footer_magic = TRAILER.unpack(self.file.read(TRAILER.size))
+            if footer_magic != FOOTER_MAGIC:
+                raise ValueError(f"{path} has no chunk index, it may be truncated")
+            self.file.seek(footer_offset)
+            self.index = np.frombuffer(self.file.read(chunks * INDEX_DTYPE.itemsize), dtype=INDEX_DTYPE)
+        except (struct.error, KeyError) as error:
+            self.file.close()
+            raise ValueError(f"{path} is not a valid test archive: {error}") from error
+        except ValueError:
+            self.file.close()
+            raise
+
+        self.initial_data = header["initial_data"]
+        self.started_at = header["started_at"]
+        self.rows = header["rows"]
+        self.reference_displacement = header["reference_displacement"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Closes the archive file."""
+        self.file.close()
+
+    def __len__(self):
+        return self.rows
+
+    def read_chunk(self, chunk):
+        """
+        Reads and decompresses one chunk.
+
+        Args:
+            chunk (int): Chunk number.
+
+        Returns:
+            dict: Column name mapped to the chunk's values.
+        """
+        columns = self.cache.get(chunk)
+        if columns is not None:
+            return columns
+
+        entry = self.index[chunk]
+        self.file.seek(int(entry["offset"]))
+        data = self.file.read(int(entry["length"]))
+        data = zlib.decompress(data) if self.codec == "zlib" else lzma.decompress(data)
+
+        count = int(entry["count"])
+        columns = {}
+        for position, (name, dtype) in enumerate(COLUMN_DTYPES):
+            columns[name] = decode_column(data[position * count * 8:(position + 1) * count * 8], count, dtype)
+
+        if len(self.cache) >= self.cache_size:
+            self.cache.pop(next(iter(self.cache)))
+        self.cache[chunk] = columns
+        return columns
+
+    def read_chunks(self, chunks):
+        """
+        Reads several chunks and joins their columns.
+
+        Args:
+            chunks (iterable): Chunk numbers, in order.
+
+        Returns:
+            dict: Column name mapped to the joined values.
+        """
+        parts = [self.read_chunk(int(chunk)) for chunk in chunks]
+        if not parts:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMN_DTYPES}
+        return {name: np.concatenate([part[name] for part in parts]) for name, _ in COLUMN_DTYPES}
+
+    def read_rows(self, start=0, stop=None):
+        """
+        Reads a row range, decompressing only the chunks it spans.
+
+        Args:
+            start (int): First row (default: 0).
+            stop (int or None): Row after the last one (default: end of the archive).
+
+        Returns:
+            dict: Column name mapped to the values of the rows.
+        """
+        stop = self.rows if stop is None else min(stop, self.rows)
+        if start >= stop:
+            return self.read_chunks([])
+        first_rows = self.index["first_row"]
+        first = int(np.searchsorted(first_rows, start, side="right")) - 1
+        last = int(np.searchsorted(first_rows, stop, side="left"))
+        columns = self.read_chunks(range(first, last))
+        offset = start - int(first_rows[first])
+        return {name: values[offset:offset + stop - start] for name, values in columns.items()}
+
+    def read_time(self, start, stop):
+        """
+        Reads the samples recorded within a time window.
+
+        Args:
+            start (float): Window start in seconds since the first sample.
+            stop (float): Window end in seconds.
+
+        Returns:
+            dict: Column name mapped to the values of the samples in the window.
+        """
+        first = max(int(np.searchsorted(self.index["time_max"], start, side="left")), 0)
+        last = int(np.searchsorted(self.index["time_min"], stop, side="right"))
+        columns = self.read_chunks(range(first, last))
+        selection = (columns["time"] >= start) & (columns["time"] <= stop)
+        return {name: values[selection] for name, values in columns.items()}
+
+    def read_where(self, column, low, high):
+        """
+        Reads the samples whose value of one column lies within a range, skipping chunks by their statistics.
+
+        Args:
+            column (str): Column name ("time", "force", "displacement" or "sample_index").
+            low (float): Lowest value.
+            high (float): Highest value.
+
+        Returns:
+            dict: Column name mapped to the values of the matching samples, in row order.
+        """
+        chunks = np.nonzero((self.index[f"{column}_max"] >= low) & (self.index[f"{column}_min"] <= high))[0]
+        columns = self.read_chunks(chunks)
+        selection = (columns[column] >= low) & (columns[column] <= high)
+        return {name: values[selection] for name, values in columns.items()}
+
+    def read_strain_window(self, low, high):
+        """
+        Reads the stress-strain samples within a strain window.
+
+        Args:
+            low (float): Lowest strain.
+            high (float): Highest strain.
+
+        Returns:
+            tuple: Strain and stress arrays of the samples in the window.
+        """
+        length = self.initial_data["initial_length"]
+        reference = self.reference_displacement
+        columns = self.read_where("displacement", reference + low * length, reference + high * length)
+        strain = (columns["displacement"] - reference) / length
+        return strain, columns["force"] / self.initial_data["area"]
+
+    def column_range(self, column):
+        """
+        Returns the overall minimum and maximum of a column from the index, without decompressing anything.
+
+        Args:
+            column (str): Column name.
+
+        Returns:
+            tuple: Minimum and maximum value.
+        """
+        if not len(self.index):
+            return None, None
+        return float(self.index[f"{column}_min"].min()), float(self.index[f"{column}_max"].max())
+
+    def load_session(self):
+        """
+        Reads the whole archive into a test session.
+
+        Returns:
+            TestSession: The archived test.
+        """
+        from .TestSession import TestSession
+
+        columns = self.read_rows()
+        session = TestSession(self.initial_data, capacity=max(self.rows, 1))
+        session.extend(columns["force"], columns["displacement"], columns["time"], columns["sample_index"])
+        session.started_at = self.started_at
+        return session
@@ -0,0 +1,247 @@
+import json
+import numpy as np
+
+SUPPORTED_ADC_BITS = (10, 12, 16)
+
+# Legacy rig: 10 V pressure transducer over 250 bar on a 0.016 m^2 piston, 50 mm potentiometer, 10-bit ADC
+LEGACY_FORCE_FULL_SCALE = 250 * 1e5 * 0.016
+LEGACY_DISPLACEMENT_FULL_SCALE = 50.0
+
+
+class ChannelCalibration:
+    """
+    Calibration of one ADC channel, compiled into a lookup table over the whole count range.
+
+    The curve is given either as measured (count, value) points, interpolated piecewise-linearly or fitted with a
+    polynomial of the given degree, or directly as polynomial coefficients in counts. Compiling evaluates it once
+    for every possible count, so converting any number of samples is a single array gather.
+
+    Attributes:
+        unit (str): Engineering unit of the converted values.
+        points (numpy.ndarray or None): Calibration points, shape (points, 2), sorted by count.
+        degree (int or None): Degree of the polynomial fitted through the points, None for piecewise-linear.
+        polynomial (numpy.ndarray or None): Coefficients in counts, lowest order first.
+        table (numpy.ndarray): Value of every count, compiled by ``compile``.
+        max_count (int): Largest count of the ADC.
+    """
+
+    def __init__(self, unit="", points=None, degree=None, polynomial=None):
+        """
+        Initializes the channel calibration.
+
+        Args:
+            unit (str): Engineering unit of the converted values.
+            points (list or None): (count, value) calibration points.
+            degree (int or None): Degree of the polynomial fitted through the points, None to interpolate linearly.
+            polynomial (list or None): Coefficients in counts, lowest order first, used when no points are given.
+
+        Raises:
+            ValueError: If neither points nor a polynomial are given, or too few points for the degree.
+        """
+        self.unit = unit
+        self.degree = degree
+        self.points = None
+        self.polynomial = None
+        self.table = None
+        self.max_count = 0
+
+        if points is not None:
+            self.points = np.array(sorted(points), dtype=float).reshape(-1, 2)
+            if len(self.points) < max(2, (degree or 0) + 1):
+                raise ValueError(f"Calibration of {unit or 'channel'} needs more points")
+        elif polynomial is not None:
+            self.polynomial = np.array(polynomial, dtype=float)
+        else:
+            raise ValueError("Calibration needs points or a polynomial")
+
+    def compile(self, adc_bits):
+        """
+        Evaluates the calibration for every count of the ADC.
+
+        Args:
+            adc_bits (int): ADC resolution in bits.
+
+        Raises:
+            ValueError: If the compiled curve is not monotonic, since it then cannot be inverted.
+        """
+        self.max_count = (1 << adc_bits) - 1
+        counts = np.arange(self.max_count + 1, dtype=float)
+
+        if self.points is None:
+            table = np.polynomial.polynomial.polyval(counts, self.polynomial)
+        elif self.degree:
+            coefficients = np.polynomial.polynomial.polyfit(self.points[:, 0], self.points[:, 1], self.degree)
+            table = np.polynomial.polynomial.polyval(counts, coefficients)
+        else:
+            table = np.interp(counts, self.points[:, 0], self.points[:, 1])
+
+        steps = np.diff(table)
+        if not (np.all(steps >= 0) or np.all(steps <= 0)):
+            raise ValueError(f"Calibration of {self.unit or 'channel'} is not monotonic over the ADC range")
+        self.table = table
+
+    def convert(self, counts):
+        """
+        Converts raw counts to engineering units with a table gather.
+
+        Args:
+            counts (int or array-like): Raw ADC counts, clipped to the ADC range.
+
+        Returns:
+            float or numpy.ndarray: Converted values.
+        """
+        return self.table[np.clip(counts, 0, self.max_count)]
+
+    def counts(self, values):
+        """
+        Converts engineering units back to the raw counts an ADC would report.
+
+        Args:
+            values (array-like): Values in engineering units.
+
+        Returns:
+            numpy.ndarray: Raw counts, truncated like an ADC and clipped to its range.
+        """
+        table = self.table
+        index = np.arange(len(table), dtype=float)
+        if table[-1] < table[0]:
+            table, index = table[::-1], index[::-1]
+        # The small offset keeps exact table values from truncating to the count below
+        return np.clip(np.floor(np.interp(values, table, index) + 1e-9), 0, self.max_count).astype(int)
+
+    def as_dict(self):
+        """
+        Returns the calibration in the file format.
+
+        Returns:
+            dict: Unit and points (with degree) or polynomial.
+        """
+        data = {"unit": self.unit}
+        if self.points is not None:
+            data["points"] = self.points.tolist()
+            if self.degree:
+                data["degree"] = self.degree
+        else:
+            data["polynomial"] = self.polynomial.tolist()
+        return data
+
+
+class RigCalibration:
+    """
+    Force and displacement calibration of one testing rig.
+
+    Calibration files are JSON, for example::
+
+        {
+            "rig": "Press 2",
+            "adc_bits": 12,
+            "force": {"unit": "N", "points": [[0, 0], [2048, 198500], [4095, 401200]], "degree": 2},
+            "displacement": {"unit": "mm", "polynomial": [0.0, 0.01221]}
+        }
+
+    Attributes:
+        name (str): Name of the rig.
+        adc_bits (int): ADC resolution in bits.
+        force (ChannelCalibration): Force channel, in Newtons.
+        displacement (ChannelCalibration): Displacement channel, in millimeters.
+    """
+
+    def __init__(self, name, adc_bits, force, displacement):
+        """
+        Initializes the rig calibration and compiles both channel tables.
+
+        Args:
+            name (str): Name of the rig.
+            adc_bits (int): ADC resolution in bits, one of ``SUPPORTED_ADC_BITS``.
+            force (ChannelCalibration): Force channel calibration.
+            displacement (ChannelCalibration): Displacement channel calibration.
+
+        Raises:
+            ValueError: If the ADC resolution is not supported or a channel is not monotonic.
+        """
+        if adc_bits not in SUPPORTED_ADC_BITS:
+            raise ValueError(f"Unsupported ADC resolution {adc_bits} bits, expected one of {SUPPORTED_ADC_BITS}")
+        self.name = name
+        self.adc_bits = adc_bits
+        self.force = force
+        self.displacement = displacement
+        force.compile(adc_bits)
+        displacement.compile(adc_bits)
+
+    @classmethod
+    def legacy(cls):
+        """
+        Returns the linear 10-bit calibration previously hard-coded in the simulator.
+
+        Returns:
+            RigCalibration: The legacy rig calibration.
+        """
+        full_scale = (1 << 10) - 1
+        return cls("Legacy", 10,
+                   ChannelCalibration("N", points=[(0, 0.0), (full_scale, LEGACY_FORCE_FULL_SCALE)]),
+                   ChannelCalibration("mm", points=[(0, 0.0), (full_scale, LEGACY_DISPLACEMENT_FULL_SCALE)]))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads and compiles a calibration file.
+
+        Args:
+            path (str): JSON calibration file.
+
+        Returns:
+            RigCalibration: The compiled rig calibration.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a valid calibration.
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        try:
+            return cls(data.get("rig", path), int(data["adc_bits"]),
+                       ChannelCalibration(**data["force"]), ChannelCalibration(**data["displacement"]))
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"Invalid calibration file {path}: {error}") from error
+
+    def save(self, path):
+        """
+        Writes the calibration to a JSON file.
+
+        Args:
+            path (str): Destination file.
+        """
+        data = {
+            "rig": self.name,
+            "adc_bits": self.adc_bits,
+            "force": self.force.as_dict(),
+            "displacement": self.displacement.as_dict(),
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+
+    def to_units(self, force_counts, displacement_counts):
+        """
+        Converts raw counts of both channels to Newtons and millimeters.
+
+        Args:
+            force_counts (int or array-like): Raw force counts.
+            displacement_counts (int or array-like): Raw displacement counts.
+
+        Returns:
+            tuple: Force and displacement values.
+        """
+        return self.force.convert(force_counts), self.displacement.convert(displacement_counts)
+
+    def to_counts(self, force, displacement):
+        """
+        Converts Newtons and millimeters to the raw counts the rig would report.
+
+        Args:
+            force (array-like): Force values in Newtons.
+            displacement (array-like): Displacement values in millimeters.
+
+        Returns:
+            tuple: Raw force and displacement counts.
+        """
+        return self.force.counts(force), self.displacement.counts(displacement)
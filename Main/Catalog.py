@@ -0,0 +1,241 @@
+import os
+import time
+import uuid
+import queue
+import sqlite3
+import threading
+
+DEFAULT_CATALOG_PATH = "tests_catalog.sqlite3"
+DEFAULT_DATA_DIRECTORY = "test_data"
+
+# Catalog column for each key returned by GraphPlotter.calculate_properties
+PROPERTY_COLUMNS = {
+    "Yield Stress (MPa)": "yield_stress",
+    "Yield Strain": "yield_strain",
+    "Ultimate Tensile Strength (MPa)": "ultimate_stress",
+    "Strain at UTS": "strain_at_uts",
+    "Fracture Stress (MPa)": "fracture_stress",
+    "Fracture Strain": "fracture_strain",
+    "Young's Modulus (MPa)": "youngs_modulus",
+}
+
+GEOMETRY_COLUMNS = ("shape", "diameter", "width", "height", "area", "initial_length")
+
+COLUMNS = ("started_at", "finished_at") + GEOMETRY_COLUMNS + tuple(PROPERTY_COLUMNS.values()) + ("data_path",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tests (
+    id INTEGER PRIMARY KEY,
+    started_at REAL,
+    finished_at REAL,
+    shape TEXT,
+    diameter REAL,
+    width REAL,
+    height REAL,
+    area REAL,
+    initial_length REAL,
+    yield_stress REAL,
+    yield_strain REAL,
+    ultimate_stress REAL,
+    strain_at_uts REAL,
+    fracture_stress REAL,
+    fracture_strain REAL,
+    youngs_modulus REAL,
+    data_path TEXT
+);
+CREATE INDEX IF NOT EXISTS tests_shape_diameter ON tests (shape, diameter, finished_at);
+CREATE INDEX IF NOT EXISTS tests_shape_size ON tests (shape, width, height, finished_at);
+CREATE INDEX IF NOT EXISTS tests_finished_at ON tests (finished_at);
+CREATE INDEX IF NOT EXISTS tests_yield_stress ON tests (yield_stress);
+CREATE INDEX IF NOT EXISTS tests_ultimate_stress ON tests (ultimate_stress);
+"""
+
+class TestCatalog:
+    """
+    Indexed SQLite catalog of completed tests, their geometry and calculated properties.
+
+    Writes are queued and performed by a background thread, which saves the raw data file of each test and
+    inserts the catalogued rows in batches, one transaction per batch, so the UI never waits on the disk.
+    Queries use their own connection and are answered from the indexes on geometry, date and strength.
+
+    Attributes:
+        path (str): SQLite database file.
+        data_directory (str): Directory raw test data files are written to.
+        batch_size (int): Maximum number of tests inserted per transaction.
+        jobs (queue.Queue): Pending writes, or None to stop the writer.
+        writer (threading.Thread): Background writer thread.
+        reader (sqlite3.Connection): Connection used for queries.
+        reader_lock (threading.Lock): Lock serializing queries on the reader connection.
+    """
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH, data_directory=DEFAULT_DATA_DIRECTORY, batch_size=256):
+        """
+        Opens (and creates if needed) the catalog and starts the writer thread.
+
+        Args:
+            path (str): SQLite database file (default: "tests_catalog.sqlite3").
+            data_directory (str): Directory raw test data files are written to (default: "test_data").
+            batch_size (int): Maximum number of tests inserted per transaction (default: 256).
+        """
+        self.path = path
+        self.data_directory = data_directory
+        self.batch_size = batch_size
+
+        connection = sqlite3.connect(path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        connection.commit()
+        connection.close()
+
+        self.reader = sqlite3.connect(path, check_same_thread=False)
+        self.reader.row_factory = sqlite3.Row
+        self.reader_lock = threading.Lock()
+
+        self.jobs = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def submit(self, session, properties, finished_at=None):
+        """
+        Queues a completed test for saving and cataloguing. Returns immediately.
+
+        Args:
+            session (TestSession): Completed test. It must not be modified afterwards, pass a copy if the
+                live session is reused.
+            properties (dict or function): Properties returned by ``GraphPlotter.calculate_properties``, or a
+                function of the session calculating them on the writer thread.
+            finished_at (float or None): Completion time as a Unix timestamp (default: now).
+        """
+        self.jobs.put((session, properties, finished_at or time.time()))
+
+    def flush(self):
+        """Blocks until every queued test has been written."""
+        self.jobs.join()
+
+    def close(self):
+        """Writes the remaining queued tests, then stops the writer and closes the connections."""
+        self.jobs.put(None)
+        self.writer.join()
+        self.reader.close()
+
+    def make_row(self, session, properties, finished_at, data_path):
+        """
+        Builds the catalog row of a test.
+
+        Args:
+            session (TestSession): Completed test.
+            properties (dict): Calculated properties.
+            finished_at (float): Completion time as a Unix timestamp.
+            data_path (str): Raw data file of the test.
+
+        Returns:
+            tuple: Values in ``COLUMNS`` order.
+        """
+        geometry = session.initial_data
+        row = {
+            "started_at": session.started_at,
+            "finished_at": finished_at,
+            "data_path": data_path,
+        }
+        for column in GEOMETRY_COLUMNS:
+            row[column] = geometry.get(column)
+        for key, column in PROPERTY_COLUMNS.items():
+            value = properties.get(key)
+            row[column] = None if value is None else float(value)
+        return tuple(row[column] for column in COLUMNS)
+
+    def write_loop(self):
+        """Writer thread loop: saves raw data files and inserts queued tests in batches."""
+        os.makedirs(self.data_directory, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        insert = f"INSERT INTO tests ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+        running = True
+        while running:
+            jobs = [self.jobs.get()]
+            while len(jobs) < self.batch_size:
+                try:
+                    jobs.append(self.jobs.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = []
+            for job in jobs:
+                if job is None:
+                    running = False
+                    continue
+                session, properties, finished_at = job
+                if callable(properties):
+                    try:
+                        properties = properties(session)
+                    except Exception:
+                        # An analysis failure must not stop the writer, the test is still catalogued with its geometry
+                        properties = {}
+                # The random suffix keeps tests finishing in the same millisecond from sharing a data file
+                stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(finished_at))
+                data_path = os.path.join(self.data_directory, f"test-{stamp}-{uuid.uuid4().hex[:12]}.ssa")
+                try:
+                    session.save(data_path)
+                except OSError:
+                    data_path = None
+                rows.append(self.make_row(session, properties, finished_at, data_path))
+
+            if rows:
+                with connection:
+                    connection.executemany(insert, rows)
+            for _ in jobs:
+                self.jobs.task_done()
+
+        connection.close()
+
+    def query(self, shape=None, diameter=None, width=None, height=None, tolerance=0.05,
+              min_yield=None, max_yield=None, min_uts=None, max_uts=None, since=None, until=None, limit=1000):
+        """
+        Finds catalogued tests matching all given criteria, newest first.
+
+        Args:
+            shape (str or None): Specimen shape ("rounded" or "rectangular").
+            diameter, width, height (float or None): Specimen dimensions in mm, matched within ``tolerance``.
+            tolerance (float): Allowed absolute deviation of the dimensions in mm (default: 0.05).
+            min_yield, max_yield (float or None): Yield stress bounds in MPa.
+            min_uts, max_uts (float or None): Ultimate tensile strength bounds in MPa.
+            since, until (float or None): Completion time bounds as Unix timestamps.
+            limit (int): Maximum number of rows returned (default: 1000).
+
+        Returns:
+            list: Matching rows as dicts with the ``id`` and every catalog column.
+        """
+        conditions = []
+        parameters = []
+        if shape is not None:
+            conditions.append("shape = ?")
+            parameters.append(shape)
+        for column, value in (("diameter", diameter), ("width", width), ("height", height)):
+            if value is not None:
+                conditions.append(f"{column} BETWEEN ? AND ?")
+                parameters.extend((value - tolerance, value + tolerance))
+        for condition, value in (("yield_stress >= ?", min_yield), ("yield_stress <= ?", max_yield),
+                                 ("ultimate_stress >= ?", min_uts), ("ultimate_stress <= ?", max_uts),
+                                 ("finished_at >= ?", since), ("finished_at <= ?", until)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+
+        sql = "SELECT * FROM tests"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY finished_at DESC LIMIT ?"
+        parameters.append(limit)
+
+        with self.reader_lock:
+            return [dict(row) for row in self.reader.execute(sql, parameters)]
+
+    def count(self):
+        """
+        Counts the catalogued tests.
+
+        Returns:
+            int: Number of tests in the catalog.
+        """
+        with self.reader_lock:
+            return self.reader.execute("SELECT COUNT(*) FROM tests").fetchone()[0]
@@ -0,0 +1,178 @@
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+from .ComparisonView import ComparisonView
+from .GraphPlotter import GraphPlotter
+from .TestSession import ARCHIVE_EXTENSION
+
+RESULT_COLUMNS = (
+    ("finished_at", "Finished", 140),
+    ("shape", "Shape", 90),
+    ("diameter", "Diameter", 70),
+    ("width", "Width", 70),
+    ("height", "Height", 70),
+    ("yield_stress", "Yield (MPa)", 90),
+    ("ultimate_stress", "UTS (MPa)", 90),
+    ("youngs_modulus", "E (MPa)", 90),
+)
+
+class CatalogSearch(tk.Toplevel):
+    """
+    Window searching the test catalog by geometry, strength and date.
+
+    Attributes:
+        catalog (TestCatalog): Catalog queried.
+        analysis_filter (FilterStage or None): Noise filter passed on to the comparison view.
+        entries (dict): Entry widget of every search field.
+        shape_var (tk.StringVar): Selected shape, empty for any shape.
+        results (ttk.Treeview): Table of matching tests.
+        rows (dict): Catalog row of every result table item.
+        status (tk.StringVar): Status line text.
+        strain_low_entry, strain_high_entry (tk.Entry): Strain window shown when zooming into a test.
+    """
+
+    def __init__(self, parent, catalog, analysis_filter=None):
+        """
+        Initializes the search window.
+
+        Args:
+            parent (tk.Tk or tk.Frame): Parent tkinter widget.
+            catalog (TestCatalog): Catalog queried.
+            analysis_filter (FilterStage or None): Noise filter passed on to the comparison view.
+        """
+        super().__init__(parent)
+        self.title("Test Catalog")
+        self.catalog = catalog
+        self.analysis_filter = analysis_filter
+        self.entries = {}
+        self.rows = {}
+        self.shape_var = tk.StringVar(value="")
+        self.status = tk.StringVar(value="")
+        self.create_widgets()
+
+    def create_widgets(self):
+        """
+        Create the search fields, result table and buttons.
+        """
+        search_area = tk.Frame(self)
+        search_area.grid(row=0, column=0, padx=10, pady=10, sticky='w')
+
+        tk.Label(search_area, text="Shape:").grid(row=0, column=0, sticky='w')
+        tk.OptionMenu(search_area, self.shape_var, "", "rounded", "rectangular").grid(row=0, column=1, sticky='w')
+
+        fields = [
+            ("diameter", "Diameter (mm):"), ("width", "Width (mm):"), ("height", "Height (mm):"),
+            ("min_yield", "Min yield (MPa):"), ("max_yield", "Max yield (MPa):"),
+            ("min_uts", "Min UTS (MPa):"), ("max_uts", "Max UTS (MPa):"), ("days", "Last days:"),
+        ]
+        for i, (name, label) in enumerate(fields):
+            row, column = 1 + i // 2, (i % 2) * 2
+            tk.Label(search_area, text=label).grid(row=row, column=column, padx=5, pady=2, sticky='w')
+            self.entries[name] = tk.Entry(search_area, width=12)
+            self.entries[name].grid(row=row, column=column + 1, padx=5, pady=2)
+
+        self.results = ttk.Treeview(self, columns=[name for name, _, _ in RESULT_COLUMNS], show="headings", height=15)
+        for name, heading, width in RESULT_COLUMNS:
+            self.results.heading(name, text=heading)
+            self.results.column(name, width=width)
+        self.results.grid(row=1, column=0, padx=10, pady=5, sticky='nsew')
+
+        button_area = tk.Frame(self)
+        button_area.grid(row=2, column=0, padx=10, pady=5, sticky='ew')
+        tk.Button(button_area, text="Search", command=self.search, width=15).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_area, text="Compare", command=self.compare_selected, width=15).pack(side=tk.LEFT, padx=5)
+        tk.Label(button_area, text="Strain from:").pack(side=tk.LEFT, padx=(10, 2))
+        self.strain_low_entry = tk.Entry(button_area, width=8)
+        self.strain_low_entry.pack(side=tk.LEFT)
+        tk.Label(button_area, text="to:").pack(side=tk.LEFT, padx=2)
+        self.strain_high_entry = tk.Entry(button_area, width=8)
+        self.strain_high_entry.pack(side=tk.LEFT)
+        tk.Button(button_area, text="Zoom", command=self.zoom_selected, width=10).pack(side=tk.LEFT, padx=5)
+        tk.Label(button_area, textvariable=self.status).pack(side=tk.LEFT, padx=10)
+
+    def read_float(self, name):
+        """
+        Reads a numeric search field.
+
+        Args:
+            name (str): Field name.
+
+        Returns:
+            float or None: Field value, or None if the field is empty.
+        """
+        text = self.entries[name].get().strip()
+        return float(text) if text else None
+
+    def search(self):
+        """
+        Query the catalog with the current search fields and show the matching tests.
+        """
+        try:
+            criteria = {name: self.read_float(name) for name in self.entries if name != "days"}
+            days = self.read_float("days")
+        except ValueError:
+            messagebox.showerror("Input error", "Please enter valid numbers", parent=self)
+            return
+
+        criteria["shape"] = self.shape_var.get() or None
+        if days is not None:
+            criteria["since"] = time.time() - days * 86400
+
+        started = time.perf_counter()
+        rows = self.catalog.query(**criteria)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        self.results.delete(*self.results.get_children())
+        self.rows = {}
+        for row in rows:
+            values = []
+            for name, _, _ in RESULT_COLUMNS:
+                value = row[name]
+                if name == "finished_at" and value is not None:
+                    value = time.strftime("%Y-%m-%d %H:%M", time.localtime(value))
+                elif isinstance(value, float):
+                    value = f"{value:.2f}"
+                values.append("" if value is None else value)
+            item = self.results.insert("", tk.END, values=values)
+            self.rows[item] = row
+        self.status.set(f"{len(rows)} tests found in {elapsed:.1f} ms")
+
+    def zoom_selected(self):
+        """
+        Plot the selected archived test within the entered strain window, reading only the chunks it covers.
+        """
+        selection = self.results.selection()
+        if not selection:
+            return
+        path = self.rows[selection[0]]["data_path"]
+        if not path or not path.endswith(ARCHIVE_EXTENSION):
+            messagebox.showerror("Zoom error", "The selected test is not stored as a chunked archive", parent=self)
+            return
+        try:
+            low = float(self.strain_low_entry.get())
+            high = float(self.strain_high_entry.get())
+        except ValueError:
+            messagebox.showerror("Input error", "Please enter valid numbers", parent=self)
+            return
+
+        window = tk.Toplevel(self)
+        window.title("Strain Window")
+        graph_area = tk.Frame(window, bg="white", width=700, height=400)
+        graph_area.pack(fill=tk.BOTH, expand=1)
+        started = time.perf_counter()
+        try:
+            count = GraphPlotter(window).plot_archive_window(graph_area, path, low, high)
+        except (OSError, ValueError) as error:
+            window.destroy()
+            messagebox.showerror("Zoom error", f"Could not read {path}: {error}", parent=self)
+            return
+        self.status.set(f"{count} samples read in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def compare_selected(self):
+        """
+        Open the selected tests (or all results if none are selected) in the comparison view.
+        """
+        items = self.results.selection() or self.results.get_children()
+        paths = [self.rows[item]["data_path"] for item in items if self.rows[item]["data_path"]]
+        if paths:
+            ComparisonView(self, self.analysis_filter).add_paths(paths)
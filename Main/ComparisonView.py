@@ -0,0 +1,344 @@
+import os
+import json
+from collections import OrderedDict
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
+from .GraphPlotter import GraphPlotter
+from .TestSession import TestSession
+from .ModelFitting import fit_models_batch
+
+COMPARED_PROPERTIES = ("Yield Stress (MPa)", "Ultimate Tensile Strength (MPa)", "Young's Modulus (MPa)")
+
+# Fraction of the yield stress bounding the part of the elastic line used to locate the toe region
+TOE_FIT_RANGE = (0.1, 0.5)
+
+def decimate_min_max(x, y, max_points=1000):
+    """
+    Reduces a curve to at most ``max_points`` points, keeping the minimum and maximum of every bucket.
+
+    Keeping both extremes of each bucket preserves peaks such as the UTS, unlike plain striding.
+
+    Args:
+        x (numpy.ndarray): X values of the curve.
+        y (numpy.ndarray): Y values of the curve.
+        max_points (int): Maximum number of points kept (default: 1000).
+
+    Returns:
+        tuple: Decimated x and y arrays, in the original sample order.
+    """
+    count = len(y)
+    buckets = max_points // 2
+    if count <= max_points or buckets == 0:
+        return np.array(x, dtype=float), np.array(y, dtype=float)
+
+    # Bucket edges spread the remainder over the buckets, so every sample up to the fracture end is covered
+    y = np.asarray(y)
+    starts = np.linspace(0, count, buckets + 1).astype(int)[:-1]
+    bucket = np.repeat(np.arange(buckets), np.diff(np.append(starts, count)))
+    keep = [[count - 1]]
+    for extreme in (np.minimum, np.maximum):
+        hits = np.flatnonzero(y == extreme.reduceat(y, starts)[bucket])
+        _, first = np.unique(bucket[hits], return_index=True)
+        keep.append(hits[first])
+    keep = np.unique(np.concatenate(keep))
+    return x[keep].astype(float), y[keep].astype(float)
+
+
+def toe_offset(strain, stress, yield_stress):
+    """
+    Locates the end of the toe region, where slack take-up and seating make the start of a curve non-linear.
+
+    A line is fitted to the elastic loading between 10% and 50% of the yield stress and extended down to zero
+    stress; its strain there is the offset that aligns the curve on a common elastic origin.
+
+    Args:
+        strain (numpy.ndarray): Strain values.
+        stress (numpy.ndarray): Stress values in MPa.
+        yield_stress (float): Yield stress of the curve in MPa.
+
+    Returns:
+        float: Strain offset to subtract from the curve, 0 if the elastic region has too few points.
+    """
+    strain = np.asarray(strain, dtype=float)
+    stress = np.asarray(stress, dtype=float)
+    if len(stress) < 2 or not yield_stress > 0:
+        return 0.0
+    # Only the loading branch up to the first yield, not the unloading after the UTS
+    end = int(np.argmax(stress >= yield_stress)) or len(stress)
+    low, high = TOE_FIT_RANGE
+    selection = (stress[:end] >= low * yield_stress) & (stress[:end] <= high * yield_stress)
+    if np.count_nonzero(selection) < 2 or np.ptp(strain[:end][selection]) == 0:
+        return 0.0
+    slope, intercept = np.polyfit(strain[:end][selection], stress[:end][selection], 1)
+    if slope <= 0:
+        return 0.0
+    return float(-intercept / slope)
+
+
+class CachedTest:
+    """
+    Pre-decimated curve and computed properties of one stored test.
+
+    Attributes:
+        path (str): File the test was loaded from.
+        mtime (float): Modification time of the file when it was loaded.
+        name (str): Label used in the legend and the statistics table.
+        strain (numpy.ndarray): Decimated strain values.
+        stress (numpy.ndarray): Decimated stress values.
+        properties (dict): Material properties calculated from the full-resolution curve.
+        strain_offset (float): Toe-region strain offset of the curve, subtracted when curves are aligned.
+    """
+
+    __slots__ = ("path", "mtime", "name", "strain", "stress", "properties", "strain_offset")
+
+    def __init__(self, path, mtime, strain, stress, properties, strain_offset=0.0):
+        self.path = path
+        self.mtime = mtime
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self.strain = strain
+        self.stress = stress
+        self.properties = properties
+        self.strain_offset = strain_offset
+
+
+class ComparisonView(tk.Toplevel):
+    """
+    Window overlaying the stress-strain curves of many stored tests, with batch property statistics.
+
+    Each test is loaded once, analysed at full resolution and reduced to a decimated curve that is kept in
+    a cache keyed by path and modification time, so redraws never touch the raw data again. Curves are
+    aligned on a common elastic origin by removing their toe region, unless alignment is switched off.
+
+    Attributes:
+        analyser (GraphPlotter): Plotter instance used for its property calculation.
+        max_points (int): Maximum number of points kept per cached curve.
+        cache (collections.OrderedDict): Cached tests keyed by file path, least recently used first.
+        cache_size (int): Maximum number of cached tests, shown ones included.
+        tests (list): Cached tests currently shown, in load order.
+        align (tk.BooleanVar): Whether the curves are shifted to remove their toe region.
+        graph_area (tk.Frame): Frame holding the overlay canvas.
+        canvas (FigureCanvasTkAgg or None): Canvas displaying the overlay.
+        stats_table (ttk.Treeview): Table of property statistics across the batch.
+        status (tk.StringVar): Status line text.
+    """
+
+    def __init__(self, parent, analysis_filter=None, max_points=1000, cache_size=256):
+        """
+        Initializes the comparison window.
+
+        Args:
+            parent (tk.Tk or tk.Frame): Parent tkinter widget.
+            analysis_filter (FilterStage or None): Noise filter applied before property calculation.
+            max_points (int): Maximum number of points kept per cached curve (default: 1000).
+            cache_size (int): Maximum number of cached tests (default: 256).
+        """
+        super().__init__(parent)
+        self.title("Test Comparison")
+        self.analyser = GraphPlotter(self, analysis_filter)
+        self.max_points = max_points
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.align = tk.BooleanVar(value=True)
+        self.tests = []
+        self.canvas = None
+        self.status = tk.StringVar(value="Load stored tests to compare them")
+        self.create_widgets()
+
+    def create_widgets(self):
+        """
+        Create the overlay area, statistics table and control buttons.
+        """
+        self.graph_area = tk.Frame(self, bg="white", width=700, height=400)
+        self.graph_area.grid(row=0, column=0, padx=10, pady=10, sticky='nsew')
+
+        columns = ("property", "mean", "std", "min", "max", "outliers")
+        self.stats_table = ttk.Treeview(self, columns=columns, show="headings", height=4)
+        for column in columns:
+            self.stats_table.heading(column, text=column.capitalize())
+            self.stats_table.column(column, width=220 if column in ("property", "outliers") else 90)
+        self.stats_table.grid(row=1, column=0, padx=10, pady=5, sticky='ew')
+
+        button_area = tk.Frame(self)
+        button_area.grid(row=2, column=0, padx=10, pady=5, sticky='ew')
+        tk.Button(button_area, text="Load", command=self.load_tests, width=15).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_area, text="Clear", command=self.clear_tests, width=15).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_area, text="Fit", command=self.fit_tests, width=15).pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(button_area, text="Align toe region", variable=self.align,
+                       command=self.redraw).pack(side=tk.LEFT, padx=5)
+        tk.Label(button_area, textvariable=self.status).pack(side=tk.LEFT, padx=10)
+
+    def load_tests(self):
+        """
+        Ask for stored test files, add them to the comparison and redraw.
+        """
+        paths = filedialog.askopenfilenames(parent=self, title="Load tests",
+                                            filetypes=[("Test data", "*.ssa *.npz"), ("All files", "*.*")])
+        self.add_paths(paths)
+
+    def add_paths(self, paths):
+        """
+        Add stored tests to the comparison and redraw.
+
+        Args:
+            paths (list): Files written by ``TestSession.save``.
+        """
+        for path in paths:
+            test = self.get_cached(path)
+            if test is not None and test not in self.tests:
+                self.tests.append(test)
+        self.redraw()
+
+    def clear_tests(self):
+        """
+        Remove all tests from the comparison. Cached curves are kept for later loads of this window.
+        """
+        self.tests = []
+        self.redraw()
+
+    def fit_tests(self):
+        """
+        Fit the constitutive models to every shown test in one batch and offer to save them as material cards.
+
+        The cached decimated curves are fitted, which keep the shape of the full curves at a fraction of the points.
+        """
+        if not self.tests:
+            self.status.set("Load stored tests to fit them")
+            return
+        try:
+            ranked, elapsed = fit_models_batch([(test.strain, test.stress, test.properties) for test in self.tests])
+        except (ValueError, IndexError, ZeroDivisionError) as error:
+            messagebox.showerror("Fit error", f"Could not fit the tests: {error}", parent=self)
+            return
+
+        self.status.set(f"{len(self.tests)} tests fitted in {elapsed * 1000:.1f} ms")
+        lines = [f"{test.name}: {models[0].describe() if models else 'no hardening region to fit'}"
+                 for test, models in zip(self.tests, ranked)]
+        if len(lines) > 20:
+            lines = lines[:20] + [f"... and {len(lines) - 20} more"]
+        if not messagebox.askyesno("Fitted models", "\n".join(lines) + "\n\nSave the material cards?", parent=self):
+            return
+
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".json",
+                                            filetypes=[("Material cards", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        cards = {
+            test.name: {
+                model.name: {"parameters": model.as_dict(), "youngs_modulus": model.youngs_modulus,
+                             "uniform_strain": model.uniform_strain, "rms": model.rms}
+                for model in models
+            }
+            for test, models in zip(self.tests, ranked)
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(cards, file, indent=4)
+
+    def get_cached(self, path):
+        """
+        Returns the cached curve of a stored test, loading and analysing it if needed.
+
+        Args:
+            path (str): File written by ``TestSession.save``.
+
+        Returns:
+            CachedTest or None: The cached test, or None if the file could not be read.
+        """
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError as error:
+            self.status.set(f"Could not load {os.path.basename(path)}: {error}")
+            return None
+        test = self.cache.get(path)
+        if test is not None and test.mtime == mtime:
+            self.cache.move_to_end(path)
+            return test
+
+        try:
+            session = TestSession.load(path)
+        except (OSError, ValueError, KeyError) as error:
+            self.status.set(f"Could not load {os.path.basename(path)}: {error}")
+            return None
+
+        self.analyser.session = session
+        try:
+            analysis_strain, analysis_stress = self.analyser.get_analysis_series()
+            properties = self.analyser.calculate_properties(analysis_strain, analysis_stress)
+        except (ValueError, IndexError, ZeroDivisionError, FloatingPointError) as error:
+            self.status.set(f"Could not analyse {os.path.basename(path)}: {error}")
+            return None
+        offset = toe_offset(analysis_strain, analysis_stress, properties["Yield Stress (MPa)"])
+        strain, stress = decimate_min_max(session.strain, session.stress, self.max_points)
+        test = CachedTest(path, mtime, strain, stress, properties, offset)
+        self.cache[path] = test
+        self.cache.move_to_end(path)
+        # Evict the least recently used tests, never one currently shown
+        for stale in list(self.cache):
+            if len(self.cache) <= self.cache_size:
+                break
+            if self.cache[stale] not in self.tests:
+                del self.cache[stale]
+        return test
+
+    def batch_statistics(self):
+        """
+        Computes property statistics across the shown tests in one vectorized pass.
+
+        Returns:
+            dict: Property name mapped to its mean, std, min, max and the names of outlier tests (|z| > 2).
+        """
+        if not self.tests:
+            return {}
+        values = np.array([[test.properties[name] for name in COMPARED_PROPERTIES] for test in self.tests], dtype=float)
+        mean = values.mean(axis=0)
+        std = values.std(axis=0, ddof=1) if len(values) > 1 else np.zeros(len(COMPARED_PROPERTIES))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = np.where(std > 0, (values - mean) / std, 0.0)
+        minimum = values.min(axis=0)
+        maximum = values.max(axis=0)
+
+        return {
+            name: {
+                "mean": mean[i],
+                "std": std[i],
+                "min": minimum[i],
+                "max": maximum[i],
+                "outliers": [self.tests[j].name for j in np.nonzero(np.abs(z_scores[:, i]) > 2)[0]],
+            }
+            for i, name in enumerate(COMPARED_PROPERTIES)
+        }
+
+    def redraw(self):
+        """
+        Redraw the overlay from the cached curves and refresh the statistics table.
+        """
+        if self.canvas:
+            self.canvas.get_tk_widget().destroy()
+            self.canvas = None
+
+        fig, ax = plt.subplots(figsize=(10, 6))
+        align = self.align.get()
+        for test in self.tests:
+            strain = test.strain - test.strain_offset if align else test.strain
+            ax.plot(strain, test.stress, linewidth=0.8, label=test.name)
+        ax.set_xlabel('Strain (toe region removed)' if align else 'Strain')
+        ax.set_ylabel('Stress (MPa)')
+        ax.set_title(f'Stress vs Strain ({len(self.tests)} tests)')
+        if 0 < len(self.tests) <= 20:
+            ax.legend(fontsize=8)
+
+        self.canvas = FigureCanvasTkAgg(fig, master=self.graph_area)
+        self.canvas.get_tk_widget().configure(width=600, height=400)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        plt.close(fig)
+
+        self.stats_table.delete(*self.stats_table.get_children())
+        for name, stats in self.batch_statistics().items():
+            self.stats_table.insert("", tk.END, values=(
+                name, f"{stats['mean']:.2f}", f"{stats['std']:.2f}", f"{stats['min']:.2f}", f"{stats['max']:.2f}",
+                ", ".join(stats["outliers"]) or "-"))
+        if self.tests:
+            self.status.set(f"{len(self.tests)} tests shown")
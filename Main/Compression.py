@@ -0,0 +1,173 @@
+import numpy as np
+
+class SwingingDoorCompressor:
+    """
+    Streaming swinging-door (deadband) compressor for the (force, displacement) sample stream.
+
+    Samples are indexed by their position in the stream. A sample is only archived when a straight line from
+    the last archived sample can no longer pass within the tolerance of every sample seen since, on either
+    channel. Linear interpolation between archived samples therefore reconstructs every dropped sample to
+    within the configured tolerance.
+
+    Attributes:
+        force_tolerance (float): Maximum reconstruction error allowed on the force channel (N).
+        displacement_tolerance (float): Maximum reconstruction error allowed on the displacement channel (mm).
+        index (int): Index that will be assigned to the next sample.
+        anchor (tuple or None): Last archived sample as (index, (force, displacement)).
+        previous (tuple or None): Last received sample that has not been archived yet.
+        upper_slopes (list): Current upper door slope for each channel.
+        lower_slopes (list): Current lower door slope for each channel.
+    """
+
+    def __init__(self, force_tolerance, displacement_tolerance):
+        """
+        Initializes the compressor with per-channel tolerances.
+
+        Args:
+            force_tolerance (float): Maximum reconstruction error allowed on the force channel (N).
+            displacement_tolerance (float): Maximum reconstruction error allowed on the displacement channel (mm).
+        """
+        if force_tolerance < 0 or displacement_tolerance < 0:
+            raise ValueError("Compression tolerances must not be negative")
+        self.force_tolerance = force_tolerance
+        self.displacement_tolerance = displacement_tolerance
+        self.reset()
+
+    def reset(self):
+        """Clears the compressor state so a new stream can be compressed."""
+        self.index = 0
+        self.anchor = None
+        self.previous = None
+        self.upper_slopes = [-np.inf, -np.inf]
+        self.lower_slopes = [np.inf, np.inf]
+
+    def open_doors(self, index, values):
+        """
+        Widens the doors to include a new sample.
+
+        Args:
+            index (int): Index of the sample.
+            values (tuple): Force and displacement of the sample.
+
+        Returns:
+            bool: False if the line from the anchor to the sample no longer covers every pending sample.
+        """
+        anchor_index, anchor_values = self.anchor
+        dt = index - anchor_index
+        tolerances = (self.force_tolerance, self.displacement_tolerance)
+
+        upper_slopes = []
+        lower_slopes = []
+        for channel in range(2):
+            delta = values[channel] - anchor_values[channel]
+            upper = max(self.upper_slopes[channel], (delta - tolerances[channel]) / dt)
+            lower = min(self.lower_slopes[channel], (delta + tolerances[channel]) / dt)
+            # The line to the new sample must stay between the doors so it can be archived later
+            if not upper <= delta / dt <= lower:
+                return False
+            upper_slopes.append(upper)
+            lower_slopes.append(lower)
+
+        self.upper_slopes = upper_slopes
+        self.lower_slopes = lower_slopes
+        return True
+
+    def add(self, force, displacement):
+        """
+        Feeds one sample to the compressor.
+
+        Args:
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+
+        Returns:
+            list: Archived samples as (index, force, displacement) tuples, usually empty or a single sample.
+        """
+        index = self.index
+        self.index += 1
+        values = (force, displacement)
+
+        if self.anchor is None:
+            self.anchor = (index, values)
+            return [(index, force, displacement)]
+
+        if self.open_doors(index, values):
+            self.previous = (index, values)
+            return []
+
+        # The doors closed: archive the last sample that was still covered and restart from it
+        archived_index, archived_values = self.previous
+        self.anchor = self.previous
+        self.upper_slopes = [-np.inf, -np.inf]
+        self.lower_slopes = [np.inf, np.inf]
+        self.open_doors(index, values)
+        self.previous = (index, values)
+        return [(archived_index, archived_values[0], archived_values[1])]
+
+    def flush(self):
+        """
+        Archives the last pending sample, closing the stream.
+
+        Returns:
+            list: The pending sample as an (index, force, displacement) tuple, or an empty list.
+        """
+        if self.previous is None:
+            return []
+        archived_index, archived_values = self.previous
+        self.anchor = self.previous
+        self.previous = None
+        self.upper_slopes = [-np.inf, -np.inf]
+        self.lower_slopes = [np.inf, np.inf]
+        return [(archived_index, archived_values[0], archived_values[1])]
+
+
+def compress_series(force, displacement, force_tolerance, displacement_tolerance):
+    """
+    Compresses a complete (force, displacement) series offline.
+
+    Args:
+        force (array-like): Force values in Newtons.
+        displacement (array-like): Displacement values in millimeters.
+        force_tolerance (float): Maximum reconstruction error allowed on the force channel (N).
+        displacement_tolerance (float): Maximum reconstruction error allowed on the displacement channel (mm).
+
+    Returns:
+        numpy.ndarray: Indices of the samples that must be kept.
+    """
+    compressor = SwingingDoorCompressor(force_tolerance, displacement_tolerance)
+    kept = []
+    for f, d in zip(force, displacement):
+        kept.extend(index for index, _, _ in compressor.add(f, d))
+    kept.extend(index for index, _, _ in compressor.flush())
+    return np.array(kept, dtype=int)
+
+
+def reconstruct(indices, values, length=None):
+    """
+    Rebuilds a densely sampled series from archived samples by linear interpolation.
+
+    Args:
+        indices (array-like): Stream indices of the archived samples, in increasing order.
+        values (array-like): Archived values matching ``indices``.
+        length (int or None): Number of samples to rebuild (default: up to the last archived index).
+
+    Returns:
+        numpy.ndarray: Reconstructed values for every stream index.
+    """
+    indices = np.asarray(indices, dtype=float)
+    if length is None:
+        length = int(indices[-1]) + 1 if len(indices) else 0
+    return np.interp(np.arange(length), indices, np.asarray(values, dtype=float))
+
+
+def is_compressed(indices):
+    """
+    Checks whether a series of stream indices has gaps left by compression.
+
+    Args:
+        indices (array-like): Stream indices of the stored samples.
+
+    Returns:
+        bool: True if samples were dropped between the first and the last stored index.
+    """
+    return len(indices) > 0 and indices[-1] - indices[0] + 1 != len(indices)
@@ -0,0 +1,466 @@
+import numpy as np
+
+CYCLE_DTYPE = np.dtype([
+    ("cycle", np.int64),
+    ("peak_stress", np.float64),
+    ("valley_stress", np.float64),
+    ("peak_strain", np.float64),
+    ("valley_strain", np.float64),
+    ("energy", np.float64),
+])
+
+
+class TurningPointDetector:
+    """
+    Streaming detection of the peaks and valleys of a signal.
+
+    A candidate extreme is confirmed as a turning point once the signal has moved back from it by more than
+    the hysteresis, which rejects noise reversals without buffering the signal.
+
+    Attributes:
+        hysteresis (float): Reversal size needed to confirm a turning point.
+        direction (int): 1 while rising, -1 while falling, 0 before the first reversal.
+        extreme (float or None): Current candidate extreme value.
+        extreme_position (int): Sample position of the candidate extreme.
+        position (int): Number of samples pushed.
+    """
+
+    def __init__(self, hysteresis):
+        """
+        Initializes the detector.
+
+        Args:
+            hysteresis (float): Reversal size needed to confirm a turning point, in signal units.
+        """
+        self.hysteresis = hysteresis
+        self.reset()
+
+    def reset(self):
+        """Forgets the signal history."""
+        self.direction = 0
+        self.extreme = None
+        self.extreme_position = 0
+        self.position = 0
+
+    def push(self, value):
+        """
+        Adds one sample.
+
+        Args:
+            value (float): Signal value.
+
+        Returns:
+            tuple or None: (value, position, is_peak) of the turning point confirmed by this sample, if any.
+        """
+        position = self.position
+        self.position += 1
+        if self.extreme is None:
+            self.extreme = value
+            self.extreme_position = position
+            return None
+
+        if self.direction >= 0 and value > self.extreme or self.direction <= 0 and value < self.extreme:
+            if self.direction == 0:
+                self.direction = 1 if value > self.extreme else -1
+            self.extreme = value
+            self.extreme_position = position
+            return None
+
+        if abs(value - self.extreme) <= self.hysteresis:
+            return None
+
+        turning_point = (self.extreme, self.extreme_position, self.direction > 0)
+        self.direction = 1 if value > self.extreme else -1
+        self.extreme = value
+        self.extreme_position = position
+        return turning_point
+
+
+class RainflowCounter:
+    """
+    Streaming rainflow counting (ASTM E1049 three-point method) into a fixed-size range/mean histogram.
+
+    Turning points are pushed one by one; closed cycles are counted as soon as they are found and only the
+    unclosed residue is kept. The histogram bins double in width whenever a range or mean falls outside them,
+    so memory stays constant no matter how many cycles are counted or how large they are.
+
+    Attributes:
+        counts (numpy.ndarray): Cycle counts, shape (range bins, mean bins); half cycles count 0.5.
+        range_width (float): Width of a range bin.
+        mean_width (float): Width of a mean bin; mean bins are centred on zero.
+        residue (list): Turning points not yet closed into a cycle.
+        cycles (float): Total number of counted cycles.
+        largest_range (float): Largest counted range.
+    """
+
+    def __init__(self, range_bins=64, mean_bins=64, initial_width=1.0):
+        """
+        Initializes an empty counter.
+
+        Args:
+            range_bins (int): Number of range bins (default: 64).
+            mean_bins (int): Number of mean bins, even (default: 64).
+            initial_width (float): Initial bin width in signal units (default: 1).
+        """
+        self.counts = np.zeros((range_bins, mean_bins))
+        self.initial_width = initial_width
+        self.reset()
+
+    def reset(self):
+        """Clears the histogram and the residue."""
+        self.counts[:] = 0
+        self.range_width = self.initial_width
+        self.mean_width = self.initial_width
+        self.residue = []
+        self.cycles = 0.0
+        self.largest_range = 0.0
+
+    def push(self, value):
+        """
+        Adds one turning point and counts the cycles it closes.
+
+        Args:
+            value (float): Turning point value.
+        """
+        residue = self.residue
+        residue.append(value)
+        while len(residue) >= 3:
+            latest = abs(residue[-1] - residue[-2])
+            previous = abs(residue[-2] - residue[-3])
+            if latest < previous:
+                break
+            if len(residue) == 3:
+                # The range contains the starting point: count it as a half cycle and drop the start
+                self.count(residue[0], residue[1], 0.5)
+                del residue[0]
+            else:
+                self.count(residue[-3], residue[-2], 1.0)
+                del residue[-3:-1]
+
+    def finish(self):
+        """Counts the remaining residue as half cycles."""
+        for first, second in zip(self.residue, self.residue[1:]):
+            self.count(first, second, 0.5)
+        self.residue = self.residue[-1:]
+
+    def count(self, first, second, weight):
+        """
+        Adds a cycle to the histogram, widening the bins if it falls outside them.
+
+        Args:
+            first, second (float): Turning points delimiting the cycle.
+            weight (float): 1 for a full cycle, 0.5 for a half cycle.
+        """
+        value_range = abs(second - first)
+        mean = (first + second) / 2
+        range_bins, mean_bins = self.counts.shape
+        while value_range >= range_bins * self.range_width:
+            self.counts = self.merge(self.counts, 0, 0)
+            self.range_width *= 2
+        while abs(mean) >= mean_bins // 2 * self.mean_width:
+            self.counts = self.merge(self.counts, 1, mean_bins // 2)
+            self.mean_width *= 2
+
+        range_index = int(value_range // self.range_width)
+        mean_index = int(mean // self.mean_width) + mean_bins // 2
+        self.counts[range_index, mean_index] += weight
+        self.cycles += weight
+        self.largest_range = max(self.largest_range, value_range)
+
+    @staticmethod
+    def merge(counts, axis, centre):
+        """
+        Merges pairs of bins along one axis, halving the resolution and doubling the covered span.
+
+        Args:
+            counts (numpy.ndarray): Histogram.
+            axis (int): Axis merged.
+            centre (int): Bin index of the zero value along the axis.
+
+        Returns:
+            numpy.ndarray: Merged histogram of the same shape.
+        """
+        size = counts.shape[axis]
+        target = (np.arange(size) - centre) // 2 + centre
+        merged = np.zeros_like(counts)
+        if axis == 0:
+            np.add.at(merged, target, counts)
+        else:
+            np.add.at(merged, (slice(None), target), counts)
+        return merged
+
+    def range_edges(self):
+        """numpy.ndarray: Edges of the range bins."""
+        return np.arange(self.counts.shape[0] + 1) * self.range_width
+
+    def mean_edges(self):
+        """numpy.ndarray: Edges of the mean bins."""
+        mean_bins = self.counts.shape[1]
+        return (np.arange(mean_bins + 1) - mean_bins // 2) * self.mean_width
+
+
+class CycleHistory:
+    """
+    Constant-memory record of per-cycle summaries.
+
+    The most recent cycles are kept in a ring, and older cycles are thinned to a logarithmic schedule (every
+    cycle up to 10, every 10th up to 100, every 100th up to 1000 and so on), which keeps the start of the test
+    and the evolution over millions of cycles with a few entries per decade.
+
+    Attributes:
+        recent (numpy.ndarray): Ring of the latest cycle summaries, ``CYCLE_DTYPE``.
+        count (int): Number of cycles recorded.
+        archive (list): Summaries of the cycles on the logarithmic schedule.
+    """
+
+    def __init__(self, capacity=4096):
+        """
+        Initializes an empty history.
+
+        Args:
+            capacity (int): Number of recent cycles kept in full (default: 4096).
+        """
+        self.recent = np.zeros(capacity, dtype=CYCLE_DTYPE)
+        self.reset()
+
+    def reset(self):
+        """Forgets every cycle."""
+        self.count = 0
+        self.archive = []
+
+    def add(self, summary):
+        """
+        Records the summary of a completed cycle.
+
+        Args:
+            summary (tuple): Values in ``CYCLE_DTYPE`` order, the cycle number first.
+        """
+        self.recent[self.count % len(self.recent)] = summary
+        self.count += 1
+        cycle = summary[0]
+        step = 10 ** max(len(str(cycle)) - 1, 0)
+        if cycle % step == 0:
+            self.archive.append(summary)
+
+    def latest(self):
+        """
+        Returns the recent cycles in order.
+
+        Returns:
+            numpy.ndarray: Up to ``capacity`` summaries, oldest first.
+        """
+        capacity = len(self.recent)
+        if self.count <= capacity:
+            return self.recent[:self.count].copy()
+        start = self.count % capacity
+        return np.concatenate([self.recent[start:], self.recent[:start]])
+
+    def overview(self):
+        """
+        Returns the logarithmic archive followed by the recent cycles not in it.
+
+        Returns:
+            numpy.ndarray: Summaries sorted by cycle number.
+        """
+        latest = self.latest()
+        archive = np.array(self.archive, dtype=CYCLE_DTYPE)
+        if len(latest):
+            archive = archive[archive["cycle"] < latest["cycle"][0]]
+        return np.concatenate([archive, latest])
+
+
+class CyclicAnalyzer:
+    """
+    Streaming analysis of a cyclic test: turning points, rainflow counts and per-cycle summaries.
+
+    A cycle runs from one stress valley to the next. Its hysteresis energy is the area of the stress-strain
+    loop, taken from a running trapezoidal integral of stress over strain that is read at each valley, so no
+    samples are buffered. Only the last ``window`` samples are kept, for plotting the latest loops.
+
+    Attributes:
+        area (float): Cross-sectional area of the specimen in mm^2.
+        initial_length (float): Initial length of the specimen in mm.
+        detector (TurningPointDetector): Stress turning point detector.
+        rainflow (RainflowCounter): Rainflow counter fed with the stress turning points.
+        history (CycleHistory): Per-cycle summaries.
+        window_stress, window_strain (numpy.ndarray): Ring of the latest samples.
+        samples (int): Number of samples analysed.
+    """
+
+    def __init__(self, area, initial_length, hysteresis=5.0, window=20000, history=4096):
+        """
+        Initializes the analyzer.
+
+        Args:
+            area (float): Cross-sectional area of the specimen in mm^2.
+            initial_length (float): Initial length of the specimen in mm.
+            hysteresis (float): Stress reversal in MPa needed to confirm a turning point (default: 5).
+            window (int): Number of latest samples kept for plotting (default: 20000).
+            history (int): Number of recent cycles kept in full (default: 4096).
+        """
+        self.area = area
+        self.initial_length = initial_length
+        self.detector = TurningPointDetector(hysteresis)
+        self.rainflow = RainflowCounter()
+        self.history = CycleHistory(history)
+        self.window_stress = np.zeros(window)
+        self.window_strain = np.zeros(window)
+        self.reset()
+
+    def reset(self):
+        """Clears all state for a new test."""
+        self.detector.reset()
+        self.rainflow.reset()
+        self.history.reset()
+        self.samples = 0
+        self.reference = None
+        self.previous = None
+        self.energy = 0.0
+        # Running integral, strain and stress at the sample of every candidate and confirmed extreme
+        self.extreme_state = None
+        self.valley = None
+        self.peak = None
+
+    @property
+    def cycles(self):
+        """int: Number of completed cycles."""
+        return self.history.count
+
+    def add(self, force, displacement):
+        """
+        Analyses one sample.
+
+        Args:
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+
+        Returns:
+            tuple or None: Summary of the cycle completed by this sample, in ``CYCLE_DTYPE`` order, if any.
+        """
+        if self.reference is None:
+            self.reference = displacement
+        stress = force / self.area
+        strain = (displacement - self.reference) / self.initial_length
+
+        if self.previous is not None:
+            previous_stress, previous_strain = self.previous
+            self.energy += 0.5 * (stress + previous_stress) * (strain - previous_strain)
+        self.previous = (stress, strain)
+
+        slot = self.samples % len(self.window_stress)
+        self.window_stress[slot] = stress
+        self.window_strain[slot] = strain
+        self.samples += 1
+
+        candidate_position = self.detector.extreme_position
+        turning_point = self.detector.push(stress)
+        if turning_point is None:
+            if self.detector.extreme_position != candidate_position or self.extreme_state is None:
+                self.extreme_state = (stress, strain, self.energy)
+            return None
+
+        confirmed = self.extreme_state
+        self.extreme_state = (stress, strain, self.energy)
+        self.rainflow.push(confirmed[0])
+        if turning_point[2]:
+            self.peak = confirmed
+            return None
+
+        summary = None
+        if self.valley is not None and self.peak is not None:
+            summary = (self.history.count + 1, self.peak[0], self.valley[0], self.peak[1], self.valley[1],
+                       confirmed[2] - self.valley[2])
+            self.history.add(summary)
+        self.valley = confirmed
+        self.peak = None
+        return summary
+
+    def finish(self):
+        """Counts the unclosed rainflow residue as half cycles at the end of the test."""
+        self.rainflow.finish()
+
+    def latest_samples(self):
+        """
+        Returns the latest samples in order.
+
+        Returns:
+            tuple: Strain and stress arrays of up to ``window`` samples.
+        """
+        window = len(self.window_stress)
+        if self.samples <= window:
+            return self.window_strain[:self.samples].copy(), self.window_stress[:self.samples].copy()
+        start = self.samples % window
+        return (np.concatenate([self.window_strain[start:], self.window_strain[:start]]),
+                np.concatenate([self.window_stress[start:], self.window_stress[:start]]))
+
+
+def masing_branch(stress_change, youngs_modulus, strength_coefficient, hardening_exponent):
+    """
+    Strain change along a hysteresis branch from a reversal (Masing's rule with a Ramberg-Osgood cyclic curve).
+
+    Args:
+        stress_change (numpy.ndarray): Stress change from the reversal in MPa.
+        youngs_modulus (float): Young's modulus in MPa.
+        strength_coefficient (float): Cyclic strength coefficient K' in MPa.
+        hardening_exponent (float): Cyclic hardening exponent n'.
+
+    Returns:
+        numpy.ndarray: Strain change from the reversal, with the sign of the stress change.
+    """
+    magnitude = np.abs(stress_change)
+    strain = magnitude / youngs_modulus + 2 * (magnitude / (2 * strength_coefficient)) ** (1 / hardening_exponent)
+    return np.sign(stress_change) * strain
+
+
+def cyclic_waveform(amplitude, mean, cycles, points_per_cycle=40, youngs_modulus=200e3,
+                    strength_coefficient=1000.0, hardening_exponent=0.15, amplitude_spread=0.0, seed=None):
+    """
+    Generates a stress-controlled cyclic test, one cycle at a time so millions of cycles need no memory.
+
+    Each cycle is a sine from valley to valley. Strain follows the Masing hysteresis branches, so the loops have
+    a real area, and every reversal lies on the cyclic stress-strain curve about the mean stress, so variable
+    amplitudes cannot make the strain drift. A non-zero spread varies the amplitude from cycle to cycle to
+    exercise the rainflow counting.
+
+    Args:
+        amplitude (float): Stress amplitude in MPa.
+        mean (float): Mean stress in MPa.
+        cycles (int): Number of cycles.
+        points_per_cycle (int): Samples per cycle, even (default: 40).
+        youngs_modulus (float): Young's modulus in MPa (default: 200 GPa).
+        strength_coefficient (float): Cyclic strength coefficient K' in MPa (default: 1000).
+        hardening_exponent (float): Cyclic hardening exponent n' (default: 0.15).
+        amplitude_spread (float): Relative standard deviation of the per-cycle amplitude (default: 0).
+        seed (int or None): Seed of the amplitude variation.
+
+    Yields:
+        tuple: Stress and strain arrays of one cycle.
+    """
+    rng = np.random.default_rng(seed)
+    half = points_per_cycle // 2
+    progress = (1 - np.cos(np.linspace(0, np.pi, half, endpoint=False))) / 2
+    material = (youngs_modulus, strength_coefficient, hardening_exponent)
+
+    def reversal_strain(stress):
+        # Cyclic stress-strain curve about the mean, half of a Masing branch of twice the amplitude
+        return masing_branch(2 * (stress - mean), *material) / 2
+
+    def branch(start, end):
+        stress = start + (end - start) * progress
+        strain = reversal_strain(start) + masing_branch(stress - start, *material)
+        # Spread the mismatch of unequal half cycles along the branch so it ends on the cyclic curve
+        mismatch = reversal_strain(end) - reversal_strain(start) - masing_branch(end - start, *material)
+        return stress, strain + mismatch * progress
+
+    valley = mean - amplitude
+    for _ in range(cycles):
+        cycle_amplitude = amplitude
+        if amplitude_spread:
+            cycle_amplitude = amplitude * max(1 + amplitude_spread * rng.standard_normal(), 0.05)
+        peak = mean + cycle_amplitude
+        next_valley = mean - cycle_amplitude
+
+        rise, rise_strain = branch(valley, peak)
+        fall, fall_strain = branch(peak, next_valley)
+        yield np.concatenate([rise, fall]), np.concatenate([rise_strain, fall_strain])
+        valley = next_valley
@@ -0,0 +1,92 @@
+import tkinter as tk
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
+
+class CyclicView(tk.Toplevel):
+    """
+    Window showing the live results of a cyclic test: latest hysteresis loops, peak and valley stress per cycle
+    and the rainflow range histogram.
+
+    Everything is drawn from the constant-memory state of the analyzer, so refreshing costs the same after ten
+    cycles as after ten million.
+
+    Attributes:
+        analyzer (CyclicAnalyzer): Analyzer of the running test.
+        refresh_interval (int): Milliseconds between refreshes.
+        figure (matplotlib.figure.Figure): Figure holding the three plots.
+        canvas (FigureCanvasTkAgg): Canvas displaying the figure.
+        status (tk.StringVar): Status line text.
+    """
+
+    def __init__(self, parent, analyzer, refresh_interval=1000):
+        """
+        Initializes the window and starts the periodic refresh.
+
+        Args:
+            parent (tk.Tk or tk.Frame): Parent tkinter widget.
+            analyzer (CyclicAnalyzer): Analyzer of the running test.
+            refresh_interval (int): Milliseconds between refreshes (default: 1000).
+        """
+        super().__init__(parent)
+        self.title("Cyclic Test")
+        self.analyzer = analyzer
+        self.refresh_interval = refresh_interval
+        self.status = tk.StringVar(value="")
+
+        self.figure, self.axes = plt.subplots(1, 3, figsize=(14, 4.5))
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.canvas.get_tk_widget().grid(row=0, column=0, padx=10, pady=10, sticky='nsew')
+        tk.Label(self, textvariable=self.status, anchor='w').grid(row=1, column=0, padx=10, pady=(0, 10), sticky='ew')
+        plt.close(self.figure)
+
+        self.refresh()
+
+    def refresh(self):
+        """
+        Redraw the plots from the analyzer state and schedule the next refresh.
+        """
+        if not self.winfo_exists():
+            return
+        loops_ax, cycles_ax, rainflow_ax = self.axes
+        for ax in self.axes:
+            ax.clear()
+
+        strain, stress = self.analyzer.latest_samples()
+        loops_ax.plot(strain, stress, linewidth=0.6)
+        loops_ax.set_xlabel('Strain')
+        loops_ax.set_ylabel('Stress (MPa)')
+        loops_ax.set_title('Latest loops')
+
+        cycles = self.analyzer.history.overview()
+        if len(cycles):
+            cycles_ax.plot(cycles["cycle"], cycles["peak_stress"], label="Peak")
+            cycles_ax.plot(cycles["cycle"], cycles["valley_stress"], label="Valley")
+            cycles_ax.set_xscale('log')
+            cycles_ax.legend(fontsize=8)
+        cycles_ax.set_xlabel('Cycle')
+        cycles_ax.set_ylabel('Stress (MPa)')
+        cycles_ax.set_title('Peak and valley stress')
+
+        rainflow = self.analyzer.rainflow
+        counts = rainflow.counts.sum(axis=1)
+        edges = rainflow.range_edges()
+        used = np.nonzero(counts)[0]
+        if len(used):
+            last = used[-1] + 1
+            rainflow_ax.bar(edges[:last], counts[:last], width=rainflow.range_width, align='edge')
+            rainflow_ax.set_yscale('log')
+        rainflow_ax.set_xlabel('Stress range (MPa)')
+        rainflow_ax.set_ylabel('Cycles')
+        rainflow_ax.set_title('Rainflow count')
+
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+        latest = cycles[-1] if len(cycles) else None
+        text = f"{self.analyzer.cycles} cycles, {rainflow.cycles:.1f} rainflow cycles, {self.analyzer.samples} samples"
+        if latest is not None:
+            text += f", last loop energy {latest['energy']:.4g} MJ/m^3"
+        self.status.set(text)
+
+        self.after(self.refresh_interval, self.refresh)
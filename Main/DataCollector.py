@@ -1,5 +1,6 @@
 import serial
 import threading
+from .Profiler import tracer
 
 class DataCollector:
     """
@@ -11,19 +12,34 @@ class DataCollector:
         collecting (bool): Flag indicating if data collection is active.
         thread (threading.Thread): Thread for asynchronous data collection.
         callback (function): Callback function for processing collected data.
+        compressor (SwingingDoorCompressor or None): Optional compressor applied to uncompressed incoming samples.
+        filter_stage (FilterStage or None): Optional noise filter applied to uncompressed incoming samples.
+        publisher (SamplePublisher or None): Optional server streaming delivered samples to remote dashboards.
+        delivered (int): Number of samples delivered to the callback since collection started.
+        calibration (RigCalibration or None): Rig calibration converting received raw ADC counts to units,
+            or None if the sender already sends Newtons and millimeters.
     """
 
-    def __init__(self, port):
+    def __init__(self, port, compressor=None, filter_stage=None, publisher=None, calibration=None):
         """
         Initializes the DataCollector with the serial port address.
 
         Args:
             port (str): Serial port address (e.g., "COM1", "/dev/ttyUSB0").
+            compressor (SwingingDoorCompressor or None): Optional compressor used to reduce stored samples.
+            filter_stage (FilterStage or None): Optional noise filter applied before compression.
+            publisher (SamplePublisher or None): Optional server streaming delivered samples to remote dashboards.
+            calibration (RigCalibration or None): Optional rig calibration for senders reporting raw ADC counts.
         """
         self.port = port
         self.ser = serial.Serial(port, baudrate=9600, timeout=1)
         self.collecting = False
         self.thread = None
+        self.compressor = compressor
+        self.filter_stage = filter_stage
+        self.publisher = publisher
+        self.delivered = 0
+        self.calibration = calibration
 
     def start_collecting(self, callback):
         """
@@ -34,6 +50,15 @@ class DataCollector:
         """
         self.collecting = True
         self.callback = callback
+        if self.compressor:
+            self.compressor.reset()
+        if self.filter_stage:
+            self.filter_stage.reset()
+        if self.publisher:
+            self.publisher.reset()
+        self.delivered = 0
+        # Samples left over from before the start, e.g. sent after the previous specimen broke, belong to no test
+        self.ser.reset_input_buffer()
         self.thread = threading.Thread(target=self.collect_data)
         self.thread.start()
 
@@ -42,12 +67,77 @@ class DataCollector:
         self.collecting = False
         if self.thread:
             self.thread.join()
+            if self.filter_stage:
+                for force, displacement in zip(*self.filter_stage.flush()):
+                    self.emit(force, displacement)
+            if self.compressor:
+                for index, force, displacement in self.compressor.flush():
+                    self.deliver(force, displacement, index)
 
     def collect_data(self):
         """Collects data from the serial port as long as collecting flag is True."""
         while self.collecting:
             if self.ser.in_waiting > 0:
-                line = self.ser.readline().decode('utf-8').strip()
-                if line:
-                    force, displacement = map(float, line.split(','))
-                    self.callback(force, displacement)
+                with tracer.span("collect_data"):
+                    line = self.ser.readline().decode('utf-8').strip()
+                    if line:
+                        self.process_line(line)
+
+    def process_line(self, line):
+        """
+        Parses one received line and forwards its samples to the callback.
+
+        Lines are either "force,displacement" or, when the sender already compressed the stream,
+        "force,displacement,index" where index is the position of the sample in the original stream.
+        With a calibration, force and displacement are raw ADC counts looked up in its tables.
+
+        Args:
+            line (str): Decoded line received from the serial port.
+        """
+        values = line.split(',')
+        if self.calibration:
+            force, displacement = self.calibration.to_units(int(values[0]), int(values[1]))
+            force, displacement = float(force), float(displacement)
+        else:
+            force, displacement = float(values[0]), float(values[1])
+
+        if len(values) > 2:
+            # Already compressed by the sender, the irregular stream is passed through untouched
+            self.deliver(force, displacement, int(values[2]))
+        elif self.filter_stage:
+            for filtered_force, filtered_displacement in zip(*self.filter_stage.push(force, displacement)):
+                self.emit(filtered_force, filtered_displacement)
+        else:
+            self.emit(force, displacement)
+
+    def emit(self, force, displacement):
+        """
+        Forwards one uncompressed sample to the callback, compressing it first if a compressor is set.
+
+        Args:
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+        """
+        if self.compressor:
+            for index, kept_force, kept_displacement in self.compressor.add(force, displacement):
+                self.deliver(kept_force, kept_displacement, index)
+        else:
+            self.deliver(force, displacement)
+
+    def deliver(self, force, displacement, index=None):
+        """
+        Hands a processed sample to the callback and, if set, to the publisher.
+
+        Args:
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+            index (int or None): Position of the sample in the uncompressed stream, if the stream is compressed.
+        """
+        if self.publisher:
+            self.publisher.publish(self.delivered if index is None else index, force, displacement)
+        self.delivered += 1
+
+        if index is None:
+            self.callback(force, displacement)
+        else:
+            self.callback(force, displacement, index)
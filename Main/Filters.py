@@ -0,0 +1,356 @@
+import numpy as np
+
+# Samples buffered by a live filter stage before a block is filtered
+DEFAULT_BLOCK_SIZE = 16
+
+def moving_average(values, window):
+    """
+    Smooths a complete series with a centered moving average.
+
+    The window shrinks at both ends so the output has the same length as the input and is not biased
+    towards zero at the edges.
+
+    Args:
+        values (array-like): Series to smooth.
+        window (int): Number of samples averaged for each output sample.
+
+    Returns:
+        numpy.ndarray: Smoothed series.
+    """
+    values = np.asarray(values, dtype=float)
+    # A window longer than the series would make the 'same' convolution return the window length instead
+    window = min(window, len(values))
+    if window <= 1:
+        return values.copy()
+    kernel = np.ones(window)
+    sums = np.convolve(values, kernel, mode='same')
+    counts = np.convolve(np.ones(len(values)), kernel, mode='same')
+    return sums / counts
+
+
+def savitzky_golay_coefficients(window, order, position=None):
+    """
+    Computes Savitzky-Golay smoothing coefficients.
+
+    Args:
+        window (int): Number of samples in the fitting window.
+        order (int): Order of the fitted polynomial, lower than the window.
+        position (int or None): Sample of the window the polynomial is evaluated at (default: the center).
+
+    Returns:
+        numpy.ndarray: Filter weights, applied to the window samples oldest first.
+    """
+    if order >= window:
+        raise ValueError("Savitzky-Golay order must be lower than the window length")
+    if position is None:
+        position = window // 2
+    offsets = np.arange(window) - position
+    vandermonde = np.vander(offsets, order + 1, increasing=True)
+    # Row 0 of the pseudo-inverse evaluates the least-squares polynomial at offset 0
+    return np.linalg.pinv(vandermonde)[0]
+
+
+def savitzky_golay(values, window, order):
+    """
+    Smooths a complete series with a centered Savitzky-Golay filter.
+
+    The series is padded with its end values so the output has the same length as the input.
+
+    Args:
+        values (array-like): Series to smooth.
+        window (int): Odd number of samples in the fitting window.
+        order (int): Order of the fitted polynomial.
+
+    Returns:
+        numpy.ndarray: Smoothed series.
+    """
+    values = np.asarray(values, dtype=float)
+    if window % 2 == 0:
+        raise ValueError("Savitzky-Golay window must be odd")
+    if len(values) < window:
+        return values.copy()
+    half = window // 2
+    coefficients = savitzky_golay_coefficients(window, order)
+    padded = np.concatenate([np.full(half, values[0]), values, np.full(half, values[-1])])
+    return np.convolve(padded, coefficients[::-1], mode='valid')
+
+
+def low_pass(values, cutoff, sample_rate):
+    """
+    Filters a complete series with a zero-phase single-pole low-pass filter.
+
+    The series is filtered forwards and then backwards, so the lag of the two passes cancels out.
+
+    Args:
+        values (array-like): Series to filter.
+        cutoff (float): Cutoff frequency in Hz.
+        sample_rate (float): Sampling rate of the series in Hz.
+
+    Returns:
+        numpy.ndarray: Filtered series.
+    """
+    forward = LowPassFilter(cutoff, sample_rate).process(values)
+    return LowPassFilter(cutoff, sample_rate).process(forward[::-1])[::-1]
+
+
+class MovingAverageFilter:
+    """
+    Streaming causal moving average, processing samples block by block.
+
+    Attributes:
+        window (int): Number of samples averaged for each output sample.
+        history (numpy.ndarray): Last input samples carried over from the previous block.
+    """
+
+    def __init__(self, window):
+        """
+        Initializes the filter.
+
+        Args:
+            window (int): Number of samples averaged for each output sample.
+        """
+        self.window = max(1, int(window))
+        self.reset()
+
+    def reset(self):
+        """Clears the filter state."""
+        self.history = np.empty(0)
+
+    def process(self, block):
+        """
+        Filters the next block of samples.
+
+        Args:
+            block (array-like): New input samples.
+
+        Returns:
+            numpy.ndarray: One filtered sample per input sample.
+        """
+        block = np.asarray(block, dtype=float)
+        if len(block) == 0:
+            return block
+        samples = np.concatenate([self.history, block])
+        sums = np.cumsum(np.concatenate([[0.0], samples]))
+        ends = np.arange(len(self.history), len(samples)) + 1
+        starts = np.maximum(ends - self.window, 0)
+        self.history = samples[-(self.window - 1):] if self.window > 1 else np.empty(0)
+        return (sums[ends] - sums[starts]) / (ends - starts)
+
+
+class SavitzkyGolayFilter:
+    """
+    Streaming causal Savitzky-Golay filter, processing samples block by block.
+
+    The polynomial fitted over the last ``window`` samples is evaluated at the newest sample, so the filter
+    adds no delay. Until the window is full the first sample is repeated to fill it.
+
+    Attributes:
+        window (int): Number of samples in the fitting window.
+        order (int): Order of the fitted polynomial.
+        coefficients (numpy.ndarray): Filter weights, applied to the window samples oldest first.
+        history (numpy.ndarray or None): Last ``window - 1`` input samples, or None before the first block.
+    """
+
+    def __init__(self, window, order):
+        """
+        Initializes the filter.
+
+        Args:
+            window (int): Number of samples in the fitting window.
+            order (int): Order of the fitted polynomial.
+        """
+        self.window = window
+        self.order = order
+        self.coefficients = savitzky_golay_coefficients(window, order, position=window - 1)
+        self.reset()
+
+    def reset(self):
+        """Clears the filter state."""
+        self.history = None
+
+    def process(self, block):
+        """
+        Filters the next block of samples.
+
+        Args:
+            block (array-like): New input samples.
+
+        Returns:
+            numpy.ndarray: One filtered sample per input sample.
+        """
+        block = np.asarray(block, dtype=float)
+        if len(block) == 0:
+            return block
+        if self.history is None:
+            self.history = np.full(self.window - 1, block[0])
+        samples = np.concatenate([self.history, block])
+        self.history = samples[len(samples) - (self.window - 1):]
+        return np.convolve(samples, self.coefficients[::-1], mode='valid')
+
+
+class LowPassFilter:
+    """
+    Streaming causal single-pole low-pass filter with vectorized block processing.
+
+    The recursion ``y[n] = a * x[n] + (1 - a) * y[n - 1]`` is unrolled over a block into a lower-triangular
+    matrix product, so each block costs one matrix-vector product instead of a Python loop per sample.
+
+    Attributes:
+        alpha (float): Smoothing factor derived from the cutoff frequency.
+        block_size (int): Largest block processed with a single matrix product.
+        transfer (numpy.ndarray): Lower-triangular matrix mapping a block of inputs to outputs.
+        decay (numpy.ndarray): Contribution of the previous output to each output of a block.
+        last (float or None): Last output sample, or None before the first block.
+    """
+
+    def __init__(self, cutoff, sample_rate, block_size=256):
+        """
+        Initializes the filter.
+
+        Args:
+            cutoff (float): Cutoff frequency in Hz.
+            sample_rate (float): Sampling rate of the input in Hz.
+            block_size (int): Largest block processed with a single matrix product (default: 256).
+        """
+        dt = 1.0 / sample_rate
+        rc = 1.0 / (2 * np.pi * cutoff)
+        self.alpha = dt / (rc + dt)
+        self.block_size = block_size
+
+        lags = np.arange(block_size)[:, None] - np.arange(block_size)[None, :]
+        keep = 1 - self.alpha
+        self.transfer = np.where(lags >= 0, self.alpha * keep ** np.maximum(lags, 0), 0.0)
+        self.decay = keep ** (np.arange(block_size) + 1)
+        self.reset()
+
+    def reset(self):
+        """Clears the filter state."""
+        self.last = None
+
+    def process(self, block):
+        """
+        Filters the next block of samples.
+
+        Args:
+            block (array-like): New input samples.
+
+        Returns:
+            numpy.ndarray: One filtered sample per input sample.
+        """
+        block = np.asarray(block, dtype=float)
+        output = np.empty_like(block)
+        if len(block) == 0:
+            return output
+        if self.last is None:
+            self.last = block[0]
+
+        for start in range(0, len(block), self.block_size):
+            chunk = block[start:start + self.block_size]
+            n = len(chunk)
+            output[start:start + n] = self.transfer[:n, :n] @ chunk + self.decay[:n] * self.last
+            self.last = output[start + n - 1]
+        return output
+
+
+FILTERS = {
+    "moving-average": lambda: MovingAverageFilter(9),
+    "savitzky-golay": lambda: SavitzkyGolayFilter(21, 3),
+    "low-pass": lambda: LowPassFilter(5.0, 50.0),
+}
+
+# Centered counterparts of the streaming filters, used when a complete series is filtered offline
+OFFLINE_FILTERS = {
+    "moving-average": lambda values: moving_average(values, 9),
+    "savitzky-golay": lambda values: savitzky_golay(values, 21, 3),
+    "low-pass": lambda values: low_pass(values, 5.0, 50.0),
+}
+
+# Samples after which a step has fully passed through the slowest filter above (the low-pass is below 1e-4)
+LONGEST_FILTER_WINDOW = 21
+
+
+class FilterStage:
+    """
+    Noise-filtering stage between acquisition and analysis for the force and displacement channels.
+
+    Live samples are buffered into blocks and filtered with one vectorized call per block. Complete series
+    are filtered offline with the centered counterpart of the filter, which adds no phase lag.
+
+    Attributes:
+        make_filter (function): Factory returning a new streaming filter for one channel.
+        offline_filter (function or None): Centered filter of a complete series, None to reuse the streaming one.
+        block_size (int): Number of samples buffered before a live block is filtered.
+        force_filter, displacement_filter: Streaming filters holding the live state of each channel.
+        force_buffer (list): Live force samples waiting for the block to fill.
+        displacement_buffer (list): Live displacement samples waiting for the block to fill.
+    """
+
+    def __init__(self, make_filter, block_size=DEFAULT_BLOCK_SIZE, offline_filter=None):
+        """
+        Initializes the filter stage.
+
+        Args:
+            make_filter (function or str): Factory returning a streaming filter, or a name from ``FILTERS``.
+            block_size (int): Number of samples buffered before a live block is filtered (default: 16).
+            offline_filter (function or None): Centered filter of a complete series (default: the one from
+                ``OFFLINE_FILTERS`` for a named filter).
+        """
+        if isinstance(make_filter, str):
+            offline_filter = offline_filter or OFFLINE_FILTERS[make_filter]
+            make_filter = FILTERS[make_filter]
+        self.make_filter = make_filter
+        self.offline_filter = offline_filter
+        self.block_size = block_size
+        self.reset()
+
+    def reset(self):
+        """Clears the live filter state and buffers."""
+        self.force_filter = self.make_filter()
+        self.displacement_filter = self.make_filter()
+        self.force_buffer = []
+        self.displacement_buffer = []
+
+    def push(self, force, displacement):
+        """
+        Adds one live sample, filtering the buffered block once it is full.
+
+        Args:
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+
+        Returns:
+            tuple: Arrays of filtered force and displacement samples, empty until a block is complete.
+        """
+        self.force_buffer.append(force)
+        self.displacement_buffer.append(displacement)
+        if len(self.force_buffer) < self.block_size:
+            return np.empty(0), np.empty(0)
+        return self.flush()
+
+    def flush(self):
+        """
+        Filters the samples buffered so far, even if the block is not full.
+
+        Returns:
+            tuple: Arrays of filtered force and displacement samples.
+        """
+        force = self.force_filter.process(self.force_buffer)
+        displacement = self.displacement_filter.process(self.displacement_buffer)
+        self.force_buffer = []
+        self.displacement_buffer = []
+        return force, displacement
+
+    def apply(self, force, displacement):
+        """
+        Filters complete series offline with the centered filter, or the streaming one with fresh state.
+
+        Args:
+            force (array-like): Force (or stress) series.
+            displacement (array-like): Displacement (or strain) series.
+
+        Returns:
+            tuple: Filtered force and displacement arrays, as long as the inputs.
+        """
+        if self.offline_filter is not None:
+            return self.offline_filter(force), self.offline_filter(displacement)
+        return self.make_filter().process(force), self.make_filter().process(displacement)
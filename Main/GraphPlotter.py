@@ -2,7 +2,11 @@ import tkinter as tk
 from tkinter import filedialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.widgets import SpanSelector
 import numpy as np
+from .Compression import reconstruct, is_compressed
+from .Archive import ArchiveReader
+from .Profiler import traced
 
 class GraphPlotter:
     """
@@ -12,78 +16,78 @@ class GraphPlotter:
         root (tk.Tk): The main tkinter root window.
         canvas (FigureCanvasTkAgg or None): Canvas for displaying matplotlib plots.
         graph_area (tk.Frame or None): Frame area to embed the canvas.
-        force_data (list): List of force data points.
-        displacement_data (list): List of displacement data points.
-        stress_data (list): List of stress data points.
-        strain_data (list): List of strain data points.
+        session (TestSession or None): Test whose samples are plotted and analysed.
+        analysis_filter (FilterStage or None): Noise filter applied offline to the series before property calculation.
         current_plot (tk.IntVar): Integer variable to track current plot type.
+        span_callback (callable or None): Called with the lowest and highest strain of a window dragged on the
+            stress-strain plot.
+        span_selector (SpanSelector or None): Strain window selector of the displayed stress-strain plot.
     """
 
-    def __init__(self, root):
+    def __init__(self, root, analysis_filter=None):
         """
         Initializes the GraphPlotter with the root window and sets up initial variables.
 
         Args:
             root (tk.Tk): The main tkinter root window.
+            analysis_filter (FilterStage or None): Noise filter applied offline before property calculation.
         """
         self.root = root
         self.canvas = None
         self.graph_area = None
-        self.force_data = []
-        self.displacement_data = []
-        self.stress_data = []
-        self.strain_data = []
-        self.initial_data = {}
+        self.session = None
+        self.analysis_filter = analysis_filter
+        self.span_callback = None
+        self.span_selector = None
         self.current_plot = tk.IntVar(value=0)  # 0 for stress-strain, 1 for force-displacement, 2 for results
         self.current_plot.trace_add('write', self.update_plot)
 
-    def plot_graph(self, graph_area, force_data, displacement_data, stress_data, strain_data, initial_data):
+    def plot_graph(self, graph_area, session):
         """
-        Plots a graph based on provided data.
+        Plots a graph of the given test session.
 
         Args:
             graph_area (tk.Frame): Frame to embed the graph canvas.
-            force_data (list): List of force data points.
-            displacement_data (list): List of displacement data points.
-            stress_data (list): List of stress data points.
-            strain_data (list): List of strain data points.
+            session (TestSession): Test whose samples are plotted. Its columns are plotted without copying.
         """
         self.graph_area = graph_area
-        self.force_data = force_data
-        self.displacement_data = displacement_data
-        self.stress_data = stress_data
-        self.strain_data = strain_data
-        self.initial_data = initial_data
+        self.session = session
         self.update_plot()
 
+    @traced("update_plot")
     def update_plot(self, *args):
         """
         Updates the plot based on the selected plot type.
         """
         plot_type = self.current_plot.get()
+
+        if self.graph_area is None or self.session is None:
+            return
         
         # Clear previous plot if canvas exists
         if self.canvas:
             self.canvas.get_tk_widget().destroy()
             self.canvas = None
         
+        self.span_selector = None
         fig, ax = plt.subplots(figsize=(10, 6))
         
         if plot_type == 1:  # Force vs Displacement
-            ax.plot(self.displacement_data, self.force_data, 'b')
+            ax.plot(self.session.displacement, self.session.force, 'b')
             ax.set_xlabel('Displacement (mm)')
             ax.set_ylabel('Force (N)')
             ax.set_title('Force vs Displacement')
         elif plot_type == 2:  # Results
             self.display_results(ax)
         else:  # Stress vs Strain
-            ax.plot(self.strain_data, self.stress_data, 'r')
+            ax.plot(self.session.strain, self.session.stress, 'r')
             ax.set_xlabel('Strain')
             ax.set_ylabel('Stress (MPa)')
             ax.set_title('Stress vs Strain')
-
-        if self.graph_area is None:
-            return
+            if self.span_callback is not None:
+                # Kept on the plotter, the selector stops responding once garbage collected
+                self.span_selector = SpanSelector(ax, self.span_callback, 'horizontal', useblit=True,
+                                                  props=dict(alpha=0.2, facecolor='tab:blue'), interactive=True)
         
         # Create new FigureCanvasTkAgg object
         self.canvas = FigureCanvasTkAgg(fig, master=self.graph_area)
@@ -94,6 +98,39 @@ class GraphPlotter:
         # Close the figure after it's drawn to release memory
         plt.close(fig)
 
+    def plot_archive_window(self, graph_area, path, strain_low, strain_high):
+        """
+        Plots the stress-strain curve of an archived test within a strain window.
+
+        Only the archive chunks whose displacement range overlaps the window are read and decompressed.
+
+        Args:
+            graph_area (tk.Frame): Frame to embed the graph canvas.
+            path (str): Chunked archive written by ``TestSession.save``.
+            strain_low (float): Lowest strain shown.
+            strain_high (float): Highest strain shown.
+
+        Returns:
+            int: Number of samples plotted.
+        """
+        with ArchiveReader(path) as reader:
+            strain, stress = reader.read_strain_window(strain_low, strain_high)
+
+        if self.canvas:
+            self.canvas.get_tk_widget().destroy()
+        fig, ax = plt.subplots(figsize=(10, 6))
+        ax.plot(strain, stress, 'r.', markersize=2)
+        ax.set_xlabel('Strain')
+        ax.set_ylabel('Stress (MPa)')
+        ax.set_title(f'Stress vs Strain ({strain_low:g} to {strain_high:g})')
+
+        self.canvas = FigureCanvasTkAgg(fig, master=graph_area)
+        self.canvas.get_tk_widget().configure(width=600, height=400)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        plt.close(fig)
+        return len(strain)
+
     def save_plot(self, fig, title):
         """
         Saves the current matplotlib figure as a PNG file.
@@ -113,8 +150,8 @@ class GraphPlotter:
         Saves multiple plots related to force-displacement and stress-strain as PNG files.
         """
         plots = [
-            (self.displacement_data, self.force_data, 'Force vs Displacement', 'Displacement (mm)', 'Force (N)'),
-            (self.strain_data, self.stress_data, 'Stress vs Strain', 'Strain', 'Stress (MPa)')
+            (self.session.displacement, self.session.force, 'Force vs Displacement', 'Displacement (mm)', 'Force (N)'),
+            (self.session.strain, self.session.stress, 'Stress vs Strain', 'Strain', 'Stress (MPa)')
         ]
         
         for i, (x_data, y_data, title, x_label, y_label) in enumerate(plots):
@@ -162,6 +199,7 @@ class GraphPlotter:
         
         return (stress[second] - stress[first]) / (strain[second] - strain[first]) 
     
+    @traced("calculate_properties")
     def calculate_properties(self, strain, stress):
         """
         Calculates material properties such as yield stress, ultimate tensile strength, etc.
@@ -201,15 +239,37 @@ class GraphPlotter:
         return {
             "Yield Stress (MPa)": yield_stress,
             "Yield Strain": yield_strain,
-            "Force at Yield (N)": yield_stress * self.initial_data["area"],
+            "Force at Yield (N)": yield_stress * self.session.area,
             "Ultimate Tensile Strength (MPa)": ultimate_stress,
             "Strain at UTS": strain_at_uts,
-            "Force at UTS (N)": ultimate_stress * self.initial_data["area"],
+            "Force at UTS (N)": ultimate_stress * self.session.area,
             "Fracture Stress (MPa)": fracture_stress,
             "Fracture Strain": fracture_strain,
             "Young's Modulus (MPa)": youngs_modulus,
         }
 
+    def get_analysis_series(self):
+        """
+        Returns the strain and stress series used for property calculation.
+
+        Compressed streams only store the archived samples, so the dropped samples are rebuilt by linear
+        interpolation over the stream index. The reconstruction error is bounded by the compression tolerance.
+        The offline analysis filter, if any, is then applied to the evenly sampled series.
+
+        Returns:
+            tuple: Arrays of strain and stress values.
+        """
+        session = self.session
+        if is_compressed(session.sample_index):
+            indices = session.sample_index - session.sample_index[0]
+            strain, stress = reconstruct(indices, session.strain), reconstruct(indices, session.stress)
+        else:
+            strain, stress = session.strain, session.stress
+
+        if self.analysis_filter:
+            stress, strain = self.analysis_filter.apply(stress, strain)
+        return strain, stress
+
     def display_results(self, ax):
         """
         Displays calculated material properties on a matplotlib axes.
@@ -217,8 +277,8 @@ class GraphPlotter:
         Args:
             ax (matplotlib.axes.Axes): Axes object to display the results.
         """
-        results = self.calculate_properties(self.strain_data, self.stress_data)
-        text_str = "\n".join([f"Specimen {key}: {value}" for key, value in self.initial_data.items()])
+        results = self.calculate_properties(*self.get_analysis_series())
+        text_str = "\n".join([f"Specimen {key}: {value}" for key, value in self.session.initial_data.items()])
         text_str += "\n"
         text_str += "\n".join([f"{key}: {value:.4f}" for key, value in results.items()])
         ax.text(0.05, 0.95, text_str, transform=ax.transAxes, fontsize=16, verticalalignment='top', horizontalalignment='left')
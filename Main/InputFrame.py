@@ -1,4 +1,35 @@
 import tkinter as tk
+from math import pi
+
+def specimen_data(shape, diameter, width, height, initial_length):
+    """
+    Builds the specimen geometry dictionary used by a test session.
+
+    Args:
+        shape (str): Shape of the material ("rounded" or "rectangular").
+        diameter (float): Diameter of the rounded material.
+        width (float): Width of the rectangular material.
+        height (float): Height of the rectangular material.
+        initial_length (float): Initial length of the material.
+
+    Returns:
+        dict: Shape, dimensions, cross-sectional area and initial length.
+    """
+    if shape == "rounded":
+        return {
+            "shape": shape,
+            "diameter": diameter,
+            "area": (pi / 4) * (diameter ** 2),
+            "initial_length": initial_length
+        }
+    return {
+        "shape": shape,
+        "width": width,
+        "height": height,
+        "area": (width * height),
+        "initial_length": initial_length
+    }
+
 
 class InputFrame(tk.Frame):
     """
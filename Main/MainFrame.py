@@ -1,5 +1,17 @@
+import threading
 import tkinter as tk
+from tkinter import filedialog, messagebox
 from .GraphPlotter import GraphPlotter
+from .ComparisonView import ComparisonView
+from .CatalogSearch import CatalogSearch
+from .Profiler import tracer, traced
+from .TestSession import TestSession
+from .ModelFitting import fit_all_models
+from .Cyclic import CyclicAnalyzer
+from .CyclicView import CyclicView
+from .TestQueue import TestQueue, FractureDetector, AnalysisWorker
+from .QueueWindow import QueueWindow
+from .RangePanel import RangePanel
 
 class MainFrame(tk.Frame):
     """
@@ -11,17 +23,15 @@ class MainFrame(tk.Frame):
         data_collector (object): Object responsible for collecting data during the simulation.
         testing_simulator (object): Object handling the simulation logic.
         show_input_frame (function): Function to switch to the input frame.
+        analysis_filter (FilterStage or None): Noise filter applied offline before property calculation.
+        catalog (TestCatalog or None): Catalog every completed test is recorded in.
 
     Attributes:
         data_collector (object): Instance managing data collection.
         testing_simulator (object): Instance managing simulation.
         show_input_frame (function): Function to switch to input frame.
         graph_plotter (GraphPlotter): Instance to handle plotting graphs.
-        initial_data (dict): Initial data for the simulation.
-        force_data (list): List to store force data during the simulation.
-        displacement_data (list): List to store displacement data during the simulation.
-        stress_data (list): List to store stress data during the simulation.
-        strain_data (list): List to store strain data during the simulation.
+        session (TestSession): Specimen geometry and samples of the current test.
         graph1_area (tk.Frame): Frame for displaying graphs.
         slider_frame (tk.Frame): Frame containing navigation buttons for graphs.
         prev_button (tk.Button): Button to navigate to previous graph.
@@ -38,26 +48,57 @@ class MainFrame(tk.Frame):
         start_button, stop_button, new_test_button, show_graph_button,
         simulate_button, save_results_button (tk.Button): Buttons for starting/stopping,
         new test, plotting, simulating, and saving results respectively.
+        save_data_button, compare_button, search_button (tk.Button): Buttons for saving the raw test data,
+        comparing stored tests and searching the test catalog.
+        fit_button (tk.Button): Button fitting constitutive models to the current test.
+        cyclic (tk.BooleanVar): Whether the next test is a cyclic test.
+        cyclic_check (tk.Checkbutton): Check button selecting the cyclic mode.
+        cyclic_analyzer (CyclicAnalyzer or None): Streaming analyzer of the running cyclic test, None for a
+            monotonic test. Cyclic samples are not stored in the session, so memory stays constant.
+        queue_button (tk.Button): Button opening the test queue.
+        test_queue (TestQueue): Batch of pre-entered specimens.
+        fracture_detector (FractureDetector): Detector ending the acquisition of a queued specimen.
+        analysis_worker (AnalysisWorker or None): Background analysis and export of finished queued specimens.
+        queue_results (list): (number, geometry, properties, status) of every queued specimen analysed or stopped.
+        queue_window (QueueWindow or None): Open queue window.
+        simulate_queue (tk.BooleanVar): Whether every queued specimen is simulated with the last material inputs.
+        session_catalogued (bool): Whether the current test was already handed to the catalog.
+        range_button (tk.Button): Button opening the range results panel.
+        range_panel (RangePanel or None): Open range results panel.
+        latency_label (tk.Label or None): Live per-stage latency overlay, only created when tracing is enabled.
     """
 
-    def __init__(self, parent, data, data_collector, testing_simulator, show_input_frame):
+    def __init__(self, parent, data, data_collector, testing_simulator, show_input_frame, analysis_filter=None, catalog=None):
         super().__init__(parent)
         
         # Initialize instances and data
         self.data_collector = data_collector
         self.testing_simulator = testing_simulator
         self.show_input_frame = show_input_frame
-        self.graph_plotter = GraphPlotter(parent)
+        self.catalog = catalog
+        self.graph_plotter = GraphPlotter(parent, analysis_filter)
         
-        self.initial_data = data
-        self.force_data = []
-        self.displacement_data = []
-        self.stress_data = []
-        self.strain_data = []
+        self.session = TestSession(data)
+        self.latency_label = None
+        self.cyclic = tk.BooleanVar(value=False)
+        self.cyclic_analyzer = None
+        self.analysis_filter = analysis_filter
+        self.test_queue = TestQueue()
+        self.fracture_detector = FractureDetector()
+        self.analysis_worker = None
+        self.queue_results = []
+        self.queue_window = None
+        self.simulate_queue = tk.BooleanVar(value=False)
+        self.range_panel = None
+        self.session_catalogued = False
+        self.graph_plotter.span_callback = self.select_strain_window
 
         # Create GUI widgets
         self.create_widgets()
 
+        if tracer.enabled:
+            self.create_latency_overlay()
+
     def create_widgets(self):
         """
         Create all GUI widgets: graph area, force-displacement area, button area, and stress-strain area.
@@ -164,79 +205,178 @@ class MainFrame(tk.Frame):
         
         self.save_results_button = tk.Button(self.button_area, text="Save", command=self.save_results,width=15)
         self.save_results_button.grid(row=1, column=2, padx=10, pady=10, sticky="e")
+        
+        self.save_data_button = tk.Button(self.button_area, text="Save Data", command=self.save_test_data, width=15)
+        self.save_data_button.grid(row=2, column=0, padx=10, pady=10, sticky="w")
+        
+        self.compare_button = tk.Button(self.button_area, text="Compare", command=self.show_comparison, width=15)
+        self.compare_button.grid(row=2, column=1, padx=10, pady=10)
+        
+        self.search_button = tk.Button(self.button_area, text="Search", command=self.show_catalog_search, width=15)
+        self.search_button.grid(row=2, column=2, padx=10, pady=10, sticky="e")
+        if self.catalog is None:
+            self.search_button.config(state=tk.DISABLED)
+        
+        self.fit_button = tk.Button(self.button_area, text="Fit", command=self.fit_models, width=15)
+        self.fit_button.grid(row=3, column=0, padx=10, pady=10, sticky="w")
+        
+        self.cyclic_check = tk.Checkbutton(self.button_area, text="Cyclic", variable=self.cyclic, width=12)
+        self.cyclic_check.grid(row=3, column=1, padx=10, pady=10)
+        
+        self.queue_button = tk.Button(self.button_area, text="Queue", command=self.show_queue, width=15)
+        self.queue_button.grid(row=3, column=2, padx=10, pady=10, sticky="e")
+        
+        self.range_button = tk.Button(self.button_area, text="Range", command=self.show_range_panel, width=15)
+        self.range_button.grid(row=4, column=0, padx=10, pady=10, sticky="w")
     
-    def data_callback(self, force, displacement):
+    def create_latency_overlay(self):
+        """
+        Create the live per-stage latency overlay shown while tracing is enabled.
+        """
+        self.latency_label = tk.Label(self, text="", justify=tk.LEFT, anchor="w", font=("Courier", 9))
+        self.latency_label.grid(row=3, column=0, padx=10, sticky='w')
+        self.update_latency_overlay()
+
+    def update_latency_overlay(self):
+        """
+        Refresh the latency overlay with the last and mean duration of every traced stage.
+        """
+        if not self.winfo_exists():
+            return
+        summary = tracer.stage_summary()
+        lines = [f"{name:<22} last {stage['last_ms']:8.3f} ms  mean {stage['mean_ms']:8.3f} ms  max {stage['max_ms']:8.3f} ms  n={stage['count']}"
+                 for name, stage in sorted(summary.items())]
+        self.latency_label.config(text="\n".join(lines) or "Tracing enabled, waiting for samples")
+        self.after(500, self.update_latency_overlay)
+
+    @traced("data_callback")
+    def data_callback(self, force, displacement, index=None):
         """
         Callback function to receive and process data from data collector.
 
         Args:
             force (float): Current force value.
             displacement (float): Current displacement value.
+            index (int or None): Position of the sample in the uncompressed stream, if the stream is compressed.
         """
-        area = self.initial_data["area"]
-        initial_length = self.initial_data["initial_length"]
-        
-        stress = force / area
-        
-        if len(self.displacement_data) > 0:
-            strain = (displacement - self.displacement_data[0]) / initial_length
-        else:
-            strain = 0
+        if self.cyclic_analyzer is not None:
+            self.cyclic_callback(force, displacement)
+            return
 
-        self.force_data.append(force)
-        self.displacement_data.append(displacement)
-        
-        self.stress_data.append(stress)
-        self.strain_data.append(strain)
+        stress, strain = self.session.append(force, displacement, index)
+        if self.test_queue.running and self.fracture_detector.add(force):
+            # Stopping joins the collecting thread, so it has to happen on the Tk thread
+            self.after(0, self.finish_specimen)
         
-        self.f_d_text.insert("1.0", f"{force:.2f}\t {displacement:.3f}\n")
-        self.stress_text.insert("1.0", f"{stress:.2f}\t{strain:.5f}\n")
+        with tracer.span("text_insert"):
+            self.f_d_text.insert("1.0", f"{force:.2f}\t {displacement:.3f}\n")
+            self.stress_text.insert("1.0", f"{stress:.2f}\t{strain:.5f}\n")
         
         
+    def cyclic_callback(self, force, displacement):
+        """
+        Feed one sample of a cyclic test to the analyzer and list every completed cycle.
+
+        Args:
+            force (float): Current force value.
+            displacement (float): Current displacement value.
+        """
+        summary = self.cyclic_analyzer.add(force, displacement)
+        if summary is not None:
+            cycle, peak_stress, valley_stress, _, _, energy = summary
+            with tracer.span("text_insert"):
+                self.stress_text.insert("1.0", f"#{cycle} {peak_stress:.1f}/{valley_stress:.1f} {energy:.4f}\n")
+                if cycle % 100 == 0:
+                    self.stress_text.delete("200.0", tk.END)
+
+
     def start_data_collection(self):
         """
         Start data collection process.
         """
         self.create_widgets()  # Reset widgets
-        self.force_data = []
-        self.displacement_data = []
-        self.stress_data = []
-        self.strain_data = []
+        self.session.clear()
+        self.session_catalogued = False
+        self.cyclic_analyzer = None
+        if self.cyclic.get():
+            self.cyclic_analyzer = CyclicAnalyzer(self.session.area, self.session.initial_length)
         self.data_collector.start_collecting(self.data_callback)
         
 
     def stop_data_collection(self):
         """
-        Stop data collection process.
+        Stop data collection process. A queued specimen stopped before it broke is not catalogued.
         """
+        aborted = self.test_queue.running
+        self.test_queue.running = False
         self.data_collector.stop_collecting()
+        if self.cyclic_analyzer is not None:
+            self.cyclic_analyzer.finish()
+            return
+        if aborted:
+            if not self.session_catalogued:
+                self.session_catalogued = True
+                self.queue_results.append((self.test_queue.number, self.session.initial_data, None,
+                                           "Stopped, not catalogued"))
+                self.refresh_queue_window()
+            return
+        self.catalog_test()
+
+
+    def catalog_test(self):
+        """
+        Record the completed test in the catalog and stream its properties to remote dashboards, once per test.
+        Properties are calculated, and the test saved and inserted, on the catalog writer thread.
+        """
+        if self.session_catalogued or len(self.session) < 2:
+            return
+        publisher = self.data_collector.publisher
+        if self.catalog is None and publisher is None:
+            return
+        self.session_catalogued = True
+        # A plotter of its own, the shared one is used by the Tk thread meanwhile
+        analyser = GraphPlotter(self, self.analysis_filter)
+
+        def analyse(session):
+            analyser.session = session
+            properties = analyser.calculate_properties(*analyser.get_analysis_series())
+            if publisher is not None:
+                publisher.publish_properties({key: float(value) for key, value in properties.items()})
+            return properties
+
+        if self.catalog is not None:
+            self.catalog.submit(self.session.copy(), analyse)
+        else:
+            threading.Thread(target=analyse, args=(self.session.copy(),), daemon=True).start()
 
 
     def start_new_test(self):
         """
         Start a new test with fresh initial data.
         """
-        self.initial_data = {}
-        self.force_data = []
-        self.displacement_data = []
-        self.stress_data = []
-        self.strain_data = []
+        self.session = None
         self.destroy()  # Destroy current frame
         self.show_input_frame()  # Show input frame
         
         
     def show_graph(self):
         """
-        Plot the current data on the graph.
+        Plot the current data on the graph, or open the live cyclic results of a cyclic test.
         """
-        self.graph_plotter.plot_graph(self.graph1_area, self.force_data, self.displacement_data, self.stress_data, self.strain_data, self.initial_data)
+        if self.cyclic_analyzer is not None:
+            CyclicView(self, self.cyclic_analyzer)
+            return
+        self.graph_plotter.plot_graph(self.graph1_area, self.session)
         
         
     def start_simulation(self):
         """
-        Start simulation with the current initial data.
+        Start simulation with the current initial data, as a cyclic test when the cyclic mode is selected.
         """
-        self.testing_simulator.start_simulation(self.initial_data["area"], self.initial_data["initial_length"])
+        if self.cyclic.get():
+            self.testing_simulator.start_cyclic_simulation(self.session.area, self.session.initial_length)
+            return
+        self.testing_simulator.start_simulation(self.session.area, self.session.initial_length)
 
 
     def save_results(self):
@@ -244,3 +384,183 @@ class MainFrame(tk.Frame):
         Save results from the current simulation or test.
         """
         self.graph_plotter.save_results()
+
+
+    def save_test_data(self):
+        """
+        Save the raw samples and geometry of the current test so it can be compared later.
+        """
+        file_path = filedialog.asksaveasfilename(defaultextension=".ssa", title="Save test data as",
+                                                 filetypes=[("Test archive", "*.ssa"), ("Test data", "*.npz"),
+                                                            ("All files", "*.*")])
+        if file_path:
+            self.session.save(file_path)
+
+
+    def fit_models(self):
+        """
+        Fit the constitutive models to the current test, show the results and let the best one drive the simulator,
+        or go back to the built-in curve.
+        """
+        if len(self.session) < 2:
+            messagebox.showerror("Fit error", "Collect or simulate a test before fitting")
+            return
+        self.graph_plotter.session = self.session
+        strain, stress = self.graph_plotter.get_analysis_series()
+        properties = self.graph_plotter.calculate_properties(strain, stress)
+        try:
+            models, elapsed = fit_all_models(strain, stress, properties)
+        except (ValueError, IndexError, ZeroDivisionError) as error:
+            messagebox.showerror("Fit error", f"Could not fit the curve: {error}")
+            return
+
+        lines = [model.describe() for model in models]
+        lines.append(f"\nFitted in {elapsed * 1000:.1f} ms")
+        question = f"\n\nUse {models[0].name} for the simulator? Choose No to simulate with the built-in curve."
+        if messagebox.askyesno("Fitted models", "\n".join(lines) + question):
+            self.testing_simulator.model = models[0]
+        else:
+            self.testing_simulator.model = None
+
+
+    def show_queue(self):
+        """
+        Open the test queue window, or raise it if it is already open.
+        """
+        if self.queue_window is not None and self.queue_window.winfo_exists():
+            self.queue_window.lift()
+            return
+        self.queue_window = QueueWindow(self, self)
+
+
+    def show_range_panel(self):
+        """
+        Open the range results panel, or raise it if it is already open.
+        """
+        if self.range_panel is not None and self.range_panel.winfo_exists():
+            self.range_panel.lift()
+            return
+        self.range_panel = RangePanel(self, self)
+
+
+    def select_strain_window(self, strain_low, strain_high):
+        """
+        Callback of the stress-strain plot: show the results of the dragged strain window in the range panel.
+
+        Args:
+            strain_low (float): Lowest strain of the window.
+            strain_high (float): Highest strain of the window.
+        """
+        if strain_high <= strain_low:
+            return
+        self.show_range_panel()
+        self.range_panel.set_window(strain_low, strain_high)
+
+
+    def refresh_queue_window(self):
+        """
+        Refresh the queue window if it is open.
+        """
+        if self.queue_window is not None and self.queue_window.winfo_exists():
+            self.queue_window.refresh()
+
+
+    def run_queue(self):
+        """
+        Start acquiring the queued specimens one after another.
+        """
+        if self.test_queue.running:
+            return
+        if not self.test_queue.pending:
+            messagebox.showerror("Queue error", "Add specimens to the queue first")
+            return
+        if self.simulate_queue.get() and not self.testing_simulator.inputs:
+            messagebox.showerror("Queue error", "Run one simulation first to enter the material properties")
+            return
+        if self.analysis_worker is None:
+            self.analysis_worker = AnalysisWorker(GraphPlotter(self, self.analysis_filter), catalog=self.catalog,
+                                                  publisher=self.data_collector.publisher)
+            self.poll_analysis()
+        self.cyclic.set(False)
+        self.test_queue.running = True
+        self.start_next_specimen()
+
+
+    def start_next_specimen(self):
+        """
+        Start acquiring the next queued specimen, in a fresh session so the previous one can be analysed meanwhile.
+        """
+        data = self.test_queue.advance()
+        if data is None:
+            self.refresh_queue_window()
+            return
+        self.session = TestSession(data)
+        self.graph_plotter.session = None
+        self.fracture_detector.reset()
+        self.start_data_collection()
+        if self.simulate_queue.get():
+            self.testing_simulator.repeat_simulation(self.session.area, self.session.initial_length, fracture_tail=True)
+        self.refresh_queue_window()
+
+
+    def finish_specimen(self):
+        """
+        Hand the broken specimen to the analysis worker and move on to the next one.
+        """
+        if not self.test_queue.running:
+            return
+        self.data_collector.stop_collecting()
+        # Drop the unloaded samples received after the fracture
+        self.session.truncate(self.fracture_detector.fracture_index)
+        self.queue_results.append((self.test_queue.number, self.session.initial_data, None, "Analysing"))
+        # The analysis worker catalogues the specimen, Stop must not do it again
+        self.session_catalogued = True
+        self.analysis_worker.submit(self.test_queue.number, self.session)
+        self.start_next_specimen_when_idle()
+
+
+    def start_next_specimen_when_idle(self):
+        """
+        Start the next queued specimen once the simulator has sent the rest of the previous fracture tail.
+        """
+        if not self.winfo_exists() or not self.test_queue.running:
+            return
+        if self.simulate_queue.get() and self.testing_simulator.is_sending():
+            self.after(50, self.start_next_specimen_when_idle)
+            return
+        self.start_next_specimen()
+
+
+    def poll_analysis(self):
+        """
+        Apply the outcomes of the analysis worker on the Tk thread.
+        """
+        if not self.winfo_exists():
+            return
+        updated = False
+        while not self.analysis_worker.results.empty():
+            result = self.analysis_worker.results.get_nowait()
+            number = result[1]
+            if result[0] == "done":
+                entry = (number, result[2], result[3], f"Exported {len(result[4])} files")
+            else:
+                entry = (number, result[2], None, f"Failed: {result[3]}")
+            self.queue_results = [entry if item[0] == number else item for item in self.queue_results]
+            updated = True
+        if updated:
+            self.refresh_queue_window()
+        self.after(200, self.poll_analysis)
+
+
+    def show_comparison(self):
+        """
+        Open the window overlaying stored tests.
+        """
+        ComparisonView(self, self.graph_plotter.analysis_filter)
+
+
+    def show_catalog_search(self):
+        """
+        Open the test catalog search window.
+        """
+        CatalogSearch(self, self.catalog, self.graph_plotter.analysis_filter)
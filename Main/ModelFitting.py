@@ -0,0 +1,519 @@
+import time
+from abc import ABC, abstractmethod
+import numpy as np
+
+RAMBERG_OSGOOD_OFFSET = 0.002
+
+def levenberg_marquardt(model_class, x, y, mask, initial, iterations=100, tolerance=1e-10):
+    """
+    Fits a batch of curves at once with the Levenberg-Marquardt method.
+
+    All curves share one padded array, so every iteration is a handful of vectorized NumPy operations over the
+    whole batch. Each curve keeps its own damping factor and stops improving independently.
+
+    Args:
+        model_class (type): Model class providing ``evaluate`` and ``bounds``.
+        x (numpy.ndarray): Independent variable, shape (curves, points), padded.
+        y (numpy.ndarray): Measured dependent variable, same shape as ``x``.
+        mask (numpy.ndarray): 1 for real points and 0 for padding, same shape as ``x``.
+        initial (numpy.ndarray): Initial parameters, shape (curves, parameters).
+        iterations (int): Maximum number of iterations (default: 100).
+        tolerance (float): Relative cost improvement below which a curve is considered converged.
+
+    Returns:
+        tuple: Fitted parameters (curves, parameters) and root-mean-square residual per curve.
+    """
+    lower, upper = model_class.bounds
+    parameters = np.clip(np.array(initial, dtype=float), lower, upper)
+    count = len(parameters)
+    size = parameters.shape[1]
+    damping = np.full(count, 1e-3)
+    active = np.ones(count, dtype=bool)
+
+    def cost_and_jacobian(candidate):
+        prediction, jacobian = model_class.evaluate(x, candidate)
+        residual = (y - prediction) * mask
+        cost = np.einsum('bn,bn->b', residual, residual)
+        cost = np.where(np.isfinite(cost), cost, np.inf)
+        return residual, jacobian * mask[..., None], cost
+
+    residual, jacobian, cost = cost_and_jacobian(parameters)
+    identity = np.eye(size)
+
+    for _ in range(iterations):
+        normal = np.einsum('bnp,bnq->bpq', jacobian, jacobian)
+        gradient = np.einsum('bnp,bn->bp', jacobian, residual)
+        diagonal = np.einsum('bpp->bp', normal)
+        system = normal + (damping[:, None] * np.maximum(diagonal, 1e-12))[..., None] * identity
+        try:
+            step = np.linalg.solve(system, gradient[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            break
+        step = np.where(np.isfinite(step), step, 0.0)
+
+        candidate = np.clip(parameters + step, lower, upper)
+        new_residual, new_jacobian, new_cost = cost_and_jacobian(candidate)
+
+        better = active & (new_cost < cost)
+        improvement = np.where(better, (cost - new_cost) / np.maximum(cost, 1e-300), 0.0)
+
+        parameters = np.where(better[:, None], candidate, parameters)
+        residual = np.where(better[:, None], new_residual, residual)
+        jacobian = np.where(better[:, None, None], new_jacobian, jacobian)
+        cost = np.where(better, new_cost, cost)
+        damping = np.where(better, damping * 0.3, damping * 10)
+
+        active &= ~(better & (improvement < tolerance)) & (damping < 1e12)
+        if not active.any():
+            break
+
+    points = np.maximum(mask.sum(axis=1), 1)
+    return parameters, np.sqrt(cost / points)
+
+
+def pad_curves(curves):
+    """
+    Packs curves of different lengths into padded arrays.
+
+    Padding repeats the last point of each curve so the model stays finite there; the mask removes it from
+    the fit. An empty curve is padded with ones and left entirely masked out.
+
+    Args:
+        curves (list): (x, y) array pairs.
+
+    Returns:
+        tuple: Padded x, padded y and mask arrays of shape (curves, longest curve).
+    """
+    length = max(max(len(x) for x, _ in curves), 1)
+    x_padded = np.ones((len(curves), length))
+    y_padded = np.ones((len(curves), length))
+    mask = np.zeros((len(curves), length))
+    for i, (x, y) in enumerate(curves):
+        count = len(x)
+        if count == 0:
+            continue
+        x_padded[i, :count] = x
+        y_padded[i, :count] = y
+        x_padded[i, count:] = x[-1]
+        y_padded[i, count:] = y[-1]
+        mask[i, :count] = 1.0
+    return x_padded, y_padded, mask
+
+
+def hardening_region(strain, stress, properties):
+    """
+    Selects the strain-hardening part of a curve, from the yield point to the UTS.
+
+    Args:
+        strain (numpy.ndarray): Strain values.
+        stress (numpy.ndarray): Stress values in MPa.
+        properties (dict): Properties returned by ``GraphPlotter.calculate_properties``.
+
+    Returns:
+        numpy.ndarray: Boolean selection of the hardening region.
+    """
+    uts_index = int(np.argmax(stress))
+    selection = np.zeros(len(strain), dtype=bool)
+    selection[:uts_index + 1] = True
+    return selection & (strain >= properties["Yield Strain"]) & (strain > 0) & (stress > 0)
+
+
+class ConstitutiveModel(ABC):
+    """
+    Base class of the fitted constitutive models.
+
+    Subclasses describe their parameters, vectorized model and analytic Jacobian, initial guesses and the part
+    of the measured curve they are fitted to. Instances hold fitted parameters and can evaluate stress for any
+    strain, so they can drive the simulator.
+
+    Attributes:
+        parameters (numpy.ndarray): Fitted parameter values, in ``parameter_names`` order.
+        youngs_modulus (float): Young's modulus in MPa used for the elastic part of the curve.
+        uniform_strain (float): Strain at the UTS of the curve the model was fitted to, the end of its valid range.
+        rms (float): Root-mean-square residual of the fit.
+    """
+
+    name = ""
+    parameter_names = ()
+    bounds = (-np.inf, np.inf)
+
+    def __init__(self, parameters, youngs_modulus, uniform_strain, rms=0.0):
+        """
+        Initializes a model from fitted parameters.
+
+        Args:
+            parameters (array-like): Parameter values, in ``parameter_names`` order.
+            youngs_modulus (float): Young's modulus in MPa.
+            uniform_strain (float): Strain at the UTS of the fitted curve.
+            rms (float): Root-mean-square residual of the fit (default: 0).
+        """
+        self.parameters = np.asarray(parameters, dtype=float)
+        self.youngs_modulus = youngs_modulus
+        self.uniform_strain = uniform_strain
+        self.rms = rms
+
+    @staticmethod
+    @abstractmethod
+    def evaluate(x, parameters):
+        """
+        Evaluates the model and its analytic Jacobian for a batch of curves.
+
+        Args:
+            x (numpy.ndarray): Independent variable, shape (curves, points).
+            parameters (numpy.ndarray): Parameters, shape (curves, parameters).
+
+        Returns:
+            tuple: Prediction (curves, points) and Jacobian (curves, points, parameters).
+        """
+
+    @staticmethod
+    @abstractmethod
+    def select(strain, stress, properties):
+        """
+        Extracts the data the model is fitted to from a measured curve.
+
+        Args:
+            strain (numpy.ndarray): Strain values.
+            stress (numpy.ndarray): Stress values in MPa.
+            properties (dict): Properties returned by ``GraphPlotter.calculate_properties``.
+
+        Returns:
+            tuple: Independent and dependent variable arrays.
+        """
+
+    @staticmethod
+    @abstractmethod
+    def initial_guess(properties):
+        """
+        Derives starting parameters from the yield, UTS and modulus estimates.
+
+        Args:
+            properties (dict): Properties returned by ``GraphPlotter.calculate_properties``.
+
+        Returns:
+            list: Initial parameter values.
+        """
+
+    @abstractmethod
+    def stress(self, strain):
+        """
+        Evaluates stress for any strain.
+
+        Args:
+            strain (array-like): Strain values.
+
+        Returns:
+            numpy.ndarray: Stress values in MPa.
+        """
+
+    def as_dict(self):
+        """
+        Returns the parameters by name, e.g. for a material card.
+
+        Returns:
+            dict: Parameter name mapped to its value.
+        """
+        return dict(zip(self.parameter_names, self.parameters.tolist()))
+
+    def describe(self):
+        """
+        Formats the model and its parameters on one line.
+
+        Returns:
+            str: Readable description.
+        """
+        values = ", ".join(f"{name}={value:.4g}" for name, value in self.as_dict().items())
+        return f"{self.name}: {values} (rms {self.rms:.3g})"
+
+    @classmethod
+    def fit(cls, strain, stress, properties):
+        """
+        Fits the model to one measured curve.
+
+        Args:
+            strain (numpy.ndarray): Strain values.
+            stress (numpy.ndarray): Stress values in MPa.
+            properties (dict): Properties returned by ``GraphPlotter.calculate_properties``.
+
+        Returns:
+            ConstitutiveModel: The fitted model.
+        """
+        return cls.fit_batch([(strain, stress, properties)])[0]
+
+    @classmethod
+    def fit_batch(cls, curves):
+        """
+        Fits the model to many measured curves in one vectorized solve.
+
+        Args:
+            curves (list): (strain, stress, properties) tuples.
+
+        Returns:
+            list: One fitted model per curve, or None for a curve with no points in the fitted region.
+        """
+        data = [cls.select(np.asarray(strain, dtype=float), np.asarray(stress, dtype=float), properties)
+                for strain, stress, properties in curves]
+        initial = np.array([cls.initial_guess(properties) for _, _, properties in curves])
+        x, y, mask = pad_curves(data)
+        parameters, rms = levenberg_marquardt(cls, x, y, mask, initial)
+        return [cls.from_fit(row, properties, error) if len(points) else None
+                for row, (_, _, properties), error, (points, _) in zip(parameters, curves, rms, data)]
+
+    @classmethod
+    def from_fit(cls, parameters, properties, rms):
+        """
+        Builds a model instance from fitted parameters.
+
+        Args:
+            parameters (numpy.ndarray): Fitted parameters.
+            properties (dict): Properties of the fitted curve.
+            rms (float): Root-mean-square residual of the fit.
+
+        Returns:
+            ConstitutiveModel: The model instance.
+        """
+        return cls(parameters, properties["Young's Modulus (MPa)"], properties["Strain at UTS"], rms)
+
+
+class HollomonModel(ConstitutiveModel):
+    """
+    Hollomon power law ``stress = K * strain ** n``, joined to the elastic line where they intersect.
+    """
+
+    name = "Hollomon"
+    parameter_names = ("K", "n")
+    bounds = (np.array([1e-6, 1e-4]), np.array([np.inf, 1.0]))
+
+    @staticmethod
+    def evaluate(strain, parameters):
+        """
+        Evaluates the model and its Jacobian for a batch of curves.
+
+        Args:
+            strain (numpy.ndarray): Strain values, shape (curves, points).
+            parameters (numpy.ndarray): Parameters, shape (curves, 2).
+
+        Returns:
+            tuple: Stress (curves, points) and Jacobian (curves, points, 2).
+        """
+        k = parameters[:, 0:1]
+        n = parameters[:, 1:2]
+        power = strain ** n
+        stress = k * power
+        return stress, np.stack([power, stress * np.log(strain)], axis=-1)
+
+    @staticmethod
+    def select(strain, stress, properties):
+        selection = hardening_region(strain, stress, properties)
+        return strain[selection], stress[selection]
+
+    @staticmethod
+    def initial_guess(properties):
+        # Considere: the hardening exponent equals the uniform strain at the UTS
+        n = min(max(properties["Strain at UTS"], 0.02), 0.6)
+        k = properties["Ultimate Tensile Strength (MPa)"] / properties["Strain at UTS"] ** n
+        return [k, n]
+
+    def stress(self, strain):
+        """
+        Evaluates stress for any strain.
+
+        Args:
+            strain (array-like): Strain values.
+
+        Returns:
+            numpy.ndarray: Stress values in MPa.
+        """
+        strain = np.asarray(strain, dtype=float)
+        k, n = self.parameters
+        plastic = k * np.maximum(strain, 0) ** n
+        return np.minimum(self.youngs_modulus * strain, plastic)
+
+
+class VoceModel(ConstitutiveModel):
+    """
+    Voce saturation law ``stress = s0 + Q * (1 - exp(-b * (strain - yield strain)))`` above the yield strain.
+
+    Attributes:
+        yield_strain (float): Strain at which plastic flow starts, taken from the yield estimate.
+    """
+
+    name = "Voce"
+    parameter_names = ("s0", "Q", "b")
+    bounds = (np.array([0.0, 0.0, 1e-6]), np.array([np.inf, np.inf, 1e6]))
+
+    def __init__(self, parameters, youngs_modulus, uniform_strain, rms=0.0, yield_strain=0.0):
+        super().__init__(parameters, youngs_modulus, uniform_strain, rms)
+        self.yield_strain = yield_strain
+
+    @staticmethod
+    def evaluate(plastic_strain, parameters):
+        """
+        Evaluates the model and its Jacobian for a batch of curves.
+
+        Args:
+            plastic_strain (numpy.ndarray): Strain beyond the yield strain, shape (curves, points).
+            parameters (numpy.ndarray): Parameters, shape (curves, 3).
+
+        Returns:
+            tuple: Stress (curves, points) and Jacobian (curves, points, 3).
+        """
+        s0 = parameters[:, 0:1]
+        q = parameters[:, 1:2]
+        b = parameters[:, 2:3]
+        decay = np.exp(-b * plastic_strain)
+        stress = s0 + q * (1 - decay)
+        jacobian = np.stack([np.ones_like(stress), 1 - decay, q * plastic_strain * decay], axis=-1)
+        return stress, jacobian
+
+    @staticmethod
+    def select(strain, stress, properties):
+        selection = hardening_region(strain, stress, properties)
+        return strain[selection] - properties["Yield Strain"], stress[selection]
+
+    @staticmethod
+    def initial_guess(properties):
+        yield_stress = properties["Yield Stress (MPa)"]
+        hardening_strain = max(properties["Strain at UTS"] - properties["Yield Strain"], 1e-6)
+        # Saturate to about 95 % of the UTS by the uniform strain
+        return [yield_stress, max(properties["Ultimate Tensile Strength (MPa)"] - yield_stress, 0.0), 3 / hardening_strain]
+
+    @classmethod
+    def from_fit(cls, parameters, properties, rms):
+        return cls(parameters, properties["Young's Modulus (MPa)"], properties["Strain at UTS"], rms,
+                   properties["Yield Strain"])
+
+    def stress(self, strain):
+        """
+        Evaluates stress for any strain.
+
+        Args:
+            strain (array-like): Strain values.
+
+        Returns:
+            numpy.ndarray: Stress values in MPa.
+        """
+        strain = np.asarray(strain, dtype=float)
+        s0, q, b = self.parameters
+        plastic = s0 + q * (1 - np.exp(-b * np.maximum(strain - self.yield_strain, 0)))
+        return np.minimum(self.youngs_modulus * strain, plastic)
+
+
+class RambergOsgoodModel(ConstitutiveModel):
+    """
+    Ramberg-Osgood law ``strain = stress / E + 0.002 * (stress / s0) ** n``.
+
+    E is taken from the modulus estimate and the plastic part ``strain - stress / E`` is fitted as a function
+    of stress, which keeps the fit from trading the modulus against the hardening exponent.
+    """
+
+    name = "Ramberg-Osgood"
+    parameter_names = ("s0", "n")
+    bounds = (np.array([1e-6, 1.0]), np.array([np.inf, 100.0]))
+
+    @staticmethod
+    def evaluate(stress, parameters):
+        """
+        Evaluates the plastic strain and its Jacobian for a batch of curves.
+
+        Args:
+            stress (numpy.ndarray): Stress values in MPa, shape (curves, points).
+            parameters (numpy.ndarray): Parameters, shape (curves, 2).
+
+        Returns:
+            tuple: Plastic strain (curves, points) and Jacobian (curves, points, 2).
+        """
+        s0 = parameters[:, 0:1]
+        n = parameters[:, 1:2]
+        ratio = stress / s0
+        plastic = RAMBERG_OSGOOD_OFFSET * ratio ** n
+        return plastic, np.stack([-n * plastic / s0, plastic * np.log(ratio)], axis=-1)
+
+    @staticmethod
+    def select(strain, stress, properties):
+        uts_index = int(np.argmax(stress))
+        selection = np.zeros(len(strain), dtype=bool)
+        selection[:uts_index + 1] = True
+        selection &= stress > 0
+        return stress[selection], strain[selection] - stress[selection] / properties["Young's Modulus (MPa)"]
+
+    @staticmethod
+    def initial_guess(properties):
+        modulus = properties["Young's Modulus (MPa)"]
+        yield_stress = properties["Yield Stress (MPa)"]
+        ultimate_stress = properties["Ultimate Tensile Strength (MPa)"]
+        plastic_at_uts = properties["Strain at UTS"] - ultimate_stress / modulus
+        n = 10.0
+        if plastic_at_uts > 0 and ultimate_stress > yield_stress:
+            n = np.log(plastic_at_uts / RAMBERG_OSGOOD_OFFSET) / np.log(ultimate_stress / yield_stress)
+        return [yield_stress, min(max(n, 1.0), 100.0)]
+
+    def stress(self, strain):
+        """
+        Evaluates stress for any strain by inverting the monotonic strain-stress relation on a dense grid.
+
+        Args:
+            strain (array-like): Strain values.
+
+        Returns:
+            numpy.ndarray: Stress values in MPa.
+        """
+        strain = np.asarray(strain, dtype=float)
+        s0, n = self.parameters
+        grid = np.linspace(0, s0 * 3.0, 4096)
+        grid_strain = grid / self.youngs_modulus + RAMBERG_OSGOOD_OFFSET * (grid / s0) ** n
+        return np.interp(strain, grid_strain, grid)
+
+
+MODELS = (RambergOsgoodModel, HollomonModel, VoceModel)
+
+
+def fit_models_batch(curves):
+    """
+    Fits every constitutive model to many measured curves, with one vectorized solve per model.
+
+    Args:
+        curves (list): (strain, stress, properties) tuples, properties as returned by
+            ``GraphPlotter.calculate_properties``.
+
+    Returns:
+        tuple: For every curve, its fitted models sorted by stress residual (best first), leaving out the models
+        it had no points to fit, and the total fitting time in seconds.
+    """
+    curves = [(np.asarray(strain, dtype=float), np.asarray(stress, dtype=float), properties)
+              for strain, stress, properties in curves]
+    started = time.perf_counter()
+    fits = [model_class.fit_batch(curves) for model_class in MODELS]
+    elapsed = time.perf_counter() - started
+
+    ranked = []
+    for (strain, stress, properties), models in zip(curves, zip(*fits)):
+        # Compare on the same footing: stress residual over the hardening region
+        selection = hardening_region(strain, stress, properties)
+        def stress_rms(model):
+            if not selection.any():
+                return np.inf
+            return float(np.sqrt(np.mean((model.stress(strain[selection]) - stress[selection]) ** 2)))
+        ranked.append(sorted((model for model in models if model is not None), key=stress_rms))
+    return ranked, elapsed
+
+
+def fit_all_models(strain, stress, properties):
+    """
+    Fits every constitutive model to one measured curve.
+
+    Args:
+        strain (numpy.ndarray): Strain values.
+        stress (numpy.ndarray): Stress values in MPa.
+        properties (dict): Properties returned by ``GraphPlotter.calculate_properties``.
+
+    Returns:
+        tuple: Fitted models sorted by stress residual (best first), and the total fitting time in seconds.
+
+    Raises:
+        ValueError: If no model has any point of the curve to fit.
+    """
+    ranked, elapsed = fit_models_batch([(strain, stress, properties)])
+    if not ranked[0]:
+        raise ValueError("the curve has no hardening region")
+    return ranked[0], elapsed
@@ -0,0 +1,213 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from functools import wraps
+
+TRACE_ENV_VARIABLE = "STRESS_STRAIN_TRACE"
+DEFAULT_TRACE_FILE = "stress_strain_trace.json"
+
+class NullSpan:
+    """
+    Context manager returned when tracing is disabled. Entering and leaving it does nothing.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    """
+    Context manager timing one execution of a hot-path stage.
+
+    Attributes:
+        tracer (Tracer): Tracer that records the span.
+        name (str): Stage name.
+        start (int): Start timestamp in nanoseconds.
+    """
+
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class Tracer:
+    """
+    Collects timing spans around the acquisition, analysis and plotting hot paths.
+
+    Tracing is off by default. When off, ``span`` returns a shared no-op context manager and ``traced``
+    functions call straight through, so the instrumentation costs a single attribute check.
+
+    Attributes:
+        enabled (bool): Whether spans are recorded.
+        output_path (str or None): File the Chrome trace is written to on export.
+        events (collections.deque): Bounded buffer of recorded spans as (name, thread id, start ns, end ns).
+        stats (dict): Per-stage [count, total ns, last ns, max ns] used for the live latency overlay.
+        origin (int): Timestamp in nanoseconds that trace times are relative to.
+        lock (threading.Lock): Lock protecting the per-stage statistics.
+    """
+
+    def __init__(self, max_events=500000):
+        """
+        Initializes a disabled tracer.
+
+        Args:
+            max_events (int): Maximum number of spans kept for export (default: 500000).
+        """
+        self.enabled = False
+        self.output_path = None
+        self.events = deque(maxlen=max_events)
+        self.stats = {}
+        self.origin = time.perf_counter_ns()
+        self.lock = threading.Lock()
+
+    def enable(self, output_path=None):
+        """
+        Starts recording spans.
+
+        Args:
+            output_path (str or None): File the Chrome trace is written to by ``export_chrome_trace``.
+        """
+        self.output_path = output_path
+        self.enabled = True
+
+    def disable(self):
+        """Stops recording spans."""
+        self.enabled = False
+
+    def span(self, name):
+        """
+        Returns a context manager timing the enclosed block.
+
+        Args:
+            name (str): Stage name.
+
+        Returns:
+            Span or NullSpan: Timing context manager, or a no-op one when tracing is disabled.
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name)
+
+    def record(self, name, start, end):
+        """
+        Stores a finished span.
+
+        Args:
+            name (str): Stage name.
+            start (int): Start timestamp in nanoseconds.
+            end (int): End timestamp in nanoseconds.
+        """
+        self.events.append((name, threading.get_ident(), start, end))
+        duration = end - start
+        with self.lock:
+            stage = self.stats.get(name)
+            if stage is None:
+                self.stats[name] = [1, duration, duration, duration]
+            else:
+                stage[0] += 1
+                stage[1] += duration
+                stage[2] = duration
+                stage[3] = max(stage[3], duration)
+
+    def stage_summary(self):
+        """
+        Summarizes the recorded latency of every stage.
+
+        Returns:
+            dict: Stage name mapped to a dict with count, last, mean and max latency in milliseconds.
+        """
+        with self.lock:
+            return {
+                name: {
+                    "count": count,
+                    "last_ms": last / 1e6,
+                    "mean_ms": total / count / 1e6,
+                    "max_ms": peak / 1e6,
+                }
+                for name, (count, total, last, peak) in self.stats.items()
+            }
+
+    def export_chrome_trace(self, path=None):
+        """
+        Writes the recorded spans as a Chrome trace / Perfetto compatible JSON file.
+
+        Args:
+            path (str or None): Output file (default: the path given to ``enable``).
+
+        Returns:
+            str or None: Path of the written file, or None if no path was configured.
+        """
+        path = path or self.output_path
+        if not path:
+            return None
+
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": name,
+                "cat": "stress-strain",
+                "ph": "X",
+                "ts": (start - self.origin) / 1e3,
+                "dur": (end - start) / 1e3,
+                "pid": pid,
+                "tid": thread_id,
+            }
+            for name, thread_id, start, end in list(self.events)
+        ]
+        with open(path, "w") as trace_file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, trace_file)
+        return path
+
+
+tracer = Tracer()
+
+# Values of the environment variable that leave tracing off rather than naming a trace file
+TRACE_DISABLED_VALUES = ("", "0", "false", "no", "off")
+
+# Tracing can be switched on without code changes, e.g. STRESS_STRAIN_TRACE=trace.json
+_trace_setting = os.environ.get(TRACE_ENV_VARIABLE, "").strip()
+if _trace_setting.lower() not in TRACE_DISABLED_VALUES:
+    tracer.enable(DEFAULT_TRACE_FILE if _trace_setting.lower() in ("1", "true", "yes", "on") else _trace_setting)
+
+
+def traced(name):
+    """
+    Decorator timing every call of a function as a named stage.
+
+    Args:
+        name (str): Stage name.
+
+    Returns:
+        function: Decorator wrapping the function.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                tracer.record(name, start, time.perf_counter_ns())
+        return wrapper
+    return decorator
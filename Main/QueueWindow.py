@@ -0,0 +1,127 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from .InputFrame import InputFrame, specimen_data
+
+class QueueWindow(tk.Toplevel):
+    """
+    Window for pre-entering a batch of specimens and following their acquisition and analysis.
+
+    Attributes:
+        main_frame (MainFrame): Frame running the queue.
+        input_frame (InputFrame): Specimen geometry entry, adding to the queue on submit.
+        pending_table (ttk.Treeview): Specimens waiting to be tested.
+        results_table (ttk.Treeview): Tested specimens and their analysis results.
+        status (tk.StringVar): Status line text.
+    """
+
+    def __init__(self, parent, main_frame):
+        """
+        Initializes the queue window.
+
+        Args:
+            parent (tk.Tk or tk.Frame): Parent tkinter widget.
+            main_frame (MainFrame): Frame owning the test queue and running it.
+        """
+        super().__init__(parent)
+        self.title("Test Queue")
+        self.main_frame = main_frame
+        self.status = tk.StringVar(value="")
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        """
+        Create the specimen entry, the pending and results tables and the control buttons.
+        """
+        self.input_frame = InputFrame(self, self.add_specimen)
+        self.input_frame.submit_button.config(text="Add to queue")
+        self.input_frame.grid(row=0, column=0, padx=10, pady=10, sticky='nw')
+
+        self.pending_table = ttk.Treeview(self, columns=("number", "geometry"), show="headings", height=8)
+        self.pending_table.heading("number", text="#")
+        self.pending_table.heading("geometry", text="Pending specimen")
+        self.pending_table.column("number", width=40)
+        self.pending_table.column("geometry", width=300)
+        self.pending_table.grid(row=0, column=1, padx=10, pady=10, sticky='nsew')
+
+        columns = (("number", "#", 40), ("geometry", "Specimen", 220), ("yield", "Yield (MPa)", 90),
+                   ("uts", "UTS (MPa)", 90), ("modulus", "E (MPa)", 90), ("status", "Status", 200))
+        self.results_table = ttk.Treeview(self, columns=[name for name, _, _ in columns], show="headings", height=8)
+        for name, heading, width in columns:
+            self.results_table.heading(name, text=heading)
+            self.results_table.column(name, width=width)
+        self.results_table.grid(row=1, column=0, columnspan=2, padx=10, pady=5, sticky='nsew')
+
+        button_area = tk.Frame(self)
+        button_area.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky='ew')
+        tk.Button(button_area, text="Remove", command=self.remove_selected, width=15).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_area, text="Run queue", command=self.main_frame.run_queue, width=15).pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(button_area, text="Simulate each specimen",
+                       variable=self.main_frame.simulate_queue).pack(side=tk.LEFT, padx=5)
+        tk.Label(button_area, textvariable=self.status).pack(side=tk.LEFT, padx=10)
+
+    @staticmethod
+    def describe(data):
+        """
+        Formats a specimen geometry on one line.
+
+        Args:
+            data (dict): Specimen geometry.
+
+        Returns:
+            str: Readable geometry.
+        """
+        if data["shape"] == "rounded":
+            size = f"d={data['diameter']} mm"
+        else:
+            size = f"{data['width']} x {data['height']} mm"
+        return f"{data['shape']} {size}, L0={data['initial_length']} mm"
+
+    def add_specimen(self, shape, diameter, width, height, initial_length):
+        """
+        Callback of the specimen entry: appends the specimen to the queue.
+        """
+        self.main_frame.test_queue.add(specimen_data(shape, diameter, width, height, initial_length))
+        self.refresh()
+
+    def remove_selected(self):
+        """
+        Remove the selected pending specimens from the queue.
+        """
+        positions = sorted((self.pending_table.index(item) for item in self.pending_table.selection()), reverse=True)
+        for position in positions:
+            self.main_frame.test_queue.remove(position)
+        self.refresh()
+
+    def refresh(self):
+        """
+        Refresh both tables and the status line from the queue state.
+        """
+        if not self.winfo_exists():
+            return
+        test_queue = self.main_frame.test_queue
+        self.pending_table.delete(*self.pending_table.get_children())
+        for offset, data in enumerate(test_queue.pending):
+            self.pending_table.insert("", tk.END, values=(test_queue.number + offset + 1, self.describe(data)))
+
+        self.results_table.delete(*self.results_table.get_children())
+        for number, data, properties, status in self.main_frame.queue_results:
+            values = ("", "", "")
+            if properties:
+                values = tuple(f"{properties[key]:.2f}" for key in
+                               ("Yield Stress (MPa)", "Ultimate Tensile Strength (MPa)", "Young's Modulus (MPa)"))
+            self.results_table.insert("", tk.END, values=(number, self.describe(data)) + values + (status,))
+
+        if test_queue.running:
+            self.status.set(f"Testing specimen {test_queue.number}, {len(test_queue)} waiting")
+        else:
+            self.status.set(f"{len(test_queue)} specimens waiting")
+
+    def show_error(self, message):
+        """
+        Show an error raised while running the queue.
+
+        Args:
+            message (str): Error message.
+        """
+        messagebox.showerror("Queue error", message, parent=self)
@@ -0,0 +1,295 @@
+import numpy as np
+
+class RangeIndex:
+    """
+    Cumulative index over the samples of a test, answering range queries without rescanning the samples.
+
+    For every sample it keeps prefix sums of the trapezoidal work under the stress-strain and force-displacement
+    curves and of stress and squared stress, so work, mean and standard deviation of any sample range are
+    differences of two entries. The stress sums are taken relative to the first sample, which keeps the
+    variance from cancelling out when the spread is small compared to the stress itself.
+
+    Peak stress over a range comes from a sparse table of maxima, where level k holds the maximum of the 2^k
+    samples starting at each position; any range is covered by two overlapping entries of one level. The
+    table takes log2(n) columns, so it is only built by ``build_levels`` from the stress of the indexed samples
+    when peaks are first needed, and from then on completed by every appended sample in O(log n).
+
+    The index is not thread-safe, its owner serializes appends and queries (see ``TestSession``).
+
+    Attributes:
+        size (int): Number of indexed samples.
+        capacity (int): Number of samples the arrays can hold before growing.
+        work (numpy.ndarray): Cumulative stress-strain work in MJ/m^3 (MPa times strain).
+        force_work (numpy.ndarray): Cumulative force-displacement work in mJ (N times mm).
+        stress_sum, stress_square_sum (numpy.ndarray): Prefix sums of stress and squared stress relative to
+            ``shift``, with a leading 0.
+        shift (float): Stress of the first sample, subtracted before summing.
+        strain_reach (numpy.ndarray): Running maximum of strain, used to locate strain windows by binary search.
+        levels (list or None): Sparse table levels of stress maxima, level 0 being the stress itself, None
+            until built.
+        previous (tuple or None): Stress, strain, force and displacement of the last indexed sample.
+    """
+
+    def __init__(self, capacity=4096):
+        """
+        Initializes an empty index.
+
+        Args:
+            capacity (int): Initial number of samples the arrays can hold (default: 4096).
+        """
+        self.size = 0
+        self.levels = None
+        self.allocate(capacity)
+        self.clear()
+
+    def allocate(self, capacity):
+        """
+        Allocates the arrays, keeping the indexed samples.
+
+        Args:
+            capacity (int): Number of samples the new arrays can hold.
+        """
+        size = self.size
+        for name, extra in (("work", 0), ("force_work", 0), ("strain_reach", 0),
+                            ("stress_sum", 1), ("stress_square_sum", 1)):
+            column = np.zeros(capacity + extra)
+            if size:
+                column[:size + extra] = getattr(self, name)[:size + extra]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+        if self.levels is not None:
+            # Level k exists once the index can hold 2^k samples. Entries of a new level all end after the
+            # current samples, so they are completed by later appends like any other.
+            levels = []
+            for level in range(max(capacity.bit_length(), 1)):
+                column = np.full(capacity, -np.inf)
+                if level < len(self.levels) and size:
+                    column[:size] = self.levels[level][:size]
+                levels.append(column)
+            self.levels = levels
+
+    def clear(self):
+        """Drops all indexed samples, and the sparse table until it is built again."""
+        self.size = 0
+        self.stress_sum[0] = 0.0
+        self.stress_square_sum[0] = 0.0
+        self.shift = 0.0
+        self.previous = None
+        self.levels = None
+
+    def append(self, stress, strain, force, displacement):
+        """
+        Indexes one sample.
+
+        Args:
+            stress (float): Stress in MPa.
+            strain (float): Strain.
+            force (float): Force in Newtons.
+            displacement (float): Displacement in millimeters.
+        """
+        size = self.size
+        if size == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        if self.previous is None:
+            self.work[0] = 0.0
+            self.force_work[0] = 0.0
+            self.strain_reach[0] = strain
+            self.shift = stress
+        else:
+            previous_stress, previous_strain, previous_force, previous_displacement = self.previous
+            self.work[size] = self.work[size - 1] + 0.5 * (stress + previous_stress) * (strain - previous_strain)
+            self.force_work[size] = (self.force_work[size - 1]
+                                     + 0.5 * (force + previous_force) * (displacement - previous_displacement))
+            self.strain_reach[size] = max(self.strain_reach[size - 1], strain)
+        self.previous = (stress, strain, force, displacement)
+
+        shifted = stress - self.shift
+        self.stress_sum[size + 1] = self.stress_sum[size] + shifted
+        self.stress_square_sum[size + 1] = self.stress_square_sum[size] + shifted * shifted
+        self.size = size + 1
+
+        levels = self.levels
+        if levels is not None:
+            levels[0][size] = stress
+            # Complete the entry of every level whose window ends at this sample
+            span = 1
+            for level in range(1, len(levels)):
+                span *= 2
+                start = size - span + 1
+                if start < 0:
+                    break
+                levels[level][start] = max(levels[level - 1][start], levels[level - 1][start + span // 2])
+
+    def extend(self, stress, strain, force, displacement):
+        """
+        Indexes a block of samples at once with vectorized prefix sums and level merges.
+
+        Args:
+            stress, strain, force, displacement (array-like): Sample columns.
+        """
+        stress = np.asarray(stress, dtype=float)
+        count = len(stress)
+        if count == 0:
+            return
+        strain = np.asarray(strain, dtype=float)
+        force = np.asarray(force, dtype=float)
+        displacement = np.asarray(displacement, dtype=float)
+
+        start = self.size
+        end = start + count
+        if end > self.capacity:
+            self.allocate(max(end, self.capacity * 2))
+
+        if self.previous is None:
+            self.shift = float(stress[0])
+        # Prepend the last indexed sample (or repeat the first one) so every new sample closes a trapezoid
+        previous = self.previous or (stress[0], strain[0], force[0], displacement[0])
+        stress_all, strain_all, force_all, displacement_all = (
+            np.concatenate([[last], column]) for last, column in zip(previous, (stress, strain, force, displacement)))
+        base_work = self.work[start - 1] if start else 0.0
+        base_force_work = self.force_work[start - 1] if start else 0.0
+        reach = max(self.strain_reach[start - 1], strain[0]) if start else strain[0]
+
+        self.work[start:end] = base_work + np.cumsum(0.5 * (stress_all[1:] + stress_all[:-1]) * np.diff(strain_all))
+        self.force_work[start:end] = base_force_work + np.cumsum(
+            0.5 * (force_all[1:] + force_all[:-1]) * np.diff(displacement_all))
+        self.strain_reach[start:end] = np.maximum.accumulate(np.concatenate([[reach], strain[1:]]))
+        shifted = stress - self.shift
+        self.stress_sum[start + 1:end + 1] = self.stress_sum[start] + np.cumsum(shifted)
+        self.stress_square_sum[start + 1:end + 1] = self.stress_square_sum[start] + np.cumsum(shifted * shifted)
+
+        self.previous = (stress[-1], strain[-1], force[-1], displacement[-1])
+        self.size = end
+        if self.levels is not None:
+            self.levels[0][start:end] = stress
+            self.merge_levels(start, end)
+
+    def merge_levels(self, start, end):
+        """
+        Completes the sparse table entries whose window ends within a block of samples.
+
+        Args:
+            start (int): First sample of the block.
+            end (int): Sample after the last one of the block.
+        """
+        levels = self.levels
+        span = 1
+        for level in range(1, len(levels)):
+            half = span
+            span *= 2
+            first = max(start - span + 1, 0)
+            last = end - span + 1
+            if last <= first:
+                break
+            levels[level][first:last] = np.maximum(levels[level - 1][first:last],
+                                                   levels[level - 1][first + half:last + half])
+
+    def build_levels(self, stress):
+        """
+        Builds the sparse table over the samples indexed so far.
+
+        Args:
+            stress (array-like): Stress of the indexed samples in MPa.
+        """
+        levels = [np.full(self.capacity, -np.inf) for _ in range(max(self.capacity.bit_length(), 1))]
+        levels[0][:self.size] = stress
+        self.levels = levels
+        self.merge_levels(0, self.size)
+
+    def strain_window(self, low, high):
+        """
+        Locates the samples of a strain window with a binary search over the running maximum of strain.
+
+        Args:
+            low (float): Lowest strain.
+            high (float): Highest strain.
+
+        Returns:
+            tuple: First and last sample positions of the window, or (None, None) if it holds no samples.
+        """
+        reach = self.strain_reach[:self.size]
+        first = int(np.searchsorted(reach, low, side="left"))
+        last = int(np.searchsorted(reach, high, side="right")) - 1
+        if first > last or first >= self.size:
+            return None, None
+        return first, last
+
+    def peak(self, first, last):
+        """
+        Returns the highest stress of a sample range in O(1), once the sparse table is built.
+
+        Args:
+            first (int): First sample position.
+            last (int): Last sample position, included.
+
+        Returns:
+            float: Peak stress in MPa.
+        """
+        level = int(last - first + 1).bit_length() - 1
+        span = 1 << level
+        return float(max(self.levels[level][first], self.levels[level][last - span + 1]))
+
+    def query(self, first, last):
+        """
+        Computes the statistics of a sample range in O(1).
+
+        Args:
+            first (int): First sample position.
+            last (int): Last sample position, included.
+
+        Returns:
+            dict: Work, mean, standard deviation and, once the sparse table is built, peak of stress over the range.
+        """
+        count = last - first + 1
+        shifted_sum = self.stress_sum[last + 1] - self.stress_sum[first]
+        square_sum = self.stress_square_sum[last + 1] - self.stress_square_sum[first]
+        variance = max(square_sum - shifted_sum * shifted_sum / count, 0.0) / count if count > 1 else 0.0
+        results = {
+            "Samples": count,
+            "Work (MJ/m^3)": float(self.work[last] - self.work[first]),
+            "Work (J)": float(self.force_work[last] - self.force_work[first]) / 1000,
+            "Mean Stress (MPa)": float(self.shift + shifted_sum / count),
+            "Stress Std (MPa)": float(np.sqrt(variance)),
+        }
+        if self.levels is not None:
+            results["Peak Stress (MPa)"] = self.peak(first, last)
+        return results
+
+    def query_strain(self, low, high):
+        """
+        Computes the statistics of a strain window.
+
+        Args:
+            low (float): Lowest strain.
+            high (float): Highest strain.
+
+        Returns:
+            dict or None: Statistics as returned by ``query``, or None if the window holds no samples.
+        """
+        first, last = self.strain_window(low, high)
+        if first is None:
+            return None
+        return self.query(first, last)
+
+    def summary(self, yield_strain=None):
+        """
+        Computes whole-test energy properties.
+
+        Args:
+            yield_strain (float or None): Yield strain bounding the resilience, if known.
+
+        Returns:
+            dict: Toughness, work to fracture and, with a yield strain, resilience.
+        """
+        if self.size < 2:
+            return {}
+        results = {
+            "Toughness (MJ/m^3)": float(self.work[self.size - 1]),
+            "Work to Fracture (J)": float(self.force_work[self.size - 1]) / 1000,
+        }
+        if yield_strain is not None:
+            _, last = self.strain_window(-np.inf, yield_strain)
+            results["Resilience (MJ/m^3)"] = float(self.work[last]) if last is not None else 0.0
+        return results
@@ -0,0 +1,156 @@
+import tkinter as tk
+from tkinter import ttk
+from .GraphPlotter import GraphPlotter
+
+WINDOW_KEYS = ("Samples", "Work (MJ/m^3)", "Work (J)", "Mean Stress (MPa)", "Stress Std (MPa)", "Peak Stress (MPa)")
+SUMMARY_KEYS = ("Toughness (MJ/m^3)", "Resilience (MJ/m^3)", "Work to Fracture (J)")
+
+class RangePanel(tk.Toplevel):
+    """
+    Window showing the energy and stress statistics of a strain window of the current test, next to the
+    toughness, resilience and work to fracture of the whole test.
+
+    Values come from the range index of the session, built when the window first queries it, so they refresh
+    in constant time while the test runs. The window is set by typing it or by dragging over the stress-strain
+    plot.
+
+    Attributes:
+        main_frame (MainFrame): Frame whose current session is queried.
+        analyser (GraphPlotter): Plotter of its own calculating the yield strain, leaving the session of the
+            main plot alone.
+        strain_low_entry, strain_high_entry (tk.Entry): Strain window.
+        table (ttk.Treeview): Quantity and value of every result.
+        status (tk.StringVar): Status line text.
+        yield_strain (float or None): Yield strain bounding the resilience, from the last property calculation.
+        yield_size (int): Number of samples the yield strain was calculated from.
+        refresh_interval (int): Milliseconds between refreshes.
+    """
+
+    def __init__(self, parent, main_frame, refresh_interval=1000):
+        """
+        Initializes the window and starts the periodic refresh.
+
+        Args:
+            parent (tk.Tk or tk.Frame): Parent tkinter widget.
+            main_frame (MainFrame): Frame whose current session is queried.
+            refresh_interval (int): Milliseconds between refreshes (default: 1000).
+        """
+        super().__init__(parent)
+        self.title("Range Results")
+        self.main_frame = main_frame
+        self.refresh_interval = refresh_interval
+        self.yield_strain = None
+        self.yield_size = 0
+        self.analyser = GraphPlotter(self, main_frame.graph_plotter.analysis_filter)
+        self.status = tk.StringVar(value="")
+        self.create_widgets()
+        self.update_yield()
+        self.refresh()
+
+    def create_widgets(self):
+        """
+        Create the strain window entries, the results table and the buttons.
+        """
+        window_area = tk.Frame(self)
+        window_area.grid(row=0, column=0, padx=10, pady=10, sticky='w')
+        tk.Label(window_area, text="Strain from:").grid(row=0, column=0, padx=5, sticky='w')
+        self.strain_low_entry = tk.Entry(window_area, width=12)
+        self.strain_low_entry.grid(row=0, column=1, padx=5)
+        tk.Label(window_area, text="to:").grid(row=0, column=2, padx=5, sticky='w')
+        self.strain_high_entry = tk.Entry(window_area, width=12)
+        self.strain_high_entry.grid(row=0, column=3, padx=5)
+        tk.Button(window_area, text="Apply", command=self.apply, width=15).grid(row=0, column=4, padx=10)
+
+        self.table = ttk.Treeview(self, columns=("quantity", "value"), show="headings",
+                                  height=len(WINDOW_KEYS) + len(SUMMARY_KEYS))
+        self.table.heading("quantity", text="Quantity")
+        self.table.heading("value", text="Value")
+        self.table.column("quantity", width=200)
+        self.table.column("value", width=140)
+        self.table.grid(row=1, column=0, padx=10, pady=5, sticky='nsew')
+
+        tk.Label(self, textvariable=self.status, anchor='w').grid(row=2, column=0, padx=10, pady=(0, 10), sticky='ew')
+
+    def set_window(self, strain_low, strain_high):
+        """
+        Show the statistics of a strain window, e.g. one dragged over the stress-strain plot.
+
+        Args:
+            strain_low (float): Lowest strain.
+            strain_high (float): Highest strain.
+        """
+        for entry, value in ((self.strain_low_entry, strain_low), (self.strain_high_entry, strain_high)):
+            entry.delete(0, tk.END)
+            entry.insert(0, f"{value:.6g}")
+        self.refresh(reschedule=False)
+
+    def apply(self):
+        """
+        Recalculate the yield strain of the current test and show the statistics of the entered window.
+        """
+        self.update_yield()
+        self.refresh(reschedule=False)
+
+    def update_yield(self):
+        """
+        Calculate the yield strain bounding the resilience, if the session has grown since the last calculation.
+
+        This is the only full pass over the samples, so it runs on demand rather than on every refresh.
+        """
+        session = self.main_frame.session
+        if session is None or len(session) < 2 or len(session) == self.yield_size:
+            return
+        self.analyser.session = session
+        try:
+            properties = self.analyser.calculate_properties(*self.analyser.get_analysis_series())
+        except (ValueError, IndexError):
+            return
+        self.yield_strain = properties["Yield Strain"]
+        self.yield_size = len(session)
+
+    def read_window(self):
+        """
+        Read the strain window entries.
+
+        Returns:
+            tuple or None: Lowest and highest strain, or None if the entries are empty or invalid.
+        """
+        try:
+            low = float(self.strain_low_entry.get())
+            high = float(self.strain_high_entry.get())
+        except ValueError:
+            return None
+        return min(low, high), max(low, high)
+
+    def refresh(self, reschedule=True):
+        """
+        Refresh the results from the range index of the current session and schedule the next refresh.
+
+        Args:
+            reschedule (bool): Whether to schedule the next periodic refresh (default: True).
+        """
+        if not self.winfo_exists():
+            return
+        self.table.delete(*self.table.get_children())
+        session = self.main_frame.session
+
+        if session is None or len(session) < 2:
+            self.status.set("No samples yet")
+        else:
+            window = self.read_window()
+            results = session.query_strain(*window) if window is not None else None
+            if results is not None:
+                for key in WINDOW_KEYS:
+                    value = results[key]
+                    self.table.insert("", tk.END, values=(key, value if key == "Samples" else f"{value:.4f}"))
+                self.status.set(f"Strain {window[0]:.6g} to {window[1]:.6g}, {len(session)} samples in the test")
+            else:
+                self.status.set("Enter or drag a strain window" if window is None else "No samples in the window")
+
+            summary = session.range_summary(self.yield_strain)
+            for key in SUMMARY_KEYS:
+                if key in summary:
+                    self.table.insert("", tk.END, values=(key, f"{summary[key]:.4f}"))
+
+        if reschedule:
+            self.after(self.refresh_interval, self.refresh)
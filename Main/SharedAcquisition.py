@@ -0,0 +1,312 @@
+import time
+import threading
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+DEFAULT_RING_CAPACITY = 1 << 16
+
+# The header holds the write counter, padded to a cache line so the columns start aligned
+HEADER_SIZE = 64
+COLUMN_DTYPES = (("force", np.float64), ("displacement", np.float64), ("index", np.int64))
+
+
+class SampleRing:
+    """
+    Ring of sample columns in shared memory, written by one process and read zero-copy by another.
+
+    The writer stores a sample in its slot first and only then advances the write counter, so a reader that
+    sees the counter also sees every sample before it. Readers keep their own position and never block the
+    writer; a reader that falls more than ``capacity`` samples behind skips the overwritten ones.
+
+    Attributes:
+        capacity (int): Number of sample slots.
+        memory (shared_memory.SharedMemory): Shared block holding the header and the columns.
+        owner (bool): True in the process that created the block and unlinks it on close.
+        counter (numpy.ndarray): One-element view of the total number of samples written.
+        force, displacement, index (numpy.ndarray): Column views; index is -1 for samples of an uncompressed stream.
+    """
+
+    def __init__(self, capacity=DEFAULT_RING_CAPACITY, name=None):
+        """
+        Creates a new ring, or attaches to an existing one by name.
+
+        Args:
+            capacity (int): Number of sample slots (default: 65536).
+            name (str or None): Shared memory name of an existing ring, or None to create one.
+        """
+        self.capacity = capacity
+        size = HEADER_SIZE + capacity * sum(np.dtype(dtype).itemsize for _, dtype in COLUMN_DTYPES)
+        self.owner = name is None
+        self.memory = shared_memory.SharedMemory(name=name, create=self.owner, size=size if self.owner else 0)
+
+        self.counter = np.ndarray((1,), dtype=np.int64, buffer=self.memory.buf)
+        offset = HEADER_SIZE
+        for column, dtype in COLUMN_DTYPES:
+            setattr(self, column, np.ndarray((capacity,), dtype=dtype, buffer=self.memory.buf, offset=offset))
+            offset += capacity * np.dtype(dtype).itemsize
+        if self.owner:
+            self.counter[0] = 0
+
+    @property
+    def name(self):
+        """Shared memory name used to attach to the ring from another process."""
+        return self.memory.name
+
+    def reset(self):
+        """Discards every sample. Only call while the writer is idle."""
+        self.counter[0] = 0
+
+    def write(self, force, displacement, index=None):
+        """
+        Appends one sample. Only one process may write.
+
+        Args:
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+            index (int or None): Position of the sample in the uncompressed stream, if the stream is compressed.
+        """
+        count = int(self.counter[0])
+        slot = count % self.capacity
+        self.force[slot] = force
+        self.displacement[slot] = displacement
+        self.index[slot] = -1 if index is None else index
+        self.counter[0] = count + 1
+
+    def read(self, position):
+        """
+        Returns the samples written since a reader position, as views of the shared columns.
+
+        The views stay valid until the writer wraps around to them, so they should be consumed promptly.
+
+        Args:
+            position (int): Number of samples the reader has already consumed.
+
+        Returns:
+            tuple: (segments, new position, skipped samples), where segments is a list of at most two
+                (force, displacement, index) view tuples in write order.
+        """
+        count = int(self.counter[0])
+        skipped = max(count - position - self.capacity, 0)
+        position += skipped
+        if position >= count:
+            return [], position, skipped
+
+        start = position % self.capacity
+        end = start + (count - position)
+        segments = []
+        for first, last in ((start, min(end, self.capacity)), (0, max(end - self.capacity, 0))):
+            if last > first:
+                segments.append((self.force[first:last], self.displacement[first:last], self.index[first:last]))
+        return segments, count, skipped
+
+    def close(self):
+        """Releases the column views and the mapping, and removes the block if this process created it."""
+        del self.counter, self.force, self.displacement, self.index
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+def acquisition_process(ring_name, capacity, port, compression_tolerance, filter_name, calibration, commands, replies):
+    """
+    Entry point of the acquisition process: reads and parses the serial port into the shared ring.
+
+    Compression and filtering run here too, so the GUI process only receives the finished samples.
+
+    Args:
+        ring_name (str): Shared memory name of the ring.
+        capacity (int): Number of slots of the ring.
+        port (str): Serial port address.
+        compression_tolerance (tuple or None): Force and displacement tolerances of the swinging-door compressor.
+        filter_name (str or None): Noise filter name from ``Main.Filters.FILTERS``.
+        calibration (RigCalibration or None): Rig calibration for a sender reporting raw ADC counts.
+        commands (multiprocessing.Queue): "start", "stop" and "close" commands from the GUI process.
+        replies (multiprocessing.Queue): ("ready" | "error" | "stopped", payload) replies to the GUI process.
+    """
+    from .DataCollector import DataCollector
+    from .Compression import SwingingDoorCompressor
+    from .Filters import FilterStage
+
+    ring = SampleRing(capacity, ring_name)
+    try:
+        compressor = SwingingDoorCompressor(*compression_tolerance) if compression_tolerance else None
+        filter_stage = FilterStage(filter_name) if filter_name else None
+        collector = DataCollector(port, compressor=compressor, filter_stage=filter_stage, calibration=calibration)
+    except Exception as error:
+        replies.put(("error", f"{type(error).__name__}: {error}"))
+        ring.close()
+        return
+    replies.put(("ready", None))
+
+    while True:
+        command = commands.get()
+        if command == "start":
+            collector.start_collecting(ring.write)
+        elif command == "stop":
+            collector.stop_collecting()
+            replies.put(("stopped", collector.delivered))
+        elif command == "close":
+            collector.stop_collecting()
+            break
+
+    collector.ser.close()
+    ring.close()
+
+
+class SharedMemoryCollector:
+    """
+    Drop-in replacement for DataCollector that reads the serial port in a separate process.
+
+    Acquisition, parsing, filtering and compression run in a child process that writes finished samples into
+    a shared-memory ring. In the GUI process a light reader thread forwards new samples from the ring views to
+    the callback, so rendering and analysis holding the GIL can never delay a serial read.
+
+    Attributes:
+        port (str): Serial port address.
+        ring (SampleRing): Shared sample ring, created and owned by this process.
+        publisher (SamplePublisher or None): Optional server streaming delivered samples to remote dashboards.
+        poll_interval (float): Seconds the reader thread sleeps when the ring is empty.
+        process (multiprocessing.Process): Acquisition process.
+        commands (multiprocessing.Queue): Commands sent to the acquisition process.
+        replies (multiprocessing.Queue): Replies from the acquisition process.
+        collecting (bool): Flag indicating if data collection is active.
+        thread (threading.Thread or None): Reader thread forwarding samples to the callback.
+        callback (function): Callback function for processing collected data.
+        position (int): Number of ring samples consumed by the reader.
+        delivered (int): Number of samples delivered to the callback since collection started.
+        dropped (int): Number of samples overwritten before the reader could deliver them.
+    """
+
+    def __init__(self, port, compression_tolerance=None, filter_name=None, publisher=None, calibration=None,
+                 capacity=DEFAULT_RING_CAPACITY, poll_interval=0.005, timeout=10.0):
+        """
+        Creates the shared ring and starts the acquisition process, waiting until it has opened the port.
+
+        Args:
+            port (str): Serial port address (e.g., "COM1", "/dev/ttyUSB0").
+            compression_tolerance (tuple or None): Force and displacement tolerances for swinging-door compression.
+            filter_name (str or None): Noise filter name from ``Main.Filters.FILTERS``.
+            publisher (SamplePublisher or None): Optional server streaming delivered samples to remote dashboards.
+            calibration (RigCalibration or None): Rig calibration for a sender reporting raw ADC counts.
+            capacity (int): Number of slots of the ring (default: 65536).
+            poll_interval (float): Seconds the reader thread sleeps when the ring is empty (default: 0.005).
+            timeout (float): Seconds to wait for the acquisition process to open the port (default: 10).
+
+        Raises:
+            OSError: If the acquisition process could not open the port or did not start in time.
+        """
+        self.port = port
+        self.publisher = publisher
+        self.poll_interval = poll_interval
+        self.collecting = False
+        self.thread = None
+        self.position = 0
+        self.delivered = 0
+        self.dropped = 0
+
+        self.ring = SampleRing(capacity)
+        self.commands = multiprocessing.Queue()
+        self.replies = multiprocessing.Queue()
+        self.process = multiprocessing.Process(target=acquisition_process, daemon=True, args=(
+            self.ring.name, capacity, port, compression_tolerance, filter_name, calibration, self.commands,
+            self.replies))
+        self.process.start()
+
+        status, payload = self.wait_reply(timeout)
+        if status != "ready":
+            self.process.join(1.0)
+            self.ring.close()
+            raise OSError(payload or f"Acquisition process for {port} did not start")
+
+    def wait_reply(self, timeout):
+        """
+        Waits for the next reply of the acquisition process.
+
+        Args:
+            timeout (float): Seconds to wait.
+
+        Returns:
+            tuple: (status, payload), or (None, None) on timeout.
+        """
+        try:
+            return self.replies.get(timeout=timeout)
+        except Exception:
+            return None, None
+
+    def start_collecting(self, callback):
+        """
+        Starts collecting data in the acquisition process and forwarding it to the callback.
+
+        Args:
+            callback (function): Callback function to handle collected data.
+        """
+        self.callback = callback
+        self.ring.reset()
+        self.position = 0
+        self.delivered = 0
+        self.dropped = 0
+        if self.publisher:
+            self.publisher.reset()
+
+        self.collecting = True
+        self.commands.put("start")
+        self.thread = threading.Thread(target=self.read_loop, daemon=True)
+        self.thread.start()
+
+    def stop_collecting(self):
+        """Stops acquisition, then delivers the samples flushed by its filter and compressor."""
+        if not self.collecting:
+            return
+        self.commands.put("stop")
+        self.wait_reply(5.0)
+        self.collecting = False
+        self.thread.join()
+        self.drain()
+
+    def close(self):
+        """Stops the acquisition process and releases the shared ring."""
+        self.stop_collecting()
+        self.commands.put("close")
+        self.process.join(5.0)
+        self.ring.close()
+
+    def read_loop(self):
+        """Reader thread loop: forwards new ring samples to the callback while collecting."""
+        while self.collecting:
+            if not self.drain():
+                time.sleep(self.poll_interval)
+
+    def drain(self):
+        """
+        Delivers every sample written since the last call.
+
+        Returns:
+            int: Number of samples delivered.
+        """
+        segments, self.position, skipped = self.ring.read(self.position)
+        self.dropped += skipped
+        count = 0
+        for forces, displacements, indices in segments:
+            for force, displacement, index in zip(forces.tolist(), displacements.tolist(), indices.tolist()):
+                self.deliver(force, displacement, None if index < 0 else index)
+            count += len(forces)
+        return count
+
+    def deliver(self, force, displacement, index=None):
+        """
+        Hands a sample read from the ring to the callback and, if set, to the publisher.
+
+        Args:
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+            index (int or None): Position of the sample in the uncompressed stream, if the stream is compressed.
+        """
+        if self.publisher:
+            self.publisher.publish(self.delivered if index is None else index, force, displacement)
+        self.delivered += 1
+
+        if index is None:
+            self.callback(force, displacement)
+        else:
+            self.callback(force, displacement, index)
@@ -0,0 +1,367 @@
+import json
+import socket
+import struct
+import selectors
+import threading
+from collections import deque
+import numpy as np
+
+MAGIC = b"SSD1"
+HEADER = struct.Struct("<4sBI")  # magic, frame type, payload length
+SUBSCRIBE = struct.Struct("<I")  # decimation factor
+
+FRAME_SAMPLES = 1
+FRAME_PROPERTIES = 2
+FRAME_SUBSCRIBE = 3
+
+SAMPLE_DTYPE = np.dtype([("index", "<u4"), ("force", "<f8"), ("displacement", "<f8")])
+
+DEFAULT_PORT = 8765
+
+def encode_frame(frame_type, payload):
+    """
+    Prefixes a payload with the frame header.
+
+    Args:
+        frame_type (int): One of the FRAME_* constants.
+        payload (bytes): Frame payload.
+
+    Returns:
+        bytes: Encoded frame.
+    """
+    return HEADER.pack(MAGIC, frame_type, len(payload)) + payload
+
+
+class ClientState:
+    """
+    Per-subscriber connection state kept by the publisher.
+
+    Attributes:
+        sock (socket.socket): Non-blocking client socket.
+        decimation (int): Only samples whose stream index is a multiple of this are sent.
+        frames (collections.deque): Bounded queue of encoded frames waiting to be sent. When a slow client
+            lets it fill up, the oldest frames are dropped instead of blocking the publisher.
+        outgoing (bytes): Part of the current frame not written yet.
+        incoming (bytes): Received bytes not parsed yet.
+        dropped (int): Number of frames dropped because of backpressure.
+    """
+
+    __slots__ = ("sock", "decimation", "frames", "outgoing", "incoming", "dropped")
+
+    def __init__(self, sock, max_frames):
+        self.sock = sock
+        self.decimation = 1
+        self.frames = deque(maxlen=max_frames)
+        self.outgoing = b""
+        self.incoming = b""
+        self.dropped = 0
+
+    def enqueue(self, frame):
+        """
+        Queues a frame, dropping the oldest queued frame if the queue is full.
+
+        Args:
+            frame (bytes): Encoded frame.
+        """
+        if len(self.frames) == self.frames.maxlen:
+            self.dropped += 1
+        self.frames.append(frame)
+
+
+class SamplePublisher:
+    """
+    Serves batched live samples and properties to remote dashboards over TCP.
+
+    The acquisition thread only appends samples to a batch under a lock. A single server thread wakes up every
+    ``interval`` seconds, encodes the batch once per distinct decimation factor and queues it on every client.
+    Each client has a bounded queue, so a slow or stalled subscriber loses old frames instead of delaying
+    acquisition or the other subscribers.
+
+    Frames are a 9-byte header (magic ``SSD1``, frame type, payload length) followed by the payload. Sample
+    frames carry packed little-endian (uint32 index, float64 force, float64 displacement) records, property
+    frames carry a JSON object. Clients may send a subscribe frame with a uint32 decimation factor.
+
+    Attributes:
+        host (str): Address the server listens on.
+        port (int): TCP port the server listens on.
+        interval (float): Seconds between batch flushes.
+        max_frames (int): Maximum number of frames queued per client.
+        clients (dict): Client state keyed by socket.
+        batch (list): Samples received since the last flush as (index, force, displacement) tuples.
+        lock (threading.Lock): Lock protecting the batch and live properties.
+        properties (dict): Live properties sent with every flush.
+        properties_changed (bool): Whether properties were published since the last flush, so they are sent
+            even when no samples arrive, e.g. results calculated after the test stopped.
+        running (bool): Whether the server thread should keep running.
+        thread (threading.Thread or None): Server thread.
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, interval=0.1, max_frames=64):
+        """
+        Initializes the publisher. Call ``start`` to begin serving.
+
+        Args:
+            host (str): Address to listen on (default: "127.0.0.1").
+            port (int): TCP port to listen on (default: 8765).
+            interval (float): Seconds between batch flushes (default: 0.1).
+            max_frames (int): Maximum number of frames queued per client (default: 64).
+        """
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.max_frames = max_frames
+        self.clients = {}
+        self.batch = []
+        self.lock = threading.Lock()
+        self.properties = {}
+        self.properties_changed = False
+        self.running = False
+        self.thread = None
+        self.selector = None
+        self.server = None
+
+    def start(self):
+        """Opens the listening socket and starts the server thread."""
+        self.server = socket.create_server((self.host, self.port))
+        self.server.setblocking(False)
+        self.port = self.server.getsockname()[1]
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.server, selectors.EVENT_READ)
+        self.running = True
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stops the server thread and closes every connection."""
+        self.running = False
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def reset(self):
+        """Clears the live properties at the start of a new test."""
+        with self.lock:
+            self.batch = []
+            self.properties = {"samples": 0, "peak_force": 0.0}
+
+    def publish(self, index, force, displacement):
+        """
+        Adds one sample to the next batch. Called from the acquisition thread.
+
+        Args:
+            index (int): Position of the sample in the stream.
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+        """
+        with self.lock:
+            self.batch.append((index, force, displacement))
+
+    def publish_properties(self, properties):
+        """
+        Merges extra properties, e.g. calculated results, into the next property frame.
+
+        Args:
+            properties (dict): JSON serializable property values.
+        """
+        with self.lock:
+            self.properties.update(properties)
+            self.properties_changed = True
+
+    def take_batch(self):
+        """
+        Swaps out the pending batch and updates the live properties from it.
+
+        Returns:
+            tuple: Samples as a structured array, a copy of the live properties and whether properties were
+            published since the last batch.
+        """
+        with self.lock:
+            batch, self.batch = self.batch, []
+            changed, self.properties_changed = self.properties_changed, False
+            samples = np.array(batch, dtype=SAMPLE_DTYPE)
+            if len(samples):
+                self.properties["samples"] = self.properties.get("samples", 0) + len(samples)
+                self.properties["peak_force"] = max(self.properties.get("peak_force", 0.0), float(samples["force"].max()))
+                self.properties["last_force"] = float(samples["force"][-1])
+                self.properties["last_displacement"] = float(samples["displacement"][-1])
+            return samples, dict(self.properties), changed
+
+    def flush(self):
+        """Encodes the pending batch and queues it on every client."""
+        samples, properties, changed = self.take_batch()
+        if not self.clients or (len(samples) == 0 and not changed):
+            return
+
+        property_frame = encode_frame(FRAME_PROPERTIES, json.dumps(properties).encode())
+        encoded = {}
+        for client in self.clients.values():
+            if len(samples) == 0:
+                client.enqueue(property_frame)
+                self.selector.modify(client.sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+                continue
+            frame = encoded.get(client.decimation)
+            if frame is None:
+                selected = samples if client.decimation == 1 else samples[samples["index"] % client.decimation == 0]
+                frame = encode_frame(FRAME_SAMPLES, selected.tobytes())
+                encoded[client.decimation] = frame
+            client.enqueue(frame)
+            client.enqueue(property_frame)
+            self.selector.modify(client.sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+
+    def serve(self):
+        """Server thread loop: accepts clients, reads subscriptions, flushes batches and writes frames."""
+        try:
+            while self.running:
+                for key, events in self.selector.select(timeout=self.interval):
+                    if key.fileobj is self.server:
+                        self.accept()
+                        continue
+                    client = self.clients.get(key.fileobj)
+                    if client is None:
+                        continue
+                    if events & selectors.EVENT_READ:
+                        self.read(client)
+                    if events & selectors.EVENT_WRITE and client.sock in self.clients:
+                        self.write(client)
+                self.flush()
+        finally:
+            for client in list(self.clients.values()):
+                self.disconnect(client)
+            self.selector.close()
+            self.server.close()
+
+    def accept(self):
+        """Accepts a pending client connection."""
+        try:
+            sock, _ = self.server.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        self.clients[sock] = ClientState(sock, self.max_frames)
+        self.selector.register(sock, selectors.EVENT_READ)
+
+    def disconnect(self, client):
+        """
+        Closes a client connection.
+
+        Args:
+            client (ClientState): Client to disconnect.
+        """
+        self.clients.pop(client.sock, None)
+        try:
+            self.selector.unregister(client.sock)
+        except (KeyError, ValueError):
+            pass
+        client.sock.close()
+
+    def read(self, client):
+        """
+        Reads subscribe frames sent by a client.
+
+        Args:
+            client (ClientState): Client with pending input.
+        """
+        try:
+            data = client.sock.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self.disconnect(client)
+            return
+
+        client.incoming += data
+        while len(client.incoming) >= HEADER.size:
+            magic, frame_type, length = HEADER.unpack_from(client.incoming)
+            if magic != MAGIC:
+                self.disconnect(client)
+                return
+            if len(client.incoming) < HEADER.size + length:
+                break
+            payload = client.incoming[HEADER.size:HEADER.size + length]
+            client.incoming = client.incoming[HEADER.size + length:]
+            if frame_type == FRAME_SUBSCRIBE and length == SUBSCRIBE.size:
+                client.decimation = max(1, SUBSCRIBE.unpack(payload)[0])
+
+    def write(self, client):
+        """
+        Writes as much queued data to a client as its socket accepts without blocking.
+
+        Args:
+            client (ClientState): Client whose socket is writable.
+        """
+        while True:
+            if not client.outgoing:
+                if not client.frames:
+                    self.selector.modify(client.sock, selectors.EVENT_READ)
+                    return
+                client.outgoing = client.frames.popleft()
+            try:
+                sent = client.sock.send(client.outgoing)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                self.disconnect(client)
+                return
+            client.outgoing = client.outgoing[sent:]
+
+
+class SampleSubscriber:
+    """
+    Minimal blocking client for a SamplePublisher, e.g. for a remote dashboard or for testing.
+
+    Attributes:
+        sock (socket.socket): Connection to the publisher.
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, decimation=1, timeout=None):
+        """
+        Connects to a publisher and subscribes with the given decimation.
+
+        Args:
+            host (str): Publisher address (default: "127.0.0.1").
+            port (int): Publisher port (default: 8765).
+            decimation (int): Only receive samples whose stream index is a multiple of this (default: 1).
+            timeout (float or None): Socket timeout in seconds (default: None, block forever).
+        """
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.sendall(encode_frame(FRAME_SUBSCRIBE, SUBSCRIBE.pack(decimation)))
+
+    def close(self):
+        """Closes the connection."""
+        self.sock.close()
+
+    def receive_exactly(self, size):
+        """
+        Reads an exact number of bytes from the connection.
+
+        Args:
+            size (int): Number of bytes to read.
+
+        Returns:
+            bytes: The received bytes.
+        """
+        chunks = []
+        while size:
+            chunk = self.sock.recv(size)
+            if not chunk:
+                raise ConnectionError("Publisher closed the connection")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def receive(self):
+        """
+        Receives the next frame.
+
+        Returns:
+            tuple: Frame type and decoded payload, a structured sample array or a property dict.
+        """
+        magic, frame_type, length = HEADER.unpack(self.receive_exactly(HEADER.size))
+        if magic != MAGIC:
+            raise ConnectionError("Unexpected data from publisher")
+        payload = self.receive_exactly(length)
+        if frame_type == FRAME_SAMPLES:
+            return frame_type, np.frombuffer(payload, dtype=SAMPLE_DTYPE)
+        return frame_type, json.loads(payload)
@@ -0,0 +1,228 @@
+import os
+import json
+import time
+import queue
+import threading
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from .TestSession import ARCHIVE_EXTENSION
+
+DEFAULT_EXPORT_DIRECTORY = "exports"
+
+class FractureDetector:
+    """
+    Streaming detection of specimen fracture from a sudden loss of force.
+
+    Attributes:
+        drop_ratio (float): Fraction of the peak force below which the specimen is considered broken.
+        min_force (float): Peak force in Newtons the test must reach before fracture can be detected.
+        peak_force (float): Highest force seen so far.
+        samples (int): Number of samples seen so far.
+        fracture_index (int or None): Number of samples before the force dropped, once fracture is detected.
+    """
+
+    def __init__(self, drop_ratio=0.3, min_force=100.0):
+        """
+        Initializes the detector.
+
+        Args:
+            drop_ratio (float): Fraction of the peak force below which the specimen is broken (default: 0.3).
+            min_force (float): Peak force in Newtons needed before fracture can be detected (default: 100).
+        """
+        self.drop_ratio = drop_ratio
+        self.min_force = min_force
+        self.reset()
+
+    def reset(self):
+        """Prepares the detector for a new specimen."""
+        self.peak_force = 0.0
+        self.samples = 0
+        self.fracture_index = None
+
+    def add(self, force):
+        """
+        Adds one force sample.
+
+        Args:
+            force (float): Force value in Newtons.
+
+        Returns:
+            bool: True for the sample at which fracture is detected, False otherwise and afterwards.
+        """
+        self.samples += 1
+        if self.fracture_index is not None:
+            return False
+        if force > self.peak_force:
+            self.peak_force = force
+        elif self.peak_force >= self.min_force and force < self.drop_ratio * self.peak_force:
+            self.fracture_index = self.samples - 1
+            return True
+        return False
+
+
+class TestQueue:
+    """
+    Ordered batch of specimens waiting to be tested.
+
+    Attributes:
+        pending (list): Geometry dictionaries of the specimens not tested yet.
+        current (dict or None): Geometry of the specimen being tested.
+        number (int): Number of the current specimen in the batch, starting at 1.
+        running (bool): Whether acquisition advances through the queue automatically.
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.current = None
+        self.number = 0
+        self.running = False
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, data):
+        """
+        Appends a specimen to the batch.
+
+        Args:
+            data (dict): Specimen geometry as returned by ``InputFrame.specimen_data``.
+        """
+        self.pending.append(data)
+
+    def remove(self, position):
+        """
+        Removes a pending specimen.
+
+        Args:
+            position (int): Position of the specimen in ``pending``.
+        """
+        del self.pending[position]
+
+    def advance(self):
+        """
+        Moves to the next pending specimen.
+
+        Returns:
+            dict or None: Geometry of the next specimen, or None when the batch is finished.
+        """
+        if not self.pending:
+            self.current = None
+            self.running = False
+            return None
+        self.current = self.pending.pop(0)
+        self.number += 1
+        return self.current
+
+
+class AnalysisWorker:
+    """
+    Background worker analysing and exporting finished specimens while the next one is acquired.
+
+    For every specimen it calculates the properties, writes a results plot and a JSON summary to the export
+    directory, and records the test in the catalog (or saves its raw data next to the exports without one).
+    Plots are drawn on standalone Agg figures, which unlike pyplot are safe to use off the Tk thread. Outcomes
+    are put on a results queue for the Tk thread to poll.
+
+    Attributes:
+        analyser (GraphPlotter): Plotter used only by this worker, for its property calculation.
+        export_directory (str): Directory the exports are written to.
+        catalog (TestCatalog or None): Catalog completed tests are recorded in.
+        publisher (SamplePublisher or None): Server streaming the calculated properties to remote dashboards.
+        jobs (queue.Queue): Pending specimens, or None to stop the worker.
+        results (queue.Queue): ("done", number, data, properties, files) or ("error", number, data, message).
+        thread (threading.Thread): Worker thread.
+    """
+
+    def __init__(self, analyser, export_directory=DEFAULT_EXPORT_DIRECTORY, catalog=None, publisher=None):
+        """
+        Initializes and starts the worker.
+
+        Args:
+            analyser (GraphPlotter): Plotter instance dedicated to the worker, created on the Tk thread.
+            export_directory (str): Directory the exports are written to (default: "exports").
+            catalog (TestCatalog or None): Catalog completed tests are recorded in.
+            publisher (SamplePublisher or None): Server streaming the calculated properties to remote dashboards.
+        """
+        self.analyser = analyser
+        self.export_directory = export_directory
+        self.catalog = catalog
+        self.publisher = publisher
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, number, session):
+        """
+        Queues a finished specimen. Returns immediately.
+
+        Args:
+            number (int): Number of the specimen in the batch.
+            session (TestSession): Finished test, not modified afterwards.
+        """
+        self.jobs.put((number, session))
+
+    def close(self):
+        """Finishes the queued specimens and stops the worker."""
+        self.jobs.put(None)
+        self.thread.join()
+
+    def run(self):
+        """Worker thread loop."""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            number, session = job
+            try:
+                properties, files = self.process(number, session)
+            except Exception as error:
+                self.results.put(("error", number, session.initial_data, f"{type(error).__name__}: {error}"))
+            else:
+                self.results.put(("done", number, session.initial_data, properties, files))
+
+    def process(self, number, session):
+        """
+        Analyses and exports one specimen.
+
+        Args:
+            number (int): Number of the specimen in the batch.
+            session (TestSession): Finished test.
+
+        Returns:
+            tuple: Calculated properties and the list of files written.
+        """
+        self.analyser.session = session
+        strain, stress = self.analyser.get_analysis_series()
+        properties = self.analyser.calculate_properties(strain, stress)
+        if self.publisher is not None:
+            self.publisher.publish_properties(
+                {"specimen": number, **{key: float(value) for key, value in properties.items()}})
+
+        os.makedirs(self.export_directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.export_directory, f"specimen-{number:03d}-{stamp}")
+        files = [base + ".png", base + ".json"]
+
+        figure = Figure(figsize=(10, 6))
+        FigureCanvasAgg(figure)
+        ax, text_ax = figure.subplots(1, 2, gridspec_kw={"width_ratios": [3, 2]})
+        ax.plot(session.strain, session.stress, 'r')
+        ax.set_xlabel('Strain')
+        ax.set_ylabel('Stress (MPa)')
+        ax.set_title(f'Specimen {number}: Stress vs Strain')
+        text_ax.text(0, 1, "\n".join(f"{key}: {value:.4f}" for key, value in properties.items()),
+                     verticalalignment='top', fontsize=9)
+        text_ax.axis('off')
+        figure.savefig(files[0])
+
+        with open(files[1], "w", encoding="utf-8") as file:
+            json.dump({"specimen": number, "initial_data": session.initial_data,
+                       "properties": {key: float(value) for key, value in properties.items()}}, file, indent=4)
+
+        if self.catalog is not None:
+            self.catalog.submit(session, properties)
+        else:
+            files.append(base + ARCHIVE_EXTENSION)
+            session.save(files[-1])
+        return properties, files
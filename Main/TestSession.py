@@ -0,0 +1,303 @@
+import json
+import threading
+import time
+import numpy as np
+from .Archive import write_archive, is_archive, ArchiveReader
+from .RangeIndex import RangeIndex
+
+ARCHIVE_EXTENSION = ".ssa"
+
+COLUMNS = ("time", "force", "displacement", "sample_index")
+
+class TestSession:
+    """
+    Samples and specimen geometry of a single test, stored as contiguous typed columns.
+
+    Each column is a preallocated NumPy array that doubles in capacity when full, so the four columns cost
+    32 bytes per sample instead of boxed Python floats plus list slots. The ``time``, ``force``,
+    ``displacement`` and ``sample_index`` properties return zero-copy views of the filled part of each column,
+    which can be handed to matplotlib and the analysis code directly. Stress and strain are not stored, the
+    ``stress`` and ``strain`` properties derive them from force and displacement with one vectorized pass.
+
+    Sessions that are queried by strain window, such as the live test shown in the range panel, also build a
+    range index, which adds 40 bytes per sample plus 8 bytes per sample and level for the peak table. Copied
+    and loaded sessions have none until they are queried.
+
+    Attributes:
+        initial_data (dict): Specimen geometry (shape, dimensions, area, initial_length).
+        size (int): Number of samples stored.
+        capacity (int): Number of samples the columns can hold before growing.
+        start_time (float or None): Monotonic clock reading of the first sample.
+        started_at (float or None): Unix timestamp of the first sample.
+        range_index (RangeIndex or None): Cumulative work and stress index of the samples, built on the first
+            range query and kept up to date from then on.
+        lock (threading.Lock): Serializes appends on the acquisition thread with range queries on the Tk thread.
+    """
+
+    __slots__ = ("initial_data", "size", "capacity", "start_time", "started_at", "range_index", "lock",
+                 "_time", "_force", "_displacement", "_sample_index")
+
+    def __init__(self, initial_data, capacity=4096):
+        """
+        Initializes an empty session.
+
+        Args:
+            initial_data (dict): Specimen geometry, must contain "area" and "initial_length".
+            capacity (int): Initial number of samples the columns can hold (default: 4096).
+        """
+        self.initial_data = initial_data
+        self.capacity = capacity
+        self.range_index = None
+        self.lock = threading.Lock()
+        self.allocate(capacity)
+        self.clear()
+
+    def allocate(self, capacity):
+        """
+        Allocates the columns, keeping the samples stored so far.
+
+        Args:
+            capacity (int): Number of samples the new columns can hold.
+        """
+        size = getattr(self, "size", 0)
+        for name in COLUMNS:
+            dtype = np.int64 if name == "sample_index" else np.float64
+            column = np.empty(capacity, dtype=dtype)
+            if size:
+                column[:size] = getattr(self, "_" + name)[:size]
+            setattr(self, "_" + name, column)
+        self.capacity = capacity
+
+    def clear(self):
+        """Drops all samples and the range index, keeping the geometry and the allocated columns."""
+        with self.lock:
+            self.size = 0
+            self.start_time = None
+            self.started_at = None
+            self.range_index = None
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def area(self):
+        """float: Cross-sectional area of the specimen in mm^2."""
+        return self.initial_data["area"]
+
+    @property
+    def initial_length(self):
+        """float: Initial length of the specimen in mm."""
+        return self.initial_data["initial_length"]
+
+    def append(self, force, displacement, index=None):
+        """
+        Stores one sample and derives its stress and strain.
+
+        Args:
+            force (float): Force value in Newtons.
+            displacement (float): Displacement value in millimeters.
+            index (int or None): Position of the sample in the uncompressed stream (default: next position).
+
+        Returns:
+            tuple: Stress (MPa) and strain of the sample.
+        """
+        with self.lock:
+            size = self.size
+            if size == self.capacity:
+                self.allocate(self.capacity * 2)
+
+            now = time.monotonic()
+            if size == 0:
+                self.start_time = now
+                self.started_at = time.time()
+                strain = 0.0
+            else:
+                strain = (displacement - self._displacement[0]) / self.initial_data["initial_length"]
+            stress = force / self.initial_data["area"]
+
+            self._time[size] = now - self.start_time
+            self._force[size] = force
+            self._displacement[size] = displacement
+            self._sample_index[size] = size if index is None else index
+            self.size = size + 1
+            if self.range_index is not None:
+                self.range_index.append(stress, strain, force, displacement)
+        return stress, strain
+
+    def truncate(self, size):
+        """
+        Drops the samples after the first ``size``, e.g. the unloaded tail after fracture.
+
+        Args:
+            size (int): Number of samples kept.
+        """
+        with self.lock:
+            self.size = max(min(size, self.size), 0)
+            self.range_index = None
+
+    def extend(self, force, displacement, time_data=None, sample_index=None):
+        """
+        Stores a block of samples at once, e.g. when loading a saved test.
+
+        Args:
+            force (array-like): Force values in Newtons.
+            displacement (array-like): Displacement values in millimeters.
+            time_data (array-like or None): Sample times in seconds (default: zeros).
+            sample_index (array-like or None): Stream indices (default: consecutive positions).
+        """
+        force = np.asarray(force, dtype=float)
+        displacement = np.asarray(displacement, dtype=float)
+        count = len(force)
+        if count == 0:
+            return
+
+        with self.lock:
+            start = self.size
+            end = start + count
+            if end > self.capacity:
+                self.allocate(max(end, self.capacity * 2))
+
+            reference = displacement[0] if start == 0 else self._displacement[0]
+            self._force[start:end] = force
+            self._displacement[start:end] = displacement
+            self._time[start:end] = 0.0 if time_data is None else time_data
+            self._sample_index[start:end] = np.arange(start, end) if sample_index is None else sample_index
+            self.size = end
+            if self.range_index is not None:
+                self.range_index.extend(force / self.initial_data["area"],
+                                        (displacement - reference) / self.initial_data["initial_length"],
+                                        force, displacement)
+
+    def build_range_index(self):
+        """
+        Builds the range index over the stored samples, with the sparse table of stress maxima, unless it is
+        already built. The caller holds ``lock``.
+
+        Returns:
+            RangeIndex: The index of the session.
+        """
+        index = self.range_index
+        if index is None:
+            index = RangeIndex(max(self.capacity, 1))
+            index.extend(self.stress, self.strain, self.force, self.displacement)
+            self.range_index = index
+        if index.levels is None:
+            index.build_levels(self.stress)
+        return index
+
+    def query_strain(self, low, high):
+        """
+        Computes the work and stress statistics of a strain window, building the range index on first use.
+
+        Args:
+            low (float): Lowest strain.
+            high (float): Highest strain.
+
+        Returns:
+            dict or None: Statistics as returned by ``RangeIndex.query``, or None if the window holds no samples.
+        """
+        with self.lock:
+            return self.build_range_index().query_strain(low, high)
+
+    def range_summary(self, yield_strain=None):
+        """
+        Computes the toughness, work to fracture and resilience of the test, building the range index on first use.
+
+        Args:
+            yield_strain (float or None): Yield strain bounding the resilience, if known.
+
+        Returns:
+            dict: Energy properties as returned by ``RangeIndex.summary``.
+        """
+        with self.lock:
+            return self.build_range_index().summary(yield_strain)
+
+    @property
+    def time(self):
+        """numpy.ndarray: View of the sample times in seconds since the first sample."""
+        return self._time[:self.size]
+
+    @property
+    def force(self):
+        """numpy.ndarray: View of the force samples in Newtons."""
+        return self._force[:self.size]
+
+    @property
+    def displacement(self):
+        """numpy.ndarray: View of the displacement samples in millimeters."""
+        return self._displacement[:self.size]
+
+    @property
+    def stress(self):
+        """numpy.ndarray: Stress samples in MPa, derived from the force samples."""
+        return self.force / self.initial_data["area"]
+
+    @property
+    def strain(self):
+        """numpy.ndarray: Strain samples, derived from the displacement samples."""
+        displacement = self.displacement
+        if self.size == 0:
+            return displacement.copy()
+        return (displacement - displacement[0]) / self.initial_data["initial_length"]
+
+    @property
+    def sample_index(self):
+        """numpy.ndarray: View of the stream index of every sample, with gaps when the stream is compressed."""
+        return self._sample_index[:self.size]
+
+    def copy(self):
+        """
+        Copies the session, e.g. to hand a finished test to a background writer while the live one is reused.
+
+        Returns:
+            TestSession: Independent session with the same geometry and samples.
+        """
+        session = TestSession(dict(self.initial_data), capacity=max(self.size, 1))
+        session.extend(self.force, self.displacement, self.time, self.sample_index)
+        session.start_time = self.start_time
+        session.started_at = self.started_at
+        return session
+
+    def save(self, path):
+        """
+        Saves the geometry and raw columns to a compressed NumPy archive, or to a chunked archive for paths
+        ending in ".ssa", which is smaller and can be read partially (see ``Main.Archive``).
+
+        Stress and strain are not stored, they are derived again from the geometry on load.
+
+        Args:
+            path (str): Destination file, conventionally with a ".npz" or ".ssa" extension.
+        """
+        if path.endswith(ARCHIVE_EXTENSION):
+            write_archive(path, self)
+            return
+        np.savez_compressed(
+            path,
+            initial_data=np.array(json.dumps(self.initial_data)),
+            started_at=np.array(np.nan if self.started_at is None else self.started_at),
+            time=self.time,
+            force=self.force,
+            displacement=self.displacement,
+            sample_index=self.sample_index,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a session saved with ``save``.
+
+        Args:
+            path (str): File written by ``save``.
+
+        Returns:
+            TestSession: The loaded session.
+        """
+        if is_archive(path):
+            with ArchiveReader(path) as reader:
+                return reader.load_session()
+        with np.load(path) as archive:
+            session = cls(json.loads(str(archive["initial_data"])), capacity=max(len(archive["force"]), 1))
+            session.extend(archive["force"], archive["displacement"], archive["time"], archive["sample_index"])
+            if "started_at" in archive.files and not np.isnan(archive["started_at"]):
+                session.started_at = float(archive["started_at"])
+        return session
@@ -91,3 +91,85 @@ class MaterialInputDialog:
             self.dialog.destroy()
         except ValueError:
             messagebox.showerror("Input error", "Please enter valid numbers")
+
+
+class CyclicInputDialog:
+    """
+    CyclicInputDialog class provides a dialog window for entering the loading of a simulated cyclic test.
+
+    Args:
+        parent (tk.Tk or tk.Frame): Parent tkinter widget.
+
+    Attributes:
+        parent (tk.Tk or tk.Frame): Parent tkinter widget.
+        result (dict): Dictionary to store entered loading parameters.
+        entries (dict): Entry widget of every parameter.
+    """
+
+    FIELDS = (
+        ("amplitude", "Enter stress amplitude (MPa):", float),
+        ("mean", "Enter mean stress (MPa):", float),
+        ("cycles", "Enter number of cycles:", int),
+        ("modulus_of_elasticity", "Enter modulus of elasticity (GPa):", float),
+        ("amplitude_spread", "Enter amplitude spread (0-1):", float),
+    )
+
+    def __init__(self, parent):
+        """
+        Initializes the CyclicInputDialog instance.
+
+        Args:
+            parent (tk.Tk or tk.Frame): Parent tkinter widget.
+        """
+        self.parent = parent
+        self.result = {}
+        self.entries = {}
+
+    def show(self):
+        """
+        Displays the dialog window for entering the cyclic loading.
+
+        Returns:
+            dict: Dictionary containing entered loading parameters.
+        """
+        self.result = {}
+        self.dialog = tk.Toplevel(self.parent)
+        self.dialog.title("Cyclic Input")
+        self.dialog.geometry("450x230")
+
+        for row, (name, label, _) in enumerate(self.FIELDS):
+            tk.Label(self.dialog, text=label, anchor='w').grid(row=row, column=0, padx=10, pady=5, sticky='w')
+            self.entries[name] = tk.Entry(self.dialog, width=30)
+            self.entries[name].grid(row=row, column=1, padx=10, pady=5)
+        self.entries["amplitude_spread"].insert(0, "0")
+
+        ok_button = tk.Button(self.dialog, text="Confirm", command=self.on_ok, width=10)
+        ok_button.grid(row=len(self.FIELDS), column=1, pady=15, padx=10, sticky='e')
+
+        cancel_button = tk.Button(self.dialog, text="Cancel", command=self.on_cancel, width=10)
+        cancel_button.grid(row=len(self.FIELDS), column=0, pady=15, padx=10, sticky='w')
+
+        self.dialog.transient(self.parent)
+        self.dialog.grab_set()
+        self.parent.wait_window(self.dialog)
+
+        return self.result
+
+    def on_cancel(self):
+        """
+        Handles the cancel button click event by clearing the result dictionary and destroying the dialog window.
+        """
+        self.result = {}
+        self.dialog.destroy()
+
+    def on_ok(self):
+        """
+        Handles the confirm button click event by validating inputs, storing the entered values in the result dictionary,
+        and destroying the dialog window. Displays an error message if inputs are not valid numbers.
+        """
+        try:
+            for name, _, convert in self.FIELDS:
+                self.result[name] = convert(self.entries[name].get())
+            self.dialog.destroy()
+        except ValueError:
+            messagebox.showerror("Input error", "Please enter valid numbers")
@@ -2,7 +2,15 @@ import time
 import serial
 import numpy as np
 import threading
-from .TestingInput import MaterialInputDialog
+from .TestingInput import MaterialInputDialog, CyclicInputDialog
+from .Profiler import traced
+from .Calibration import RigCalibration
+from .Cyclic import cyclic_waveform
+from .Filters import DEFAULT_BLOCK_SIZE, LONGEST_FILTER_WINDOW
+
+# Samples of zero load sent after a simulated curve to mimic the specimen breaking. Fracture is detected on the
+# delivered force, so with a live filter the drop has to fill a whole filter block and pass the longest window.
+FRACTURE_TAIL_SAMPLES = DEFAULT_BLOCK_SIZE + LONGEST_FILTER_WINDOW
 
 class MaterialTestingSimulator:
     """
@@ -12,15 +20,25 @@ class MaterialTestingSimulator:
         root (tk.Tk or tk.Frame): Root tkinter widget for displaying input dialogs.
         port (str): Serial port to communicate with external devices (default: 'COM2').
         baudrate (int): Baud rate for serial communication (default: 9600).
+        compressor (SwingingDoorCompressor or None): Optional compressor applied before sending (default: None).
+        calibration (RigCalibration or None): Rig calibration used to convert between counts and units
+            (default: the legacy 10-bit rig).
+        send_counts (bool): Send raw ADC counts for the receiver to convert, instead of engineering units.
 
     Attributes:
         ser (serial.Serial): Serial communication object.
         dialog (MaterialInputDialog): Instance of MaterialInputDialog for inputting material properties.
+        cyclic_dialog (CyclicInputDialog): Dialog for inputting the loading of a simulated cyclic test.
         inputs (dict or None): Dictionary to store user inputs from the input dialog.
+        compressor (SwingingDoorCompressor or None): Compressor applied to the sample stream before sending.
+        model (ConstitutiveModel or None): Fitted model driving the curve up to the UTS instead of the built-in one.
+        calibration (RigCalibration): Rig calibration whose lookup tables convert between counts and units.
+        send_counts (bool): Send raw ADC counts instead of engineering units.
+        simulation_thread (threading.Thread or None): Thread sending the last started monotonic simulation.
 
     Methods:
-        signal_to_force(value): Converts analog signal value to force (in Newtons) based on a simulated pressure.
-        signal_to_displacement(value): Converts analog signal value to displacement (in millimeters).
+        signal_to_force(value): Converts an analog signal value to force (in Newtons) with the rig calibration.
+        signal_to_displacement(value): Converts an analog signal value to displacement (in millimeters).
         generate_signals(stress, strain, area, initial_length): Generates simulated analog signals for pressure and displacement.
         generate_stress_strain(yield_stress, ultimate_stress, youngs_modulus, fracture_strain): Generates stress-strain curve based on material properties.
         get_stress_strain(yield_stress, ultimate_stress, youngs_modulus, fracture_strain): Retrieves stress-strain curve as numpy arrays.
@@ -28,9 +46,13 @@ class MaterialTestingSimulator:
         simulate_and_send(yield_stress, ultimate_stress, modulus_of_elasticity, fracture_strain, area, initial_length):
             Simulates material testing signals based on user inputs and sends them via serial communication.
         start_simulation(area, length): Initiates the simulation process by showing an input dialog for material properties and starting a simulation thread.
+        simulate_cyclic(amplitude, mean, cycles, modulus_of_elasticity, amplitude_spread, area, initial_length):
+            Simulates a stress-controlled cyclic test and streams it cycle by cycle.
+        repeat_simulation(area, length, fracture_tail): Starts a simulation with the last entered material properties.
+        start_cyclic_simulation(area, length): Shows the cyclic loading dialog and starts a cyclic simulation thread.
     """
 
-    def __init__(self, root, port='COM2', baudrate=9600):
+    def __init__(self, root, port='COM2', baudrate=9600, compressor=None, calibration=None, send_counts=False):
         """
         Initializes the MaterialTestingSimulator instance.
 
@@ -38,43 +60,44 @@ class MaterialTestingSimulator:
             root (tk.Tk or tk.Frame): Root tkinter widget for displaying input dialogs.
             port (str): Serial port to communicate with external devices (default: 'COM2').
             baudrate (int): Baud rate for serial communication (default: 9600).
+            compressor (SwingingDoorCompressor or None): Optional compressor applied before sending (default: None).
+            calibration (RigCalibration or None): Rig calibration (default: the legacy 10-bit rig).
+            send_counts (bool): Send raw ADC counts instead of engineering units (default: False). The compressor
+                is not used in this mode since its tolerances are in engineering units.
         """
         self.ser = serial.Serial(port, baudrate)
         self.dialog = MaterialInputDialog(root)
+        self.cyclic_dialog = CyclicInputDialog(root)
         self.inputs = None
+        self.compressor = compressor
+        self.model = None
+        self.calibration = calibration or RigCalibration.legacy()
+        self.send_counts = send_counts
+        self.simulation_thread = None
 
     def signal_to_force(self, value):
         """
-        Converts analog signal value to force (in Newtons) based on a simulated pressure.
+        Converts analog signal value to force (in Newtons) with the force lookup table of the rig calibration.
 
         Args:
-            value (int): Analog signal value (0-1023).
+            value (int): Analog signal value (0 to the ADC maximum count).
 
         Returns:
             float: Calculated force in Newtons.
         """
-        max_voltage = 10
-        max_pressure = 250  # in bar (assumed max pressure for simulation)
-        voltage = value * (max_voltage / 1023)
-        pressure = (voltage / max_voltage) * max_pressure
-        piston_area = 0.016  # in m^2 (piston area)
-        pressure_pascal = pressure * 1e5  # converting bar to Pascals (1 bar = 1e5 Pascals)
-        force = piston_area * pressure_pascal  # Force in Newtons
-        return force
+        return float(self.calibration.force.convert(value))
 
     def signal_to_displacement(self, value):
         """
-        Converts analog signal value to displacement (in millimeters).
+        Converts analog signal value to displacement (in millimeters) with the rig calibration.
 
         Args:
-            value (int): Analog signal value (0-1023).
+            value (int): Analog signal value (0 to the ADC maximum count).
 
         Returns:
             float: Calculated displacement in millimeters.
         """
-        pot_length = 50  # in mm
-        displacement = (value / 1023) * pot_length
-        return displacement
+        return float(self.calibration.displacement.convert(value))
 
     def generate_signals(self, stress, strain, area, initial_length):
         """
@@ -87,21 +110,14 @@ class MaterialTestingSimulator:
             initial_length (float): Initial length of the specimen in mm.
 
         Returns:
-            tuple: Tuple containing lists of simulated analog signals for pressure and displacement.
+            tuple: Arrays of simulated analog signals (ADC counts) for pressure and displacement.
         """
         force = stress * area  # stress in MPa and area in mm^2 gives force in N
         displacement = strain * initial_length
 
-        adc_displacement = (displacement / 50) * 1023
-        adc_displacement = np.clip(adc_displacement, 0, 1023).astype(int)
-
-        pressure = force / 0.016 / 1e5  # converting N/m^2 to bar
-        adc_pressure = (pressure / 250) * 1023
-        adc_pressure = np.clip(adc_pressure, 0, 1023).astype(int)
-
-        return adc_pressure.tolist(), adc_displacement.tolist()
+        return self.calibration.to_counts(force, displacement)
 
-    def generate_stress_strain(self, yield_stress, ultimate_stress, youngs_modulus, fracture_strain):
+    def generate_stress_strain(self, yield_stress, ultimate_stress, youngs_modulus, fracture_strain, model=None):
         """
         Generates stress-strain curve based on material properties.
 
@@ -110,10 +126,15 @@ class MaterialTestingSimulator:
             ultimate_stress (float): Ultimate stress of the material in MPa.
             youngs_modulus (float): Young's modulus of elasticity of the material in GPa.
             fracture_strain (float): Fracture strain of the material.
+            model (ConstitutiveModel or None): Fitted model used up to its uniform strain, in which case only
+                yield_stress and fracture_strain are used, for the necking branch.
 
         Returns:
             tuple: Arrays of stress and strain values.
         """
+        if model is not None:
+            return self.generate_model_stress_strain(model, yield_stress, fracture_strain)
+
         strain_yield = yield_stress / youngs_modulus
         strain_ultimate = 0.15  # Typical value for metals
         
@@ -132,6 +153,35 @@ class MaterialTestingSimulator:
         
         return stress, strain
 
+    def generate_model_stress_strain(self, model, yield_stress, fracture_strain):
+        """
+        Generates a stress-strain curve from a fitted constitutive model.
+
+        The model gives the elastic and hardening parts up to the uniform strain it was fitted to. Necking then
+        follows the same square-root drop towards the yield stress as the built-in curve.
+
+        Args:
+            model (ConstitutiveModel): Fitted model.
+            yield_stress (float): Stress reached at fracture, in MPa.
+            fracture_strain (float): Fracture strain of the material.
+
+        Returns:
+            tuple: Arrays of stress and strain values.
+        """
+        strain_ultimate = min(model.uniform_strain, fracture_strain)
+
+        strain = np.concatenate([
+            np.linspace(0, strain_ultimate, 8000),
+            np.linspace(strain_ultimate, fracture_strain, 2000)[1:]
+        ])
+
+        ultimate_stress = float(model.stress(strain_ultimate))
+        necking = np.clip((strain - strain_ultimate) / max(fracture_strain - strain_ultimate, 1e-12), 0, 1)
+        stress = np.where(strain <= strain_ultimate, model.stress(strain),
+                          ultimate_stress - (ultimate_stress - yield_stress) * necking ** 0.5)
+
+        return stress, strain
+
     def get_stress_strain(self, yield_stress, ultimate_stress, youngs_modulus, fracture_strain):
         """
         Retrieves stress-strain curve as numpy arrays.
@@ -145,21 +195,27 @@ class MaterialTestingSimulator:
         Returns:
             tuple: Arrays of stress and strain values.
         """
-        return self.generate_stress_strain(yield_stress, ultimate_stress, youngs_modulus, fracture_strain)
+        return self.generate_stress_strain(yield_stress, ultimate_stress, youngs_modulus, fracture_strain, self.model)
 
-    def serial_send(self, force, displacement):
+    def serial_send(self, force, displacement, index=None):
         """
         Sends simulated force and displacement data via serial communication.
 
         Args:
             force (float): Force value in Newtons.
             displacement (float): Displacement value in millimeters.
+            index (int or None): Position of the sample in the uncompressed stream, sent only when compressing.
         """
-        data = f"{force},{displacement}\n"
+        if index is None:
+            data = f"{force},{displacement}\n"
+        else:
+            data = f"{force},{displacement},{index}\n"
         self.ser.write(data.encode())
         time.sleep(0.02)
 
-    def simulate_and_send(self, yield_stress, ultimate_stress, modulus_of_elasticity, fracture_strain, area, initial_length):
+    @traced("simulate_and_send")
+    def simulate_and_send(self, yield_stress, ultimate_stress, modulus_of_elasticity, fracture_strain, area, initial_length,
+                          fracture_tail=False):
         """
         Simulates material testing signals based on user inputs and sends them via serial communication.
 
@@ -170,17 +226,106 @@ class MaterialTestingSimulator:
             fracture_strain (float): Fracture strain of the material.
             area (float): Cross-sectional area of the specimen in mm^2.
             initial_length (float): Initial length of the specimen in mm.
+            fracture_tail (bool): Follow the curve with the load dropping to zero, as when a real specimen breaks.
         """
         mod_of_elasticity_in_gpa = modulus_of_elasticity * 10**3
         
         stress, strain = self.get_stress_strain(yield_stress, ultimate_stress, mod_of_elasticity_in_gpa, fracture_strain)
+        if fracture_tail:
+            stress = np.concatenate([stress, np.zeros(FRACTURE_TAIL_SAMPLES)])
+            strain = np.concatenate([strain, np.full(FRACTURE_TAIL_SAMPLES, strain[-1])])
         pressure_signals, displacement_signals = self.generate_signals(stress, strain, area, initial_length)
         
-        forces = [self.signal_to_force(p) for p in pressure_signals]
-        displacements = [self.signal_to_displacement(d) for d in displacement_signals]
-        
+        if self.compressor:
+            self.compressor.reset()
+        self.send_block(pressure_signals, displacement_signals)
+        self.flush_compressor()
+
+    def send_block(self, pressure_signals, displacement_signals):
+        """
+        Sends a block of simulated ADC counts, as raw counts or converted to units and optionally compressed.
+
+        Args:
+            pressure_signals (numpy.ndarray): Force channel counts.
+            displacement_signals (numpy.ndarray): Displacement channel counts.
+        """
+        if self.send_counts:
+            for pressure_signal, displacement_signal in zip(pressure_signals.tolist(), displacement_signals.tolist()):
+                self.serial_send(pressure_signal, displacement_signal)
+            return
+
+        forces, displacements = self.calibration.to_units(pressure_signals, displacement_signals)
+        forces, displacements = forces.tolist(), displacements.tolist()
+
+        if self.compressor is None:
+            for force, displacement in zip(forces, displacements):
+                self.serial_send(force, displacement)
+            return
+
         for force, displacement in zip(forces, displacements):
-            self.serial_send(force, displacement)
+            for index, kept_force, kept_displacement in self.compressor.add(force, displacement):
+                self.serial_send(kept_force, kept_displacement, index)
+
+    def flush_compressor(self):
+        """
+        Sends the samples still held by the compressor at the end of a simulation.
+        """
+        if self.compressor is None or self.send_counts:
+            return
+        for index, kept_force, kept_displacement in self.compressor.flush():
+            self.serial_send(kept_force, kept_displacement, index)
+
+    @traced("simulate_cyclic")
+    def simulate_cyclic(self, amplitude, mean, cycles, modulus_of_elasticity, amplitude_spread, area, initial_length):
+        """
+        Simulates a stress-controlled cyclic test and sends it cycle by cycle via serial communication.
+
+        Args:
+            amplitude (float): Stress amplitude in MPa.
+            mean (float): Mean stress in MPa.
+            cycles (int): Number of cycles.
+            modulus_of_elasticity (float): Modulus of elasticity of the material in GPa.
+            amplitude_spread (float): Relative standard deviation of the per-cycle amplitude.
+            area (float): Cross-sectional area of the specimen in mm^2.
+            initial_length (float): Initial length of the specimen in mm.
+        """
+        # The rig only measures tension and positive displacement, so the loading is shifted into that range
+        largest_amplitude = amplitude * (1 + 4 * amplitude_spread)
+        stress_offset = max(largest_amplitude - mean, 0)
+        strain_offset = None
+
+        if self.compressor:
+            self.compressor.reset()
+        for stress, strain in cyclic_waveform(amplitude, mean, cycles, youngs_modulus=modulus_of_elasticity * 10**3,
+                                              amplitude_spread=amplitude_spread):
+            if strain_offset is None:
+                strain_offset = 2 * max(-strain.min(), 0) + largest_amplitude / (modulus_of_elasticity * 10**3)
+            pressure_signals, displacement_signals = self.generate_signals(stress + stress_offset, strain + strain_offset,
+                                                                           area, initial_length)
+            self.send_block(pressure_signals, displacement_signals)
+        self.flush_compressor()
+
+    def start_cyclic_simulation(self, area, length):
+        """
+        Shows the cyclic loading dialog and starts a cyclic simulation thread.
+
+        Args:
+            area (float): Cross-sectional area of the specimen in mm^2.
+            length (float): Initial length of the specimen in mm.
+        """
+        inputs = self.cyclic_dialog.show()
+
+        if inputs:
+            simulation_thread = threading.Thread(target=self.simulate_cyclic, daemon=True, args=(
+                inputs['amplitude'],
+                inputs['mean'],
+                inputs['cycles'],
+                inputs['modulus_of_elasticity'],
+                inputs['amplitude_spread'],
+                area,
+                length
+            ))
+            simulation_thread.start()
     
     def start_simulation(self, area, length):
         """
@@ -193,12 +338,39 @@ class MaterialTestingSimulator:
         self.inputs = self.dialog.show()
         
         if self.inputs:
-            simulation_thread = threading.Thread(target=self.simulate_and_send, args=(
-                self.inputs['yield_stress'],
-                self.inputs['ultimate_stress'],
-                self.inputs['modulus_of_elasticity'],
-                self.inputs['fracture_stress'],
-                area,  # Specimen area value in mm^2
-                length  # Specimen initial length value in mm
-            ))
-            simulation_thread.start()
+            self.repeat_simulation(area, length)
+
+    def repeat_simulation(self, area, length, fracture_tail=False):
+        """
+        Starts a simulation thread with the material properties last entered in the input dialog.
+
+        Args:
+            area (float): Cross-sectional area of the specimen in mm^2.
+            length (float): Initial length of the specimen in mm.
+            fracture_tail (bool): Drop the load to zero after the curve, so fracture can be detected.
+
+        Returns:
+            bool: False if no material properties have been entered yet.
+        """
+        if not self.inputs:
+            return False
+        self.simulation_thread = threading.Thread(target=self.simulate_and_send, args=(
+            self.inputs['yield_stress'],
+            self.inputs['ultimate_stress'],
+            self.inputs['modulus_of_elasticity'],
+            self.inputs['fracture_stress'],
+            area,  # Specimen area value in mm^2
+            length,  # Specimen initial length value in mm
+            fracture_tail
+        ))
+        self.simulation_thread.start()
+        return True
+
+    def is_sending(self):
+        """
+        Checks whether the last started monotonic simulation is still sending samples.
+
+        Returns:
+            bool: True while the simulation thread is alive.
+        """
+        return self.simulation_thread is not None and self.simulation_thread.is_alive()
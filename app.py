@@ -1,23 +1,46 @@
+import time
+
+START_TIME = time.perf_counter()
+
+import queue
+import argparse
+import importlib
+import threading
 import tkinter as tk
-from Main.TestingSimulator import MaterialTestingSimulator
-from Main.DataCollector import DataCollector
-from Main.MainFrame import MainFrame
-from Main.InputFrame import InputFrame
-from math import pi
+from tkinter import messagebox
+from Main.InputFrame import InputFrame, specimen_data
+from Main.Profiler import tracer, DEFAULT_TRACE_FILE
+
+# Names of Main.Filters.FILTERS, listed here so parsing the command line does not import NumPy
+FILTER_CHOICES = ("low-pass", "moving-average", "savitzky-golay")
 
 class App:
     """
     Main application class managing the GUI and data flow for material testing simulation.
 
+    The input frame is shown before anything heavy is loaded. Serial ports are opened, and the NumPy,
+    pyserial and matplotlib based modules imported, on a background thread whose progress is reported in a
+    status line. The main frame is only built once the ports are ready.
+
     Attributes:
         root (tk.Tk): The main tkinter root window.
-        data_collector (DataCollector): Instance of DataCollector for collecting data from a serial port.
-        testing_simulator (MaterialTestingSimulator): Instance of MaterialTestingSimulator for simulation.
+        data_collector (DataCollector or None): Instance of DataCollector for collecting data from a serial port,
+            None until the port is open.
+        testing_simulator (MaterialTestingSimulator or None): Instance of MaterialTestingSimulator for simulation,
+            None until the port is open.
         input_frame (InputFrame): Instance of InputFrame for gathering speciemen parameters.
         main_frame (MainFrame): Instance of MainFrame for displaying simulation results.
+        analysis_filter (FilterStage or None): Noise filter applied to stored series before analysis.
+        publisher (SamplePublisher or None): Server streaming live samples to remote dashboards.
+        catalog (TestCatalog or None): Catalog of completed tests, None until opened or if it could not be opened.
+        status (tk.StringVar): Text of the status line.
+        device_error (Exception or None): Error raised while opening the serial ports or loading the plotting modules.
+        pending_data (dict or None): Specimen data submitted before the ports were ready.
+        startup_times (dict): Seconds from process start to each startup milestone.
     """
 
-    def __init__(self, root, main_serial_place, virtual_serial_place):
+    def __init__(self, root, main_serial_place, virtual_serial_place, compression_tolerance=None, filter_name=None,
+                 filter_offline=False, report_startup=False, serve_port=None, multiprocess=False, calibration_path=None):
         """
         Initializes the application with the root window and sets up initial components.
 
@@ -25,16 +48,170 @@ class App:
             root (tk.Tk): The main tkinter root window.
             main_serial_place (str): Serial port address from arduino for data collection.
             virutal_serial_place (str): Serial port address for virtual simulator.
+            compression_tolerance (tuple or None): Force (N) and displacement (mm) tolerances enabling
+                swinging-door compression on both ends of the serial link, or None to send every sample.
+            filter_name (str or None): Noise filter from ``Main.Filters.FILTERS``, or None to keep raw samples.
+            filter_offline (bool): Apply the filter to the stored series before analysis instead of to live samples.
+            report_startup (bool): Print the time taken to reach each startup milestone.
+            serve_port (int or None): TCP port streaming live samples to remote dashboards, or None to disable.
+            multiprocess (bool): Read the serial port in a separate process sharing a memory ring with the GUI.
+            calibration_path (str or None): Rig calibration file. The simulator then sends raw ADC counts and the
+                collector converts them with the calibration lookup tables.
         """
         self.root = root
         self.root.title("Data Collection and Graphing")
-        
-        # Initialize data collector and testing simulator
-        self.data_collector = DataCollector(main_serial_place)
-        self.testing_simulator = MaterialTestingSimulator(self.root, virtual_serial_place)
-        
+
+        self.data_collector = None
+        self.testing_simulator = None
+        self.analysis_filter = None
+        self.publisher = None
+        self.catalog = None
+        self.device_error = None
+        self.pending_data = None
+        self.report_startup = report_startup
+        self.startup_times = {}
+        self.device_queue = queue.Queue()
+
+        self.status = tk.StringVar(value=f"Opening serial ports {main_serial_place} and {virtual_serial_place}...")
+        self.status_label = tk.Label(self.root, textvariable=self.status, anchor='w')
+        self.status_label.grid(row=1, column=0, padx=10, pady=(0, 5), sticky='ew')
+
         # Show the input frame initially
         self.show_input_frame()
+        self.root.after_idle(self.record_startup, "first window")
+
+        # Open the ports and load the heavy modules while the operator fills in the specimen details
+        device_thread = threading.Thread(target=self.open_devices, daemon=True, args=(
+            main_serial_place, virtual_serial_place, compression_tolerance, filter_name, filter_offline, serve_port,
+            multiprocess, calibration_path))
+        device_thread.start()
+        self.root.after(50, self.poll_devices)
+
+    def record_startup(self, milestone):
+        """
+        Records the time from process start to a startup milestone.
+
+        Args:
+            milestone (str): Name of the milestone.
+        """
+        elapsed = time.perf_counter() - START_TIME
+        self.startup_times[milestone] = elapsed
+        if self.report_startup:
+            print(f"Startup: {milestone} after {elapsed * 1000:.0f} ms")
+
+    def open_devices(self, main_serial_place, virtual_serial_place, compression_tolerance, filter_name, filter_offline,
+                     serve_port, multiprocess, calibration_path):
+        """
+        Opens the serial ports on a background thread and reports the outcome through the device queue.
+
+        Args:
+            main_serial_place (str): Serial port address from arduino for data collection.
+            virtual_serial_place (str): Serial port address for virtual simulator.
+            compression_tolerance (tuple or None): Force and displacement compression tolerances.
+            filter_name (str or None): Noise filter name.
+            filter_offline (bool): Apply the filter before analysis instead of to live samples.
+            serve_port (int or None): TCP port for the live sample publisher, or None to disable it.
+            multiprocess (bool): Read the serial port in a separate acquisition process.
+            calibration_path (str or None): Rig calibration file, or None for the legacy rig sending units.
+        """
+        try:
+            from Main.DataCollector import DataCollector
+            from Main.TestingSimulator import MaterialTestingSimulator
+            from Main.Compression import SwingingDoorCompressor
+            from Main.Filters import FilterStage
+            from Main.StreamServer import SamplePublisher
+            from Main.Catalog import TestCatalog
+            from Main.Calibration import RigCalibration
+
+            calibration = RigCalibration.load(calibration_path) if calibration_path else None
+
+            # Each end of the link keeps its own compressor state
+            collector_compressor = None
+            simulator_compressor = None
+            if compression_tolerance:
+                collector_compressor = SwingingDoorCompressor(*compression_tolerance)
+                # Raw counts are compressed by the collector after conversion, not by the simulator
+                if calibration is None:
+                    simulator_compressor = SwingingDoorCompressor(*compression_tolerance)
+
+            live_filter = None
+            analysis_filter = None
+            if filter_name and filter_offline:
+                analysis_filter = FilterStage(filter_name)
+            elif filter_name:
+                live_filter = FilterStage(filter_name)
+
+            publisher = None
+            if serve_port is not None:
+                publisher = SamplePublisher(port=serve_port)
+                publisher.start()
+
+            if multiprocess:
+                # The acquisition process builds its own compressor and filter from the same settings
+                from Main.SharedAcquisition import SharedMemoryCollector
+                data_collector = SharedMemoryCollector(main_serial_place, compression_tolerance,
+                                                       None if filter_offline else filter_name, publisher, calibration)
+            else:
+                data_collector = DataCollector(main_serial_place, compressor=collector_compressor,
+                                               filter_stage=live_filter, publisher=publisher, calibration=calibration)
+            testing_simulator = MaterialTestingSimulator(self.root, virtual_serial_place, compressor=simulator_compressor,
+                                                         calibration=calibration, send_counts=calibration is not None)
+            catalog = TestCatalog()
+        except Exception as error:
+            self.device_queue.put(("error", error))
+            return
+
+        self.device_queue.put(("ready", (data_collector, testing_simulator, analysis_filter, publisher, catalog)))
+
+        # Warm up the plotting modules so the first main frame does not pay for the matplotlib import
+        try:
+            importlib.import_module("Main.MainFrame")
+        except Exception as error:
+            self.device_queue.put(("plotting", error))
+            return
+        self.device_queue.put(("plotting", None))
+
+    def poll_devices(self):
+        """
+        Applies the results of the background startup thread on the Tk thread.
+        """
+        while True:
+            try:
+                event, payload = self.device_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if event == "error":
+                self.device_error = payload
+                self.status.set(f"Could not open serial ports: {payload}")
+                self.record_startup("ports failed")
+                if self.pending_data is not None:
+                    # The specimen was submitted while waiting, give the operator the input frame back
+                    self.pending_data = None
+                    self.input_frame.grid()
+                    messagebox.showerror("Serial port error", f"Could not open serial ports: {payload}")
+                return
+            if event == "ready":
+                self.data_collector, self.testing_simulator, self.analysis_filter, self.publisher, self.catalog = payload
+                if self.publisher:
+                    self.status.set(f"Serial ports ready, streaming samples on port {self.publisher.port}")
+                else:
+                    self.status.set("Serial ports ready")
+                self.record_startup("ports ready")
+                if self.pending_data is not None:
+                    data, self.pending_data = self.pending_data, None
+                    self.show_main_frame(data)
+            elif event == "plotting":
+                if payload is not None:
+                    self.device_error = payload
+                    self.status.set(f"Could not load the plotting modules: {payload}")
+                    self.record_startup("plotting failed")
+                    messagebox.showerror("Startup error", self.status.get())
+                    return
+                self.record_startup("plotting loaded")
+                return
+
+        self.root.after(50, self.poll_devices)
 
     def show_input_frame(self):
         """
@@ -56,24 +233,18 @@ class App:
 
         Constructs data dictionary based on shape and passes it to main frame for simulation display.
         """
-        if shape == "rounded":
-            data = {
-                "shape": shape,
-                "diameter": diameter,
-                "area": (pi / 4) * (diameter ** 2),
-                "initial_length": initial_length
-            }
-        else:
-            data = {
-                "shape": shape,
-                "width": width,
-                "height": height,
-                "area": (width * height),
-                "initial_length": initial_length
-            }
+        data = specimen_data(shape, diameter, width, height, initial_length)
+
+        if self.device_error is not None:
+            messagebox.showerror("Startup error", self.status.get())
+            return
 
         # Hide input frame and display main frame with collected data
         self.input_frame.grid_remove()
+        if self.data_collector is None:
+            self.pending_data = data
+            self.status.set("Waiting for serial ports...")
+            return
         self.show_main_frame(data)
 
     def show_main_frame(self, data):
@@ -83,13 +254,61 @@ class App:
         Args:
             data (dict): Dictionary containing input parameters for the simulation.
         """
-        self.main_frame = MainFrame(self.root, data, self.data_collector, self.testing_simulator, self.show_input_frame)
+        try:
+            from Main.MainFrame import MainFrame
+        except Exception as error:
+            self.device_error = error
+            self.status.set(f"Could not load the plotting modules: {error}")
+            self.input_frame.grid()
+            messagebox.showerror("Startup error", self.status.get())
+            return
+
+        self.main_frame = MainFrame(self.root, data, self.data_collector, self.testing_simulator, self.show_input_frame, self.analysis_filter, self.catalog)
         self.main_frame.grid(row=0, column=0, padx=10, pady=10, sticky='nsew')
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stress-strain curve generator")
+    parser.add_argument("--trace", nargs="?", const=DEFAULT_TRACE_FILE, default=None, metavar="FILE",
+                        help="record hot-path timings and write a Chrome/Perfetto trace to FILE on exit")
+    parser.add_argument("--filter", choices=FILTER_CHOICES, default=None,
+                        help="smooth force and displacement before analysis")
+    parser.add_argument("--filter-offline", action="store_true",
+                        help="filter the stored series when analysing instead of the live samples")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print the time taken to show the first window, open the ports and load plotting")
+    parser.add_argument("--serve", nargs="?", type=int, const=8765, default=None, metavar="PORT",
+                        help="stream live samples to remote dashboards on a local TCP port (default: 8765)")
+    parser.add_argument("--calibration", default=None, metavar="FILE",
+                        help="rig calibration file, the rig then sends raw ADC counts converted by lookup tables")
+    parser.add_argument("--compress", nargs=2, type=float, default=None, metavar=("FORCE_TOL", "DISP_TOL"),
+                        help="swinging-door compress the sample stream within force (N) and displacement (mm) tolerances")
+    parser.add_argument("--multiprocess", action="store_true",
+                        help="read the serial port in a separate process so redraws never delay acquisition")
+    args = parser.parse_args()
+    if args.filter_offline and not args.filter:
+        parser.error("--filter-offline needs a filter selected with --filter")
+    if args.compress and min(args.compress) < 0:
+        parser.error("--compress tolerances must not be negative")
+
+    if args.trace:
+        tracer.enable(args.trace)
+
     # Initialize tkinter root window and application
     root = tk.Tk()
     # Replace "COM4" with the appropriate serial port for the arduino, or the reciever serial port.
     # Replace "COM2" with the virtual serial port, that will send the data.
-    app = App(root, "COM4", "COM2")  
+    app = App(root, "COM4", "COM2", compression_tolerance=tuple(args.compress) if args.compress else None,
+              filter_name=args.filter, filter_offline=args.filter_offline,
+              report_startup=args.startup_report, serve_port=args.serve, multiprocess=args.multiprocess,
+              calibration_path=args.calibration)
     root.mainloop()
+
+    if args.multiprocess and app.data_collector:
+        app.data_collector.close()
+    if app.publisher:
+        app.publisher.stop()
+    if app.catalog:
+        app.catalog.close()
+
+    if tracer.enabled:
+        tracer.export_chrome_trace()
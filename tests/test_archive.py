@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from Main.Archive import ArchiveReader, decode_column, encode_column, is_archive, write_archive
+from Main.TestSession import TestSession as Session
+
+
+def make_session(count=10000):
+    rng = np.random.default_rng(0)
+    session = Session({"shape": "rounded", "diameter": 10.0, "area": 78.54, "initial_length": 50.0})
+    displacement = 1.0 + np.cumsum(rng.random(count)) * 1e-3
+    force = 40000 * np.sin(np.linspace(0, 3, count)) + rng.normal(0, 5, count)
+    session.extend(force, displacement, np.arange(count) * 0.01, np.arange(count) * 3)
+    session.started_at = 1700000000.5
+    return session
+
+
+@pytest.mark.parametrize("values", [
+    np.array([0.0, -0.0, 1.5, np.inf, -np.inf, 1e-308, 3.14]),
+    np.arange(-5, 1000, dtype=np.int64),
+    np.empty(0),
+])
+def test_column_encoding_is_lossless(values):
+    decoded = decode_column(encode_column(values), len(values), values.dtype)
+    assert decoded.dtype == values.dtype
+    np.testing.assert_array_equal(decoded.view(np.uint8), values.view(np.uint8))
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_round_trip(tmp_path, codec):
+    session = make_session()
+    path = str(tmp_path / "test.ssa")
+    write_archive(path, session, chunk_size=1000, codec=codec)
+    assert is_archive(path)
+
+    with ArchiveReader(path) as reader:
+        assert len(reader) == len(session) and len(reader.index) == 10
+        assert reader.initial_data == session.initial_data
+        loaded = reader.load_session()
+    assert loaded.started_at == session.started_at
+    for column in ("time", "force", "displacement", "sample_index"):
+        np.testing.assert_array_equal(getattr(loaded, column), getattr(session, column))
+
+
+def test_partial_reads_only_touch_the_needed_chunks(tmp_path):
+    session = make_session()
+    path = str(tmp_path / "test.ssa")
+    write_archive(path, session, chunk_size=1000)
+
+    with ArchiveReader(path) as reader:
+        rows = reader.read_rows(2500, 3700)
+        np.testing.assert_array_equal(rows["force"], session.force[2500:3700])
+        assert sorted(reader.cache) == [2, 3]
+
+        window = reader.read_time(12.0, 13.5)
+        np.testing.assert_array_equal(window["sample_index"], session.sample_index[1200:1351])
+
+        matching = reader.read_where("force", 39000, 41000)
+        selection = (session.force >= 39000) & (session.force <= 41000)
+        np.testing.assert_array_equal(matching["force"], session.force[selection])
+
+        strain, stress = reader.read_strain_window(0.01, 0.02)
+        selection = (session.strain >= 0.01) & (session.strain <= 0.02)
+        np.testing.assert_allclose(strain, session.strain[selection])
+        np.testing.assert_allclose(stress, session.stress[selection])
+
+        assert reader.column_range("time") == (0.0, session.time[-1])
+        assert len(reader.read_rows(5, 5)["force"]) == 0
+
+
+def test_empty_session(tmp_path):
+    path = str(tmp_path / "empty.ssa")
+    write_archive(path, Session({"area": 1.0, "initial_length": 1.0}))
+    with ArchiveReader(path) as reader:
+        assert len(reader) == 0 and reader.column_range("force") == (None, None)
+        assert len(reader.load_session()) == 0
+
+
+def test_invalid_files_are_rejected(tmp_path):
+    path = tmp_path / "test.ssa"
+    write_archive(str(path), make_session(100))
+    data = path.read_bytes()
+    path.write_bytes(data[:-4])
+    with pytest.raises(ValueError):
+        ArchiveReader(str(path))
+
+    other = tmp_path / "other.ssa"
+    other.write_bytes(b"not an archive at all")
+    assert not is_archive(str(other))
+    with pytest.raises(ValueError):
+        ArchiveReader(str(other))
+    with pytest.raises(ValueError):
+        write_archive(str(tmp_path / "bad.ssa"), make_session(10), codec="bz2")
@@ -0,0 +1,63 @@
+import json
+import numpy as np
+import pytest
+from Main.Calibration import (ChannelCalibration, RigCalibration, LEGACY_FORCE_FULL_SCALE,
+                              LEGACY_DISPLACEMENT_FULL_SCALE)
+
+
+def test_legacy_calibration_is_linear():
+    rig = RigCalibration.legacy()
+    force, displacement = rig.to_units(np.array([0, 1023]), np.array([0, 1023]))
+    np.testing.assert_allclose(force, [0.0, LEGACY_FORCE_FULL_SCALE])
+    np.testing.assert_allclose(displacement, [0.0, LEGACY_DISPLACEMENT_FULL_SCALE])
+    assert rig.to_units(5000, -3) == (LEGACY_FORCE_FULL_SCALE, 0.0)
+
+
+@pytest.mark.parametrize("channel", [
+    ChannelCalibration("N", points=[(4095, 400000.0), (0, 0.0), (2048, 198500.0)]),
+    ChannelCalibration("N", points=[(0, 0.0), (2048, 198500.0), (4095, 401200.0)], degree=2),
+    ChannelCalibration("mm", polynomial=[1.0, 0.01221]),
+    ChannelCalibration("mm", polynomial=[50.0, -0.01]),
+])
+def test_counts_invert_the_table(channel):
+    channel.compile(12)
+    counts = np.arange(0, 4096, 7)
+    np.testing.assert_array_equal(channel.counts(channel.convert(counts)), counts)
+
+
+def test_points_are_sorted_and_interpolated():
+    channel = ChannelCalibration("N", points=[(1023, 100.0), (0, 0.0), (512, 60.0)])
+    channel.compile(10)
+    assert channel.convert(256) == pytest.approx(30.0)
+    assert channel.convert(512) == pytest.approx(60.0)
+
+
+def test_invalid_calibrations_are_rejected():
+    with pytest.raises(ValueError):
+        ChannelCalibration("N")
+    with pytest.raises(ValueError):
+        ChannelCalibration("N", points=[(0, 0.0), (10, 1.0)], degree=2)
+    with pytest.raises(ValueError):
+        ChannelCalibration("N", polynomial=[0.0, 1.0, -0.001]).compile(12)
+    with pytest.raises(ValueError):
+        RigCalibration("rig", 14, ChannelCalibration("N", polynomial=[0.0, 1.0]),
+                       ChannelCalibration("mm", polynomial=[0.0, 1.0]))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    rig = RigCalibration("Press 2", 12,
+                         ChannelCalibration("N", points=[(0, 0.0), (2048, 198500.0), (4095, 401200.0)], degree=2),
+                         ChannelCalibration("mm", polynomial=[0.0, 0.01221]))
+    path = str(tmp_path / "rig.json")
+    rig.save(path)
+    loaded = RigCalibration.load(path)
+    assert loaded.name == "Press 2" and loaded.adc_bits == 12
+    np.testing.assert_allclose(loaded.force.table, rig.force.table)
+    np.testing.assert_allclose(loaded.displacement.table, rig.displacement.table)
+
+
+def test_invalid_file_raises_value_error(tmp_path):
+    path = tmp_path / "rig.json"
+    path.write_text(json.dumps({"adc_bits": 12, "force": {"unit": "N", "polynomial": [0, 1]}}))
+    with pytest.raises(ValueError):
+        RigCalibration.load(str(path))
@@ -0,0 +1,74 @@
+import os
+import numpy as np
+import pytest
+from Main.Catalog import TestCatalog as Catalog
+from Main.TestSession import TestSession as Session
+
+PROPERTIES = {"Yield Stress (MPa)": 250.0, "Ultimate Tensile Strength (MPa)": 400.0, "Young's Modulus (MPa)": 2e5}
+
+
+def make_session(diameter=10.0):
+    session = Session({"shape": "rounded", "diameter": diameter, "area": 78.54, "initial_length": 50.0})
+    session.extend(np.linspace(0, 1000, 20), np.linspace(0, 1, 20))
+    return session
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    opened = Catalog(str(tmp_path / "catalog.sqlite3"), str(tmp_path / "data"))
+    yield opened
+    opened.close()
+
+
+def test_submitted_tests_are_saved_and_queryable(catalog):
+    catalog.submit(make_session(10.0), PROPERTIES, finished_at=1000.0)
+    catalog.submit(make_session(12.0), dict(PROPERTIES, **{"Yield Stress (MPa)": 350.0}), finished_at=2000.0)
+    catalog.flush()
+
+    assert catalog.count() == 2
+    rows = catalog.query()
+    assert [row["finished_at"] for row in rows] == [2000.0, 1000.0]
+    assert [row["diameter"] for row in catalog.query(shape="rounded", diameter=10.02)] == [10.0]
+    assert [row["yield_stress"] for row in catalog.query(min_yield=300)] == [350.0]
+    assert catalog.query(since=1500.0, until=2500.0)[0]["diameter"] == 12.0
+    assert catalog.query(shape="rectangular") == []
+
+    loaded = Session.load(rows[1]["data_path"])
+    np.testing.assert_allclose(loaded.force, make_session().force)
+
+
+def test_same_millisecond_gets_separate_data_files(catalog):
+    for diameter in (10.0, 11.0, 12.0):
+        catalog.submit(make_session(diameter), PROPERTIES, finished_at=1000.0)
+    catalog.flush()
+
+    paths = [row["data_path"] for row in catalog.query()]
+    assert len(set(paths)) == 3
+    assert sorted(Session.load(path).initial_data["diameter"] for path in paths) == [10.0, 11.0, 12.0]
+
+
+def test_properties_can_be_calculated_on_the_writer(catalog):
+    catalog.submit(make_session(), lambda session: {"Yield Stress (MPa)": float(len(session))})
+
+    def failing(session):
+        raise ZeroDivisionError
+
+    catalog.submit(make_session(), failing)
+    catalog.flush()
+
+    rows = sorted(catalog.query(), key=lambda row: row["id"])
+    assert rows[0]["yield_stress"] == 20.0
+    assert rows[1]["yield_stress"] is None and rows[1]["diameter"] == 10.0
+    assert all(os.path.exists(row["data_path"]) for row in rows)
+
+
+def test_catalog_reopens_with_its_rows(tmp_path):
+    path = str(tmp_path / "catalog.sqlite3")
+    first = Catalog(path, str(tmp_path / "data"))
+    first.submit(make_session(), PROPERTIES)
+    first.close()
+    second = Catalog(path, str(tmp_path / "data"))
+    try:
+        assert second.count() == 1
+    finally:
+        second.close()
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from Main.ComparisonView import decimate_min_max, toe_offset
+
+
+def test_short_curves_are_kept_whole():
+    x = np.arange(10)
+    decimated_x, decimated_y = decimate_min_max(x, x * 2.0, max_points=10)
+    np.testing.assert_array_equal(decimated_x, x)
+    np.testing.assert_array_equal(decimated_y, x * 2.0)
+
+
+@pytest.mark.parametrize("count", [1001, 1999, 12345, 200000])
+def test_decimation_keeps_the_extremes_in_order(count):
+    rng = np.random.default_rng(count)
+    x = np.arange(count, dtype=float)
+    y = rng.normal(size=count)
+    decimated_x, decimated_y = decimate_min_max(x, y, max_points=1000)
+
+    assert len(decimated_y) <= 1001
+    assert decimated_y.max() == y.max() and decimated_y.min() == y.min()
+    assert np.all(np.diff(decimated_x) > 0)
+    assert decimated_x[-1] == count - 1
+    np.testing.assert_array_equal(decimated_y, y[decimated_x.astype(int)])
+
+
+def test_peak_in_the_tail_survives():
+    y = np.zeros(1000)
+    y[995] = 5.0
+    _, decimated_y = decimate_min_max(np.arange(1000), y, max_points=100)
+    assert decimated_y.max() == 5.0
+
+
+def test_toe_offset_finds_the_shifted_elastic_origin():
+    modulus = 200000.0
+    strain = np.linspace(0, 0.01, 2001)
+    # Slack take-up of 0.0005 before a linear elastic line, capped at the yield stress
+    stress = np.minimum(modulus * np.maximum(strain - 0.0005, 0.0), 300.0)
+    assert toe_offset(strain, stress, 300.0) == pytest.approx(0.0005, abs=1e-5)
+
+
+def test_toe_offset_without_an_elastic_region():
+    strain = np.linspace(0, 0.01, 10)
+    assert toe_offset(strain, np.zeros(10), 300.0) == 0.0
+    assert toe_offset(strain, strain * 1000, 0.0) == 0.0
+    assert toe_offset(strain[:1], strain[:1], 300.0) == 0.0
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from Main.Compression import SwingingDoorCompressor, compress_series, reconstruct, is_compressed
+
+
+def noisy_ramp(count=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    displacement = np.linspace(0, 5, count) + rng.normal(0, 0.001, count)
+    force = 1000 * np.sin(np.linspace(0, 3, count)) + rng.normal(0, 0.5, count)
+    return force, displacement
+
+
+def test_reconstruction_stays_within_tolerance():
+    force, displacement = noisy_ramp()
+    kept = compress_series(force, displacement, 2.0, 0.005)
+
+    assert kept[0] == 0 and kept[-1] == len(force) - 1
+    assert len(kept) < len(force) // 2
+    assert np.all(np.diff(kept) > 0)
+    assert np.max(np.abs(reconstruct(kept, force[kept]) - force)) <= 2.0 + 1e-9
+    assert np.max(np.abs(reconstruct(kept, displacement[kept]) - displacement)) <= 0.005 + 1e-9
+
+
+def test_zero_tolerance_keeps_every_sample_of_a_curve():
+    force = np.linspace(0, 1, 50) ** 2
+    kept = compress_series(force, np.zeros(50), 0.0, 0.0)
+    assert np.array_equal(kept, np.arange(50))
+
+
+def test_straight_line_keeps_only_its_ends():
+    kept = compress_series(np.linspace(0, 100, 500), np.linspace(0, 1, 500), 0.1, 0.001)
+    assert list(kept) == [0, 499]
+
+
+def test_streaming_matches_offline_and_flush_closes_the_stream():
+    force, displacement = noisy_ramp(500, seed=1)
+    compressor = SwingingDoorCompressor(1.0, 0.002)
+    streamed = []
+    for f, d in zip(force, displacement):
+        streamed.extend(compressor.add(f, d))
+    streamed.extend(compressor.flush())
+
+    assert [index for index, _, _ in streamed] == list(compress_series(force, displacement, 1.0, 0.002))
+    assert all(f == force[index] and d == displacement[index] for index, f, d in streamed)
+    assert compressor.flush() == []
+
+
+def test_reset_restarts_the_indices():
+    compressor = SwingingDoorCompressor(1.0, 1.0)
+    compressor.add(0.0, 0.0)
+    compressor.add(1.0, 1.0)
+    compressor.reset()
+    assert compressor.add(5.0, 5.0) == [(0, 5.0, 5.0)]
+
+
+def test_negative_tolerance_is_rejected():
+    with pytest.raises(ValueError):
+        SwingingDoorCompressor(-1.0, 0.0)
+
+
+def test_is_compressed():
+    assert not is_compressed(np.arange(10))
+    assert is_compressed(np.array([0, 1, 5]))
+    assert not is_compressed(np.array([], dtype=int))
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from Main.Cyclic import (CYCLE_DTYPE, CycleHistory, CyclicAnalyzer, RainflowCounter, TurningPointDetector,
+                         cyclic_waveform)
+
+
+def range_counts(counter):
+    ranges = {}
+    for range_index, mean_index in zip(*np.nonzero(counter.counts)):
+        key = float(range_index * counter.range_width)
+        ranges[key] = ranges.get(key, 0.0) + float(counter.counts[range_index, mean_index])
+    return ranges
+
+
+def test_rainflow_matches_the_astm_e1049_example():
+    counter = RainflowCounter()
+    for value in (-2, 1, -3, 5, -1, 3, -4, 4, -2):
+        counter.push(value)
+    counter.finish()
+    assert range_counts(counter) == {3.0: 0.5, 4.0: 1.5, 6.0: 0.5, 8.0: 1.0, 9.0: 0.5}
+    assert counter.cycles == 4.0
+    assert counter.largest_range == 9
+
+
+def test_rainflow_bins_widen_without_losing_cycles():
+    counter = RainflowCounter(range_bins=8, mean_bins=8, initial_width=1.0)
+    for value in (0, 3, 0, 500, -500, 500, 0, 3):
+        counter.push(value)
+    counter.finish()
+    assert counter.counts.shape == (8, 8)
+    assert counter.counts.sum() == counter.cycles
+    assert counter.range_width * 8 > counter.largest_range == 1000
+    assert counter.mean_edges()[0] < 0 < counter.mean_edges()[-1]
+    assert len(counter.range_edges()) == 9
+
+
+def test_turning_points_alternate_and_ignore_noise():
+    rng = np.random.default_rng(0)
+    signal = 100 * np.sin(np.linspace(0, 10 * np.pi, 2000)) + rng.normal(0, 1, 2000)
+    detector = TurningPointDetector(hysteresis=10.0)
+    points = [point for point in map(detector.push, signal) if point is not None]
+
+    assert len(points) == 10
+    assert all(first[2] != second[2] for first, second in zip(points, points[1:]))
+    assert all(abs(value) > 95 for value, _, _ in points)
+    assert all(signal[position] == value for value, position, _ in points)
+
+
+def test_cycle_history_thins_old_cycles():
+    history = CycleHistory(capacity=16)
+    for cycle in range(1, 2001):
+        history.add((cycle, 1.0, -1.0, 0.01, -0.01, 0.5))
+
+    latest = history.latest()
+    assert list(latest["cycle"]) == list(range(1985, 2001))
+    overview = history.overview()
+    assert overview.dtype == CYCLE_DTYPE
+    cycles = list(overview["cycle"])
+    assert cycles == sorted(cycles)
+    assert cycles[:12] == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 20, 30]
+    assert 1000 in cycles and 1010 not in cycles
+    assert len(overview) < 60
+
+
+def test_analyzer_counts_constant_amplitude_cycles():
+    area, initial_length = 50.0, 25.0
+    analyzer = CyclicAnalyzer(area, initial_length, window=500)
+    summaries = []
+    for stress, strain in cyclic_waveform(200.0, 50.0, 30):
+        for sample_stress, sample_strain in zip(stress, strain):
+            summary = analyzer.add(sample_stress * area, sample_strain * initial_length)
+            if summary is not None:
+                summaries.append(summary)
+    analyzer.finish()
+
+    assert analyzer.cycles == len(summaries) >= 28
+    for cycle, peak, valley, _, _, energy in summaries:
+        assert peak == pytest.approx(250.0, abs=1.0)
+        assert valley == pytest.approx(-150.0, abs=1.0)
+        assert energy > 0
+    assert analyzer.rainflow.cycles == pytest.approx(30, abs=1)
+    strain, stress = analyzer.latest_samples()
+    assert len(strain) == len(stress) == 500
+
+
+def test_waveform_amplitude_spread_is_reproducible():
+    first = [stress.max() for stress, _ in cyclic_waveform(100.0, 0.0, 5, amplitude_spread=0.2, seed=1)]
+    second = [stress.max() for stress, _ in cyclic_waveform(100.0, 0.0, 5, amplitude_spread=0.2, seed=1)]
+    assert first == second
+    assert len(set(np.round(first, 6))) > 1
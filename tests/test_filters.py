@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from Main.Filters import (FILTERS, OFFLINE_FILTERS, FilterStage, LowPassFilter, MovingAverageFilter,
+                          SavitzkyGolayFilter, moving_average, savitzky_golay, low_pass)
+
+
+def noisy_series(count=500, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.sin(np.linspace(0, 6, count)) + rng.normal(0, 0.05, count)
+
+
+@pytest.mark.parametrize("name", sorted(FILTERS))
+def test_block_processing_matches_one_pass(name):
+    values = noisy_series()
+    whole = FILTERS[name]().process(values)
+    streaming = FILTERS[name]()
+    blocks = np.concatenate([streaming.process(block) for block in np.array_split(values, 37)])
+    np.testing.assert_allclose(blocks, whole, atol=1e-12)
+
+
+def test_streaming_moving_average_is_causal():
+    values = noisy_series(50)
+    expected = [values[max(0, i - 4):i + 1].mean() for i in range(len(values))]
+    np.testing.assert_allclose(MovingAverageFilter(5).process(values), expected)
+
+
+def test_low_pass_matches_the_recursion():
+    values = noisy_series(600)
+    low_pass_filter = LowPassFilter(5.0, 50.0, block_size=64)
+    output = low_pass_filter.process(values)
+    expected = []
+    last = values[0]
+    for value in values:
+        last = low_pass_filter.alpha * value + (1 - low_pass_filter.alpha) * last
+        expected.append(last)
+    np.testing.assert_allclose(output, expected, atol=1e-12)
+
+
+def test_savitzky_golay_preserves_its_polynomial_order():
+    x = np.linspace(-1, 1, 100)
+    cubic = 2 * x ** 3 - x + 0.5
+    np.testing.assert_allclose(savitzky_golay(cubic, 11, 3)[5:-5], cubic[5:-5], atol=1e-10)
+    np.testing.assert_allclose(SavitzkyGolayFilter(11, 3).process(cubic)[10:], cubic[10:], atol=1e-10)
+
+
+def test_savitzky_golay_rejects_invalid_windows():
+    with pytest.raises(ValueError):
+        savitzky_golay(np.zeros(50), 10, 3)
+    with pytest.raises(ValueError):
+        SavitzkyGolayFilter(3, 3)
+
+
+@pytest.mark.parametrize("name", sorted(OFFLINE_FILTERS))
+def test_offline_filters_keep_length_and_add_no_lag(name):
+    ramp = np.linspace(0, 10, 400)
+    filtered = OFFLINE_FILTERS[name](ramp)
+    assert len(filtered) == len(ramp)
+    np.testing.assert_allclose(filtered[50:-50], ramp[50:-50], atol=1e-6)
+    assert len(OFFLINE_FILTERS[name](ramp[:3])) == 3
+
+
+def test_moving_average_window_longer_than_the_series():
+    np.testing.assert_allclose(moving_average([1.0, 2.0, 3.0], 9), [1.5, 2.0, 2.5])
+    assert len(low_pass([1.0], 5.0, 50.0)) == 1
+
+
+def test_filter_stage_buffers_blocks():
+    stage = FilterStage("moving-average", block_size=4)
+    outputs = [stage.push(float(i), float(i)) for i in range(6)]
+    assert [len(force) for force, _ in outputs] == [0, 0, 0, 4, 0, 0]
+    force, displacement = stage.flush()
+    assert len(force) == len(displacement) == 2
+
+    stage.reset()
+    assert stage.force_buffer == [] and stage.displacement_buffer == []
+
+
+def test_filter_stage_applies_the_offline_filter():
+    values = noisy_series()
+    force, displacement = FilterStage("savitzky-golay").apply(values, values)
+    np.testing.assert_allclose(force, savitzky_golay(values, 21, 3))
+    np.testing.assert_allclose(displacement, force)
+    streaming, _ = FilterStage(FILTERS["low-pass"]).apply(values, values)
+    np.testing.assert_allclose(streaming, LowPassFilter(5.0, 50.0).process(values))
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from Main.ModelFitting import (ConstitutiveModel, HollomonModel, VoceModel, RambergOsgoodModel, fit_all_models,
+                               fit_models_batch, pad_curves)
+
+MODULUS = 200000.0
+
+
+def hollomon_curve(k=600.0, n=0.2, count=3000):
+    strain = np.linspace(0, 0.2, count)
+    stress = np.minimum(MODULUS * strain, k * np.maximum(strain, 1e-12) ** n)
+    uts = int(np.argmax(stress))
+    yield_index = int(np.argmax(MODULUS * strain > stress))
+    properties = {
+        "Young's Modulus (MPa)": MODULUS,
+        "Yield Stress (MPa)": float(stress[yield_index]),
+        "Yield Strain": float(strain[yield_index]),
+        "Ultimate Tensile Strength (MPa)": float(stress[uts]),
+        "Strain at UTS": float(strain[uts]),
+    }
+    return strain, stress, properties
+
+
+def test_hollomon_parameters_are_recovered():
+    model = HollomonModel.fit(*hollomon_curve())
+    k, n = model.parameters
+    assert k == pytest.approx(600.0, rel=1e-3)
+    assert n == pytest.approx(0.2, rel=1e-3)
+    assert model.rms < 1e-3
+    assert model.as_dict() == {"K": k, "n": n}
+    assert model.describe().startswith("Hollomon: K=")
+
+
+def test_voce_fits_a_saturating_curve():
+    strain = np.linspace(0, 0.15, 3000)
+    yield_strain = 300.0 / MODULUS
+    stress = np.where(strain < yield_strain, MODULUS * strain,
+                      300.0 + 150.0 * (1 - np.exp(-40.0 * (strain - yield_strain))))
+    properties = {"Young's Modulus (MPa)": MODULUS, "Yield Stress (MPa)": 300.0, "Yield Strain": yield_strain,
+                  "Ultimate Tensile Strength (MPa)": float(stress.max()), "Strain at UTS": float(strain[-1])}
+    s0, q, b = VoceModel.fit(strain, stress, properties).parameters
+    assert (s0, q, b) == pytest.approx((300.0, 150.0, 40.0), rel=1e-3)
+
+
+def test_best_model_comes_first():
+    models, elapsed = fit_all_models(*hollomon_curve())
+    assert models[0].name == "Hollomon"
+    assert {model.name for model in models} == {"Hollomon", "Voce", "Ramberg-Osgood"}
+    assert elapsed >= 0
+    np.testing.assert_allclose(models[0].stress([0.0, 0.1]), [0.0, 600.0 * 0.1 ** 0.2], rtol=1e-3)
+
+
+def test_batch_fit_matches_single_fits():
+    curves = [hollomon_curve(k, n) for k, n in ((500.0, 0.15), (600.0, 0.2), (700.0, 0.3))]
+    ranked, _ = fit_models_batch(curves)
+    for curve, models in zip(curves, ranked):
+        single, _ = fit_all_models(*curve)
+        for batch_model, single_model in zip(models, single):
+            assert batch_model.name == single_model.name
+            np.testing.assert_allclose(batch_model.parameters, single_model.parameters, rtol=1e-6)
+
+
+def test_curve_without_hardening_region_does_not_block_the_batch():
+    good = hollomon_curve()
+    strain, stress, properties = hollomon_curve()
+    bad = (strain, stress, dict(properties, **{"Yield Strain": 1.0}))
+    ranked, _ = fit_models_batch([good, bad])
+    assert ranked[0][0].name == "Hollomon"
+    assert [model.name for model in ranked[1]] == ["Ramberg-Osgood"]
+
+    with pytest.raises(ValueError):
+        fit_all_models(strain, -stress, properties)
+
+
+def test_pad_curves_masks_padding_and_empty_curves():
+    x, y, mask = pad_curves([(np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0])), (np.empty(0), np.empty(0))])
+    assert x.shape == y.shape == mask.shape == (2, 3)
+    np.testing.assert_array_equal(mask, [[1, 1, 1], [0, 0, 0]])
+    assert np.all(np.isfinite(x)) and np.all(np.isfinite(y))
+
+
+def test_ramberg_osgood_inverts_its_own_curve():
+    model = RambergOsgoodModel([300.0, 10.0], MODULUS, 0.1)
+    stress = np.array([50.0, 200.0, 350.0])
+    strain = stress / MODULUS + 0.002 * (stress / 300.0) ** 10.0
+    np.testing.assert_allclose(model.stress(strain), stress, rtol=1e-3)
+
+
+def test_base_model_is_abstract():
+    with pytest.raises(TypeError):
+        ConstitutiveModel([1.0], MODULUS, 0.1)
@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from Main.Profiler import Tracer, NULL_SPAN, TRACE_ENV_VARIABLE, DEFAULT_TRACE_FILE, tracer, traced
+
+
+def test_disabled_tracer_returns_the_shared_null_span():
+    trace = Tracer()
+    assert trace.span("stage") is NULL_SPAN
+    with trace.span("stage"):
+        pass
+    assert trace.stage_summary() == {}
+
+
+def test_spans_update_the_stage_statistics():
+    trace = Tracer()
+    trace.enable()
+    for _ in range(3):
+        with trace.span("stage"):
+            pass
+    trace.record("manual", 0, 2_000_000)
+
+    summary = trace.stage_summary()
+    assert summary["stage"]["count"] == 3
+    assert summary["manual"] == {"count": 1, "last_ms": 2.0, "mean_ms": 2.0, "max_ms": 2.0}
+
+
+def test_event_buffer_is_bounded():
+    trace = Tracer(max_events=5)
+    trace.enable()
+    for start in range(10):
+        trace.record("stage", start, start + 1)
+    assert len(trace.events) == 5
+    assert trace.stage_summary()["stage"]["count"] == 10
+
+
+def test_chrome_trace_export(tmp_path):
+    trace = Tracer()
+    assert trace.export_chrome_trace() is None
+    trace.enable(str(tmp_path / "trace.json"))
+    with trace.span("collect_data"):
+        pass
+
+    path = trace.export_chrome_trace()
+    with open(path) as trace_file:
+        events = json.load(trace_file)["traceEvents"]
+    assert [event["name"] for event in events] == ["collect_data"]
+    assert events[0]["ph"] == "X" and events[0]["dur"] >= 0
+
+
+def test_traced_records_only_while_enabled():
+    @traced("decorated")
+    def double(value):
+        return value * 2
+
+    assert double(2) == 4
+    assert "decorated" not in tracer.stage_summary()
+    tracer.enable()
+    try:
+        assert double(3) == 6
+    finally:
+        tracer.disable()
+    assert tracer.stage_summary()["decorated"]["count"] == 1
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("0", (False, None)),
+    ("off", (False, None)),
+    ("1", (True, DEFAULT_TRACE_FILE)),
+    ("trace.json", (True, "trace.json")),
+])
+def test_environment_variable(value, expected):
+    code = "from Main.Profiler import tracer; print(tracer.enabled, tracer.output_path)"
+    env = dict(os.environ, **{TRACE_ENV_VARIABLE: value})
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    assert output.split() == [str(expected[0]), str(expected[1])]
@@ -0,0 +1,118 @@
+import threading
+import numpy as np
+import pytest
+from Main.RangeIndex import RangeIndex
+from Main.TestSession import TestSession as Session
+
+
+def columns(count=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    strain = np.cumsum(rng.random(count)) * 1e-5
+    stress = 300 + 50 * np.sin(strain * 500) + rng.normal(0, 1, count)
+    return stress, strain, stress * 20, strain * 50
+
+
+def expected(stress, strain, force, displacement, first, last):
+    window = slice(first, last + 1)
+    return {
+        "Samples": last - first + 1,
+        "Work (MJ/m^3)": np.trapezoid(stress[window], strain[window]),
+        "Work (J)": np.trapezoid(force[window], displacement[window]) / 1000,
+        "Mean Stress (MPa)": stress[window].mean(),
+        "Stress Std (MPa)": stress[window].std(),
+        "Peak Stress (MPa)": stress[window].max(),
+    }
+
+
+def build(data, mode):
+    index = RangeIndex(capacity=16)
+    if mode == "append":
+        for sample in zip(*data):
+            index.append(*sample)
+        index.build_levels(data[0])
+    elif mode == "extend":
+        index.extend(*(column[:100] for column in data))
+        index.build_levels(data[0][:100])
+        for start in range(100, len(data[0]), 37):
+            index.extend(*(column[start:start + 37] for column in data))
+    else:
+        for sample in zip(*(column[:50] for column in data)):
+            index.append(*sample)
+        index.build_levels(data[0][:50])
+        for sample in zip(*(column[50:] for column in data)):
+            index.append(*sample)
+    return index
+
+
+@pytest.mark.parametrize("mode", ["append", "extend", "mixed"])
+def test_queries_match_brute_force(mode):
+    data = columns()
+    index = build(data, mode)
+    rng = np.random.default_rng(1)
+    for first, last in [(0, len(data[0]) - 1), (5, 5), (10, 11)] + [sorted(rng.integers(0, 3000, 2))
+                                                                    for _ in range(300)]:
+        results = index.query(first, last)
+        for key, value in expected(*data, first, last).items():
+            assert results[key] == pytest.approx(value, rel=1e-9, abs=1e-9), (key, first, last)
+
+
+def test_single_sample_window_has_no_spread():
+    data = columns()
+    index = build(data, "extend")
+    assert index.query(7, 7)["Stress Std (MPa)"] == 0.0
+    constant = RangeIndex()
+    constant.extend(np.full(10, 1e6 + 0.1), np.arange(10.0), np.zeros(10), np.zeros(10))
+    assert constant.query(0, 9)["Stress Std (MPa)"] == 0.0
+
+
+def test_peak_is_left_out_until_the_levels_are_built():
+    data = columns(100)
+    index = RangeIndex()
+    index.extend(*data)
+    assert index.levels is None
+    assert "Peak Stress (MPa)" not in index.query(0, 99)
+    index.build_levels(data[0])
+    assert index.query(0, 99)["Peak Stress (MPa)"] == data[0].max()
+    index.clear()
+    assert index.size == 0 and index.levels is None
+
+
+def test_strain_windows_and_summary():
+    stress, strain, force, displacement = columns()
+    index = RangeIndex()
+    index.extend(stress, strain, force, displacement)
+
+    first, last = index.strain_window(0.005, 0.01)
+    inside = np.flatnonzero((strain >= 0.005) & (strain <= 0.01))
+    assert (first, last) == (inside[0], inside[-1])
+    assert index.strain_window(10.0, 20.0) == (None, None)
+    assert index.query_strain(10.0, 20.0) is None
+
+    summary = index.summary(yield_strain=0.005)
+    assert summary["Toughness (MJ/m^3)"] == pytest.approx(np.trapezoid(stress, strain))
+    assert summary["Work to Fracture (J)"] == pytest.approx(np.trapezoid(force, displacement) / 1000)
+    yielded = strain <= 0.005
+    assert summary["Resilience (MJ/m^3)"] == pytest.approx(np.trapezoid(stress[yielded], strain[yielded]))
+    assert RangeIndex().summary() == {}
+
+
+def test_queries_during_acquisition_stay_consistent():
+    session = Session({"area": 10.0, "initial_length": 50.0}, capacity=16)
+    rng = np.random.default_rng(2)
+    force = rng.random(50000) * 1000
+    displacement = np.cumsum(rng.random(50000)) * 1e-3
+
+    def acquire():
+        for sample in zip(force, displacement):
+            session.append(*sample)
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    while thread.is_alive():
+        session.query_strain(0.0, 1e9)
+    thread.join()
+
+    stress = force / 10.0
+    index = session.range_index
+    for first, last in (sorted(rng.integers(0, 50000, 2)) for _ in range(300)):
+        assert index.query(first, last)["Peak Stress (MPa)"] == stress[first:last + 1].max()
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from Main.SharedAcquisition import SampleRing
+
+
+@pytest.fixture
+def ring():
+    created = SampleRing(capacity=8)
+    yield created
+    created.close()
+
+
+def read_all(ring, position):
+    segments, position, skipped = ring.read(position)
+    force = np.concatenate([segment[0] for segment in segments]) if segments else np.empty(0)
+    index = np.concatenate([segment[2] for segment in segments]) if segments else np.empty(0, dtype=int)
+    return force, index, position, skipped
+
+
+def test_reader_sees_samples_in_write_order(ring):
+    for value in range(5):
+        ring.write(float(value), value / 10)
+    force, index, position, skipped = read_all(ring, 0)
+    np.testing.assert_array_equal(force, [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(index, [-1] * 5)
+    assert (position, skipped) == (5, 0)
+    assert ring.read(position) == ([], 5, 0)
+
+
+def test_wrapped_samples_come_in_two_segments(ring):
+    for value in range(6):
+        ring.write(float(value), 0.0)
+    _, _, position, _ = read_all(ring, 0)
+    for value in range(6, 12):
+        ring.write(float(value), 0.0, index=value * 2)
+
+    segments, position, skipped = ring.read(position)
+    assert len(segments) == 2
+    force, index, _, _ = read_all(ring, 6)
+    np.testing.assert_array_equal(force, np.arange(6, 12))
+    np.testing.assert_array_equal(index, np.arange(12, 24, 2))
+
+
+def test_slow_reader_skips_overwritten_samples(ring):
+    for value in range(20):
+        ring.write(float(value), 0.0)
+    force, _, position, skipped = read_all(ring, 0)
+    assert skipped == 12 and position == 20
+    np.testing.assert_array_equal(force, np.arange(12, 20))
+
+
+def test_attached_ring_shares_the_columns(ring):
+    attached = SampleRing(capacity=8, name=ring.name)
+    try:
+        ring.write(3.5, 0.25)
+        force, _, position, _ = read_all(attached, 0)
+        np.testing.assert_array_equal(force, [3.5])
+        attached.close()
+        ring.reset()
+        assert ring.read(0) == ([], 0, 0)
+    finally:
+        if hasattr(attached, "counter"):
+            attached.close()
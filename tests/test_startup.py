@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+from math import pi
+import pytest
+from Main.Filters import FILTERS
+from Main.InputFrame import specimen_data
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_importing_the_app_defers_heavy_modules():
+    code = ("import sys, app; "
+            "print(' '.join(name for name in ('numpy', 'matplotlib', 'serial') if name in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0 and "tkinter" in result.stderr:
+        pytest.skip("tkinter is not available")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+def test_filter_choices_match_the_filters():
+    import app
+    assert tuple(sorted(FILTERS)) == app.FILTER_CHOICES
+
+
+def test_specimen_data():
+    rounded = specimen_data("rounded", 10.0, None, None, 50.0)
+    assert rounded["area"] == pytest.approx(pi * 25.0)
+    assert rounded["initial_length"] == 50.0
+    rectangular = specimen_data("rectangular", None, 4.0, 2.5, 30.0)
+    assert rectangular["area"] == pytest.approx(10.0)
+    assert "diameter" not in rectangular
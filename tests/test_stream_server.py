@@ -0,0 +1,82 @@
+import struct
+import time
+import numpy as np
+import pytest
+from Main.StreamServer import (HEADER, MAGIC, FRAME_SAMPLES, FRAME_PROPERTIES, SAMPLE_DTYPE, ClientState,
+                               SamplePublisher, SampleSubscriber, encode_frame)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("condition not reached")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def publisher():
+    server = SamplePublisher(port=0, interval=0.02)
+    server.reset()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_frame_layout():
+    frame = encode_frame(FRAME_PROPERTIES, b"{}")
+    assert len(frame) == HEADER.size + 2 == 11
+    assert HEADER.unpack_from(frame) == (MAGIC, FRAME_PROPERTIES, 2)
+    assert SAMPLE_DTYPE.itemsize == struct.calcsize("<Idd") == 20
+
+
+def test_client_queue_drops_the_oldest_frames():
+    client = ClientState(None, max_frames=2)
+    for frame in (b"a", b"b", b"c"):
+        client.enqueue(frame)
+    assert list(client.frames) == [b"b", b"c"]
+    assert client.dropped == 1
+
+
+def test_take_batch_updates_the_live_properties():
+    server = SamplePublisher()
+    server.reset()
+    server.publish(0, 5.0, 0.1)
+    server.publish(1, 7.0, 0.2)
+    samples, properties, changed = server.take_batch()
+    assert list(samples["index"]) == [0, 1]
+    assert properties == {"samples": 2, "peak_force": 7.0, "last_force": 7.0, "last_displacement": 0.2}
+    assert not changed
+
+    server.publish_properties({"Yield Stress (MPa)": 250.0})
+    samples, properties, changed = server.take_batch()
+    assert len(samples) == 0 and changed and properties["Yield Stress (MPa)"] == 250.0
+    assert not server.take_batch()[2]
+
+
+def test_subscriber_receives_decimated_samples_and_properties(publisher):
+    subscriber = SampleSubscriber(port=publisher.port, decimation=2, timeout=5)
+    try:
+        wait_for(lambda: any(client.decimation == 2 for client in list(publisher.clients.values())))
+        for index in range(10):
+            publisher.publish(index, float(index), index / 10)
+
+        received = []
+        while len(received) < 5:
+            frame_type, payload = subscriber.receive()
+            if frame_type == FRAME_SAMPLES:
+                received.extend(payload.tolist())
+            else:
+                assert frame_type == FRAME_PROPERTIES
+        assert [index for index, _, _ in received] == [0, 2, 4, 6, 8]
+        np.testing.assert_allclose([force for _, force, _ in received], [0.0, 2.0, 4.0, 6.0, 8.0])
+
+        # Properties published without new samples still reach the subscriber
+        publisher.publish_properties({"Yield Stress (MPa)": 250.0})
+        while True:
+            frame_type, payload = subscriber.receive()
+            if frame_type == FRAME_PROPERTIES and "Yield Stress (MPa)" in payload:
+                break
+        assert payload["samples"] == 10
+    finally:
+        subscriber.close()
@@ -0,0 +1,67 @@
+import json
+import os
+import numpy as np
+from Main.TestQueue import AnalysisWorker, FractureDetector, TestQueue as Queue
+from Main.TestSession import TestSession as Session
+
+
+class Analyser:
+    """Stand-in for GraphPlotter's property calculation, which needs a Tk root."""
+
+    session = None
+
+    def get_analysis_series(self):
+        return self.session.strain, self.session.stress
+
+    def calculate_properties(self, strain, stress):
+        if len(stress) < 2:
+            raise ValueError("too few samples")
+        return {"Ultimate Tensile Strength (MPa)": float(stress.max()), "Fracture Strain": float(strain[-1])}
+
+
+def test_fracture_is_detected_once_after_the_peak():
+    detector = FractureDetector(drop_ratio=0.3, min_force=100.0)
+    forces = [10.0, 80.0, 20.0, 150.0, 400.0, 390.0, 130.0, 110.0, 50.0, 5.0]
+    detections = [detector.add(force) for force in forces]
+    assert detections == [False] * 7 + [True, False, False]
+    assert detector.fracture_index == 7 and detector.peak_force == 400.0
+
+    detector.reset()
+    assert detector.fracture_index is None and detector.samples == 0
+
+
+def test_low_forces_never_count_as_fracture():
+    detector = FractureDetector(min_force=100.0)
+    assert not any(detector.add(force) for force in (50.0, 90.0, 1.0, 0.0))
+
+
+def test_queue_advances_through_the_batch():
+    batch = Queue()
+    batch.add({"area": 1.0})
+    batch.add({"area": 2.0})
+    batch.running = True
+    assert batch.advance() == {"area": 1.0} and batch.number == 1
+    batch.remove(0)
+    assert len(batch) == 0
+    assert batch.advance() is None
+    assert not batch.running and batch.current is None
+
+
+def test_worker_exports_specimens_and_reports_errors(tmp_path):
+    worker = AnalysisWorker(Analyser(), export_directory=str(tmp_path))
+    session = Session({"area": 10.0, "initial_length": 50.0})
+    session.extend(np.linspace(0, 5000, 50), np.linspace(0, 2, 50))
+    worker.submit(1, session)
+    worker.submit(2, Session({"area": 10.0, "initial_length": 50.0}))
+    worker.close()
+
+    done = worker.results.get_nowait()
+    assert done[:2] == ("done", 1)
+    assert done[3]["Ultimate Tensile Strength (MPa)"] == 500.0
+    assert all(os.path.exists(path) for path in done[4])
+    with open(done[4][1], encoding="utf-8") as file:
+        assert json.load(file)["specimen"] == 1
+    assert Session.load(done[4][2]).force[-1] == 5000.0
+
+    error = worker.results.get_nowait()
+    assert error[:2] == ("error", 2) and "ValueError" in error[3]
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from Main.TestSession import TestSession as Session
+
+GEOMETRY = {"shape": "rounded", "diameter": 10.0, "area": 78.54, "initial_length": 50.0}
+
+
+def filled_session(count=100, capacity=8):
+    session = Session(dict(GEOMETRY), capacity=capacity)
+    for i in range(count):
+        session.append(100.0 * i, 2.0 + 0.01 * i)
+    return session
+
+
+def test_append_grows_and_derives_stress_and_strain():
+    session = filled_session()
+    assert len(session) == 100
+    assert session.capacity >= 100
+    np.testing.assert_allclose(session.stress, session.force / GEOMETRY["area"])
+    np.testing.assert_allclose(session.strain, (session.displacement - 2.0) / GEOMETRY["initial_length"])
+    assert session.strain[0] == 0.0
+    np.testing.assert_array_equal(session.sample_index, np.arange(100))
+    assert np.all(np.diff(session.time) >= 0)
+
+
+def test_append_returns_the_derived_values():
+    session = Session(dict(GEOMETRY))
+    session.append(10.0, 1.0)
+    stress, strain = session.append(785.4, 1.5)
+    assert stress == pytest.approx(10.0)
+    assert strain == pytest.approx(0.01)
+
+
+def test_columns_are_views_and_stored_columns_cost_32_bytes():
+    session = filled_session()
+    assert np.shares_memory(session.force, session._force)
+    assert sum(getattr(session, name).itemsize for name in ("_time", "_force", "_displacement",
+                                                             "_sample_index")) == 32
+    assert session.range_index is None
+
+
+def test_extend_matches_append():
+    appended = filled_session()
+    extended = Session(dict(GEOMETRY), capacity=8)
+    extended.extend(appended.force[:40], appended.displacement[:40])
+    extended.extend(appended.force[40:], appended.displacement[40:])
+    np.testing.assert_allclose(extended.stress, appended.stress)
+    np.testing.assert_allclose(extended.strain, appended.strain)
+
+
+def test_truncate_and_clear():
+    session = filled_session()
+    session.query_strain(0, 1)
+    session.truncate(30)
+    assert len(session) == 30 and session.range_index is None
+    assert session.query_strain(-1, 1)["Samples"] == 30
+    session.clear()
+    assert len(session) == 0 and session.range_index is None and session.started_at is None
+    assert len(session.strain) == 0
+
+
+def test_range_queries_build_the_index_once():
+    session = filled_session()
+    results = session.query_strain(0.0, 1.0)
+    index = session.range_index
+    assert results["Samples"] == 100
+    assert results["Peak Stress (MPa)"] == pytest.approx(session.stress.max())
+    session.append(20000.0, 3.0)
+    assert session.range_index is index
+    assert session.query_strain(0.0, 1.0)["Peak Stress (MPa)"] == pytest.approx(20000.0 / GEOMETRY["area"])
+    assert session.range_summary()["Toughness (MJ/m^3)"] == pytest.approx(np.trapezoid(session.stress, session.strain))
+
+
+def test_copy_is_independent():
+    session = filled_session()
+    copy = session.copy()
+    session.append(1.0, 1.0)
+    assert len(copy) == 100
+    assert copy.initial_data == session.initial_data and copy.initial_data is not session.initial_data
+    assert copy.started_at == session.started_at
+    assert copy.range_index is None
+
+
+@pytest.mark.parametrize("extension", [".npz", ".ssa"])
+def test_save_and_load_round_trip(tmp_path, extension):
+    session = filled_session()
+    path = str(tmp_path / ("test" + extension))
+    session.save(path)
+    loaded = Session.load(path)
+
+    assert loaded.initial_data == session.initial_data
+    assert loaded.started_at == pytest.approx(session.started_at)
+    for column in ("time", "force", "displacement", "sample_index", "stress", "strain"):
+        np.testing.assert_allclose(getattr(loaded, column), getattr(session, column))